@@ -0,0 +1,59 @@
+"""
+Compares the per-request overhead of `FastAPITestClient` (which wraps `fastapi.testclient.TestClient`)
+and `ASGITestClient` on a trivial FastAPI app.
+Note that FastAPI runs sync (`def`) endpoints in a worker thread either way, so async endpoints are used here.
+
+Usage: python -m benchmarks.bench_asgi_client
+Requires the dev dependencies (i.e. fastapi and httpx).
+"""
+import timeit
+from typing import Any, Union
+
+from fastapi import FastAPI
+
+from rest_api_tester.client.asgi_client import ASGITestClient
+from rest_api_tester.client.base_client import BaseTestClient
+from tests.api.fastapi.fastapi_test_client import FastAPITestClient
+
+NUMBER = 1000
+
+
+def main() -> None:
+    app = FastAPI()
+
+    @app.get('/items/{item_id}')
+    async def get_item(item_id: int) -> Any:
+        return {'id': item_id, 'name': f'item{item_id}'}
+
+    @app.post('/items')
+    async def create_item(item: Any) -> Any:
+        return item
+
+    asgi_client = ASGITestClient(app=app)
+    clients = (
+        ('FastAPITestClient', FastAPITestClient(app=app)),
+        ('ASGITestClient', asgi_client)
+    )
+
+    def get(client: BaseTestClient) -> None:
+        client.get(url='/items/1', timeout=10, allow_redirects=False)
+
+    def post(client: BaseTestClient) -> None:
+        client.post(
+            url='/items', data='{"name": "item"}', timeout=10,
+            allow_redirects=False, headers={'content-type': 'application/json'})
+
+    for name, request in (('GET', get), ('POST', post)):
+        print(f'{NUMBER} {name} requests')
+        baseline_seconds: Union[float, None] = None
+        for client_name, client in clients:
+            seconds = min(timeit.repeat(lambda: request(client), number=NUMBER, repeat=3)) / NUMBER
+            speedup = f' ({baseline_seconds / seconds:.1f}x faster)' if baseline_seconds else ''
+            print(f'  {client_name}: {seconds * 1000 * 1000:.0f} us/request{speedup}')
+            baseline_seconds = baseline_seconds or seconds
+
+    asgi_client.close()
+
+
+if __name__ == '__main__':
+    main()
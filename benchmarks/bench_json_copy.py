@@ -0,0 +1,46 @@
+"""
+Compares the copy modes of `json_update` and `json_update_many` when applying a few modifiers to a large document
+
+Usage: python -m benchmarks.bench_json_copy
+"""
+import timeit
+from typing import Any, Dict
+
+from rest_api_tester import utils
+
+NUM_ITEMS = 5000
+NUMBER = 5
+
+
+def main() -> None:
+    document = {
+        'items': [{'id': i, 'name': f'item{i}', 'tags': [{'name': 'a'}, {'name': 'b'}]} for i in range(NUM_ITEMS)],
+        'meta': {'page': 1, 'total': NUM_ITEMS}
+    }
+    modifiers: Dict[utils.JSONPath, Any] = {
+        utils.compile_path(f'items.[{i}].name'): f'new{i}' for i in range(0, NUM_ITEMS, NUM_ITEMS // 10)
+    }
+    modifiers[utils.compile_path('meta.page')] = 2
+
+    def apply(copy: str) -> None:
+        j = document
+        for path, value in modifiers.items():
+            j = utils.json_update(j=j, path=path, value=value, copy=copy)
+
+    print(f'{len(modifiers)} modifiers on a document with {NUM_ITEMS} items')
+    deep_seconds = min(timeit.repeat(lambda: apply(copy=utils.COPY_DEEP), number=NUMBER, repeat=3)) / NUMBER
+    print(f'  {utils.COPY_DEEP}: {deep_seconds * 1000:.2f} ms')
+    for copy in (utils.COPY_PATH, utils.COPY_NONE):
+        seconds = min(timeit.repeat(lambda: apply(copy=copy), number=NUMBER, repeat=3)) / NUMBER
+        print(f'  {copy}: {seconds * 1000:.2f} ms ({deep_seconds / seconds:.0f}x faster)')
+
+    print(f'{len(modifiers)} modifiers on a document with {NUM_ITEMS} items with json_update_many')
+    for copy in (utils.COPY_DEEP, utils.COPY_PATH, utils.COPY_NONE):
+        seconds = min(timeit.repeat(
+            lambda: utils.json_update_many(j=document, updates=modifiers, copy=copy), number=NUMBER, repeat=3
+        )) / NUMBER
+        print(f'  {copy}: {seconds * 1000:.2f} ms ({deep_seconds / seconds:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares `TestCase.assert_json_equal` (used by `default_verifier`) against `assertDictEqual` with `maxDiff = None`
+for large JSON responses with a few mismatches
+
+Usage: python -m benchmarks.bench_json_diff
+"""
+import json
+import time
+import timeit
+import unittest
+from typing import Any, Callable, Dict
+
+from rest_api_tester.test import TestCase
+
+NUM_ITEMS = 5000
+NUMBER = 5
+
+
+def _build_document(num_items: int) -> Dict[str, Any]:
+    return {
+        'items': [
+            {'id': i, 'name': f'item{i}', 'price': i * 1.5, 'tags': [{'name': 'a'}, {'name': 'b'}]}
+            for i in range(num_items)
+        ]
+    }
+
+
+def _time_failure(assert_equal: Callable[[Any, Any], None], expected: Any, actual: Any) -> float:
+    start = time.perf_counter()
+    try:
+        assert_equal(expected, actual)
+    except AssertionError:
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    test_case = TestCase()
+    unittest_case = unittest.TestCase()
+    unittest_case.maxDiff = None
+
+    expected = _build_document(num_items=NUM_ITEMS)
+    actual = _build_document(num_items=NUM_ITEMS)
+    size = len(json.dumps(expected))
+
+    print(f'Equal documents with {NUM_ITEMS} items ({size / 1024:.0f} KiB)')
+    for name, assert_equal in (('assertDictEqual', unittest_case.assertDictEqual),
+                               ('assert_json_equal', test_case.assert_json_equal)):
+        seconds = min(timeit.repeat(lambda: assert_equal(expected, actual), number=NUMBER, repeat=3)) / NUMBER
+        print(f'  {name}: {seconds * 1000:.2f} ms')
+
+    for i in range(0, NUM_ITEMS, NUM_ITEMS // 3):
+        actual['items'][i]['price'] = -1
+    print(f'Documents with {NUM_ITEMS} items ({size / 1024:.0f} KiB) and 3 mismatches')
+    for name, assert_equal in (('assertDictEqual', unittest_case.assertDictEqual),
+                               ('assert_json_equal', test_case.assert_json_equal)):
+        seconds = _time_failure(assert_equal=assert_equal, expected=expected, actual=actual)
+        print(f'  {name}: {seconds * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares applying JSON path strings that are parsed on every call against paths compiled once up front
+
+Usage: python -m benchmarks.bench_json_path
+"""
+import timeit
+from typing import Any, Dict
+
+from rest_api_tester import utils
+
+NUM_ITEMS = 1000
+NUM_MODIFIERS = 1000
+NUMBER = 20
+
+
+def main() -> None:
+    document = {
+        'user': {'name': 'alex', 'address': {'city': 'chicago', 'zip': '60601'}},
+        'items': [
+            {'id': i, 'name': f'item{i}', 'price': {'amount': i, 'currency': 'USD'}, 'tags': [{'name': 'a'}]}
+            for i in range(NUM_ITEMS)
+        ]
+    }
+    modifiers: Dict[str, Any] = {}
+    for i in range(NUM_MODIFIERS // 4):
+        modifiers[f'items.[{i}].name'] = f'new{i}'
+        modifiers[f'items.[{i}].price.amount'] = i + 1
+        modifiers[f'items.[{i}].tags.[0].name'] = 'b'
+        modifiers[f'user.extra{i}'] = i
+    compiled_modifiers = {utils.compile_path(path): value for path, value in modifiers.items()}
+
+    # Updates are applied in place, so the timings aren't dominated by copying the document
+    def apply_parsed_every_call() -> None:
+        for path, value in modifiers.items():
+            utils.JSONPath(path).update(j=document, value=value, copy=utils.COPY_NONE)
+
+    def apply_compiled() -> None:
+        for path, value in compiled_modifiers.items():
+            path.update(j=document, value=value, copy=utils.COPY_NONE)
+
+    print(f'{len(modifiers)} modifiers on a document with {NUM_ITEMS} items (in place)')
+    parsed_seconds = min(timeit.repeat(apply_parsed_every_call, number=NUMBER, repeat=3)) / NUMBER
+    compiled_seconds = min(timeit.repeat(apply_compiled, number=NUMBER, repeat=3)) / NUMBER
+    print(f'  parsed every call: {parsed_seconds * 1000:.2f} ms')
+    print(f'  compiled:          {compiled_seconds * 1000:.2f} ms ({parsed_seconds / compiled_seconds:.1f}x faster)')
+
+    print(f'Looking up {len(modifiers)} paths')
+    parsed_seconds = min(timeit.repeat(
+        lambda: [utils.JSONPath(path) for path in modifiers], number=NUMBER, repeat=3)) / NUMBER
+    cached_seconds = min(timeit.repeat(
+        lambda: [utils.compile_path(path) for path in modifiers], number=NUMBER, repeat=3)) / NUMBER
+    print(f'  JSONPath(path):     {parsed_seconds * 1000:.2f} ms')
+    print(f'  compile_path(path): {cached_seconds * 1000:.2f} ms ({parsed_seconds / cached_seconds:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
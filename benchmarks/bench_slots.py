@@ -0,0 +1,71 @@
+"""
+Compares the memory used by a suite's worth of slotted `TestResult`s (with their `TestData` and `ResponseData`)
+against equivalent dataclasses without `__slots__`.
+
+Usage: python -m benchmarks.bench_slots
+"""
+import dataclasses
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.test import TestData, TestResult
+
+NUMBER = 50000
+
+
+def _without_slots(cls: Any) -> Any:
+    fields = []
+    for f in dataclasses.fields(cls):
+        defaults: Dict[str, Any] = {'default': f.default, 'default_factory': f.default_factory}
+        fields.append((f.name, f.type, dataclasses.field(**defaults)))
+    return dataclasses.make_dataclass(f'Dict{cls.__name__}', fields)
+
+
+def _build_results(test_data_cls: Any, response_data_cls: Any, test_result_cls: Any) -> List[Any]:
+    results = []
+    for i in range(NUMBER):
+        test_data = test_data_cls(
+            name=f'test_{i}',
+            url=f'/items/{i}',
+            method='GET',
+            allow_redirects=True,
+            headers={},
+            cookies={},
+            request_data=None,
+            expected_status=200,
+            expected_response='{"id": 1}',
+            expected_headers=None,
+            description=None,
+            file_path='test.json'
+        )
+        response = response_data_cls(text='{"id": 1}', headers={}, status_code=200)
+        results.append(test_result_cls(response=response, test_data=test_data, timings={}))
+    return results
+
+
+def _measure(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    tracemalloc.start()
+    results = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, results
+
+
+def main() -> None:
+    variants: Dict[str, Tuple[Any, Any, Any]] = {
+        'Without __slots__': (_without_slots(TestData), _without_slots(ResponseData), _without_slots(TestResult)),
+        'With __slots__': (TestData, ResponseData, TestResult)
+    }
+
+    print(f'{NUMBER} test results')
+    baseline_bytes = 0
+    for name, classes in variants.items():
+        num_bytes, _ = _measure(lambda: _build_results(*classes))
+        savings = f' ({1 - num_bytes / baseline_bytes:.0%} less)' if baseline_bytes else ''
+        print(f'  {name}: {num_bytes / 1024 / 1024:.1f} MiB, {num_bytes / NUMBER:.0f} bytes/result{savings}')
+        baseline_bytes = baseline_bytes or num_bytes
+
+
+if __name__ == '__main__':
+    main()
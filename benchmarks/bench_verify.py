@@ -0,0 +1,65 @@
+"""
+Measures `TestCase.verify_test_result` for a large passing JSON response,
+against the same call with the failure message built eagerly for every test (as it used to be)
+
+Usage: python -m benchmarks.bench_verify
+"""
+import json
+import timeit
+from typing import Callable
+from unittest import mock
+
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester import test
+from rest_api_tester.test import TestCase, TestData, TestResult
+
+NUM_ITEMS = 5000
+NUMBER = 5
+
+
+def _build_result(text: str) -> TestResult:
+    test_data = TestData(
+        name='test_get_items',
+        url='/items',
+        method='GET',
+        allow_redirects=True,
+        headers={},
+        cookies={},
+        request_data=None,
+        expected_status=200,
+        expected_response=text,
+        expected_headers=None,
+        description=None,
+        file_path='test.json'
+    )
+    response = ResponseData.from_content(
+        content=text.encode('utf-8'), headers={'content-type': 'application/json'}, status_code=200)
+    return TestResult(response=response, test_data=test_data, timings={})
+
+
+def main() -> None:
+    text = json.dumps({
+        'items': [{'id': i, 'name': f'item{i}', 'tags': [{'name': 'a'}, {'name': 'b'}]} for i in range(NUM_ITEMS)]
+    })
+    test_case = TestCase()
+
+    def verify() -> None:
+        test_case.verify_test_result(result=_build_result(text=text))
+
+    def eager_message(build: Callable[[], str]) -> str:
+        return build()
+
+    def verify_eager_message() -> None:
+        # The message used to be built before the status was checked
+        with mock.patch.object(test, '_LazyMessage', eager_message):
+            verify()
+
+    print(f'Passing test with a {len(text) / 1024:.0f} KiB response ({NUM_ITEMS} items)')
+    eager_seconds = min(timeit.repeat(verify_eager_message, number=NUMBER, repeat=3)) / NUMBER
+    lazy_seconds = min(timeit.repeat(verify, number=NUMBER, repeat=3)) / NUMBER
+    print(f'  Eager failure message: {eager_seconds * 1000:.2f} ms')
+    print(f'  Lazy failure message:  {lazy_seconds * 1000:.2f} ms ({eager_seconds / lazy_seconds:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,15 @@
 # flake8: noqa
+from rest_api_tester.baseline import BaselineStore, Regression
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
 from rest_api_tester.client.base_client import BaseTestClient
 from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.json_diff import JSONMismatch, json_diff
 from rest_api_tester.parser.base_parser import BaseParser
 from rest_api_tester.parser.json_parser import JSONParser
-from rest_api_tester.runner import TestCaseRunner
+from rest_api_tester.parser.jsonl_parser import JSONLParser, convert_json_to_jsonl
+from rest_api_tester.parser.scenario_cache import SCENARIO_CACHE, ScenarioFileCache
+from rest_api_tester.parser.streaming_json_parser import StreamingJSONParser
+from rest_api_tester.process_runner import ProcessPoolTestCaseRunner, ProcessTestResult
+from rest_api_tester.runner import AsyncTestCaseRunner, RunSpec, TestCaseRunner
 from rest_api_tester.test import TestCase, TestData, TestResult, UpdateScenariosOnFailOptions
-from rest_api_tester.utils import json_remove, json_update
+from rest_api_tester.utils import COPY_DEEP, COPY_NONE, COPY_PATH, JSONPath, compile_path, json_remove, json_remove_many, json_update, json_update_many
@@ -0,0 +1,227 @@
+import os
+import json
+import atexit
+import statistics
+import threading
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Union
+
+from rest_api_tester.timing import PHASE_REQUEST
+
+if TYPE_CHECKING:
+    from rest_api_tester.test import TestData, TestResult
+
+DEFAULT_BASELINE_FILE_NAME = '.rest_api_tester_baselines.json'
+
+# Tracked metrics
+METRIC_LATENCY_MS = 'latency_ms'
+METRIC_RESPONSE_BYTES = 'response_bytes'
+
+# Scales the median absolute deviation to estimate the standard deviation of normally distributed samples
+_MAD_SCALE = 1.4826
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class Regression:
+
+    test_key: str
+    metric: str
+    value: float
+    # Median of the baseline samples
+    baseline: float
+    # Smallest value that would have been flagged
+    limit: float
+
+    def __str__(self) -> str:
+        ratio = f'{self.value / self.baseline:.2f}x' if self.baseline else 'n/a'
+        return (f'{self.test_key}: {self.metric} of {self.value:.1f} regressed from a baseline of '
+                f'{self.baseline:.1f} ({ratio}, limit {self.limit:.1f})')
+
+
+class BaselineStore:
+
+    def __init__(
+        self,
+        file_path: str,
+        max_samples: int = 20,
+        min_samples: int = 5,
+        threshold: float = 0.5,
+        mad_multiplier: float = 3.0,
+        record_regressions: bool = False,
+        autosave: bool = False,
+        save_on_exit: bool = True
+    ):
+        """
+        Stores recent latency and response size samples for each test in a JSON file,
+        and flags tests whose latest values regressed from their baseline
+
+        A value is a regression when it is more than `threshold` (as a fraction) above the median of the
+        baseline samples, and also more than `mad_multiplier` robust standard deviations (from the median
+        absolute deviation) above it. The second check keeps naturally noisy tests from being flagged.
+
+        Samples are kept in memory and written once, when the interpreter exits (see `save_on_exit`),
+        when `save()` is called or when the store is used as a context manager.
+        Share one store between tests, since each store only saves the samples it has seen.
+        Note that the file is not locked, so use a separate file for each process that records samples.
+
+        :param file_path:
+            JSON file to store samples in. It is created if it doesn't exist.
+        :param max_samples:
+            Number of recent samples kept per test and metric
+        :param min_samples:
+            Tests with fewer samples than this are never flagged
+        :param threshold:
+            E.g. 0.5 flags values more than 50% above the baseline
+        :param mad_multiplier:
+            Number of robust standard deviations above the baseline a value must be to be flagged
+        :param record_regressions:
+            If True, values flagged as regressions are added to the baseline too, so a lasting slowdown
+            eventually becomes the new baseline. By default, they are left out until `reset()` is called.
+        :param autosave:
+            If True, the file is saved every time samples change. This rewrites the whole file after every test.
+        :param save_on_exit:
+            If True, unsaved samples are saved when the interpreter exits
+        """
+
+        self.file_path = file_path
+        self.max_samples = max_samples
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.mad_multiplier = mad_multiplier
+        self.record_regressions = record_regressions
+        self.autosave = autosave
+        self._samples: Dict[str, Dict[str, List[float]]] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+        if os.path.exists(file_path):
+            with open(file_path, 'r') as f:
+                self._samples = json.loads(f.read()).get('tests', {})
+
+        if save_on_exit:
+            atexit.register(self._save_changes)
+
+    def __enter__(self) -> 'BaselineStore':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None]
+    ) -> None:
+        self._save_changes()
+
+    @classmethod
+    def for_scenarios_dir(cls, path_to_scenarios_dir: str, **kwargs: Any) -> 'BaselineStore':
+        """
+        Returns a store whose file sits next to (not inside) the scenarios directory.
+        Other params are passed to the constructor.
+        """
+
+        parent_dir = os.path.dirname(os.path.abspath(path_to_scenarios_dir))
+        return cls(file_path=os.path.join(parent_dir, DEFAULT_BASELINE_FILE_NAME), **kwargs)
+
+    def check_and_record(self, result: 'TestResult', response_bytes: Union[int, None] = None) -> List[Regression]:
+        """
+        Compares a test result to its baseline, then adds it to the baseline
+
+        :param result:
+            The test case result returned from `TestCaseRunner.run()`
+        :param response_bytes:
+            Response size, if it was measured before the response was modified.
+            Defaults to the current size of the response.
+        :return:
+            The regressions, if any
+        """
+
+        values = self._get_values(result=result, response_bytes=response_bytes)
+        key = self.get_test_key(test_data=result.test_data)
+
+        with self._lock:
+            regressions = []
+            test_samples = self._samples.setdefault(key, {})
+            for metric, value in values.items():
+                samples = test_samples.setdefault(metric, [])
+                regression = self._check(test_key=key, metric=metric, value=value, samples=samples)
+                if regression is not None:
+                    regressions.append(regression)
+                    if not self.record_regressions:
+                        continue
+                samples.append(value)
+                del samples[:-self.max_samples]
+                self._changed = True
+
+            if self.autosave and self._changed:
+                self._save()
+
+        return regressions
+
+    def get_samples(self, test_data: 'TestData', metric: str) -> List[float]:
+        return list(self._samples.get(self.get_test_key(test_data=test_data), {}).get(metric, []))
+
+    def get_test_key(self, test_data: 'TestData') -> str:
+        """
+        Returns "<scenario file path relative to the store>::<test name>", so keys don't depend on the machine
+        """
+
+        store_dir = os.path.dirname(os.path.abspath(self.file_path))
+        file_path = os.path.relpath(os.path.abspath(test_data.file_path), store_dir)
+        return f'{file_path.replace(os.sep, "/")}::{test_data.name}'
+
+    def reset(self, test_data: Union['TestData', None] = None) -> None:
+        """
+        Removes the samples of a test, e.g. after an expected slowdown.
+        If no test is given, all samples are removed.
+        """
+
+        with self._lock:
+            if test_data is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(self.get_test_key(test_data=test_data), None)
+            self._changed = True
+
+            if self.autosave:
+                self._save()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save()
+
+    def _save_changes(self) -> None:
+        with self._lock:
+            if self._changed:
+                self._save()
+
+    def _check(self, test_key: str, metric: str, value: float, samples: List[float]) -> Union[Regression, None]:
+        if len(samples) < max(1, self.min_samples):
+            return None
+
+        baseline = statistics.median(samples)
+        mad = statistics.median(abs(sample - baseline) for sample in samples)
+        limit = max(baseline * (1 + self.threshold), baseline + self.mad_multiplier * _MAD_SCALE * mad)
+        if value <= limit:
+            return None
+
+        return Regression(test_key=test_key, metric=metric, value=value, baseline=baseline, limit=limit)
+
+    def _save(self) -> None:
+        # Write to a temp file first, so an interrupted run can't corrupt the baselines
+        temp_file_path = f'{self.file_path}.tmp'
+        with open(temp_file_path, 'w+') as f:
+            f.write(json.dumps({'version': _FORMAT_VERSION, 'tests': self._samples}, indent=4, sort_keys=True) + '\n')
+        os.replace(temp_file_path, self.file_path)
+        self._changed = False
+
+    @staticmethod
+    def _get_values(result: 'TestResult', response_bytes: Union[int, None]) -> Dict[str, float]:
+        values: Dict[str, float] = {
+            METRIC_RESPONSE_BYTES: response_bytes if response_bytes is not None else result.response.size
+        }
+        request_seconds = result.timings.get(PHASE_REQUEST)
+        if request_seconds is not None:
+            values[METRIC_LATENCY_MS] = request_seconds * 1000
+        return values
@@ -0,0 +1,177 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Tuple, TypeVar, Union
+from urllib.parse import unquote, urljoin, urlsplit
+
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.client.utils import (
+    DEFAULT_PORTS, MAX_REDIRECTS, add_response_header, get_cookie_header, get_redirect
+)
+
+ASGIMessage = MutableMapping[str, Any]
+ASGIReceive = Callable[[], Awaitable[ASGIMessage]]
+ASGISend = Callable[[ASGIMessage], Awaitable[None]]
+ASGIApp = Callable[[MutableMapping[str, Any], ASGIReceive, ASGISend], Awaitable[None]]
+
+_T = TypeVar('_T')
+
+
+class AsyncASGITestClient(AsyncBaseTestClient):
+
+    def __init__(self, app: ASGIApp, base_url: str = 'http://testserver', root_path: str = ''):
+        """
+        Test client that calls an ASGI app (e.g. FastAPI or Starlette) directly in the current event loop,
+        without any network or thread hops
+
+        Like `TestClient`, exceptions raised by your app are raised from the request.
+        Note that lifespan events are not sent to the app.
+
+        :param app:
+            ASGI 3 application
+        :param base_url:
+            Used to build the scheme, host and port of each request
+        :param root_path:
+            ASGI `root_path`, for apps mounted under a sub-path
+        """
+
+        self.app = app
+        self.base_url = base_url
+        self.root_path = root_path
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        method = method.upper()
+        url = urljoin(self.base_url, url)
+        body = data or b''
+        header_list = [(str(key).lower().encode('latin-1'), str(value).encode('latin-1'))
+                       for key, value in (headers or {}).items()]
+        if cookies:
+            header_list.append((b'cookie', get_cookie_header(cookies=cookies).encode('latin-1')))
+
+        for _ in range(MAX_REDIRECTS + 1):
+            status_code, response_headers, content = await asyncio.wait_for(
+                self._call_app(method=method, url=url, body=body, headers=header_list), timeout=timeout)
+            redirect = get_redirect(url=url, method=method, status_code=status_code, headers=response_headers)
+            if not allow_redirects or redirect is None:
+                break
+
+            url, redirect_method = redirect
+            if redirect_method != method:
+                method = redirect_method
+                body = b''
+                header_list = [(key, value) for key, value in header_list
+                               if key not in (b'content-type', b'content-length')]
+        else:
+            raise Exception(f'Exceeded {MAX_REDIRECTS} redirects')
+
+        return ResponseData.from_content(content=content, headers=response_headers, status_code=status_code)
+
+    async def _call_app(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: List[Tuple[bytes, bytes]]
+    ) -> Tuple[int, Dict[str, Any], bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        host = parts.hostname or 'testserver'
+        port = parts.port or DEFAULT_PORTS.get(scheme, 80)
+        host_header = parts.netloc or host
+
+        request_headers = [(b'host', host_header.encode('latin-1'))] + [
+            (key, value) for key, value in headers if key != b'host'
+        ]
+        if body:
+            request_headers.append((b'content-length', str(len(body)).encode('latin-1')))
+
+        scope: Dict[str, Any] = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': scheme,
+            'path': unquote(parts.path) or '/',
+            'raw_path': (parts.path or '/').encode('latin-1'),
+            'query_string': parts.query.encode('latin-1'),
+            'root_path': self.root_path,
+            'headers': request_headers,
+            'client': ('127.0.0.1', 50000),
+            'server': (host, port)
+        }
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        status_code = 500
+        response_headers: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def receive() -> ASGIMessage:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await response_complete.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message: ASGIMessage) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                for key, value in message.get('headers', []):
+                    add_response_header(
+                        headers=response_headers, name=key.decode('latin-1'), value=value.decode('latin-1'))
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+                if not message.get('more_body', False):
+                    response_complete.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_complete.set()
+
+        return status_code, response_headers, b''.join(chunks)
+
+
+class ASGITestClient(BaseTestClient):
+
+    def __init__(self, app: ASGIApp, base_url: str = 'http://testserver', root_path: str = ''):
+        """
+        Synchronous version of `AsyncASGITestClient`.
+        Requests run on an event loop owned by this client, in the calling thread,
+        so this can't be used from inside a running event loop.
+        See `AsyncASGITestClient` for details on each param.
+        """
+
+        self.async_client = AsyncASGITestClient(app=app, base_url=base_url, root_path=root_path)
+        self.loop = asyncio.new_event_loop()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._run(self.async_client.request(
+            method=method, url=url, timeout=timeout, allow_redirects=allow_redirects,
+            data=data, headers=headers, cookies=cookies))
+
+    def close(self) -> None:
+        self.loop.close()
+
+    def _run(self, coroutine: Awaitable[_T]) -> _T:
+        return self.loop.run_until_complete(coroutine)
@@ -0,0 +1,154 @@
+from typing import Any, Union, Dict
+from abc import ABC
+
+from rest_api_tester.client.base_client import METHODS_WITH_DATA, get_hook_name
+from rest_api_tester.client.response_data import ResponseData
+
+
+class AsyncBaseTestClient(ABC):
+    """
+    Async version of `BaseTestClient`, for use with `rest_api_tester.runner.AsyncTestCaseRunner`
+
+    Subclasses can either implement `request` directly or the per-method hooks (`get`, `post`, etc.).
+    See `BaseTestClient` for details.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        """
+        Makes a request and returns the response
+        See `BaseTestClient.request` for details on each param.
+        """
+
+        hook_name = get_hook_name(client=self, base=AsyncBaseTestClient, method=method)
+        kwargs: Dict[str, Any] = {
+            'url': url,
+            'timeout': timeout,
+            'allow_redirects': allow_redirects,
+            'headers': headers,
+            'cookies': cookies
+        }
+        if method.upper() in METHODS_WITH_DATA:
+            kwargs['data'] = data.decode('utf-8') if data is not None else None
+
+        response: ResponseData = await getattr(self, hook_name)(**kwargs)
+        return response
+
+    async def get(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='GET', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def post(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='POST', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def put(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='PUT', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def patch(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='PATCH', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def delete(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='DELETE', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def head(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='HEAD', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def options(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._request_from_hook(
+            method='OPTIONS', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    async def _request_from_hook(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, None],
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None],
+        cookies: Union[Dict[str, Any], None]
+    ) -> ResponseData:
+        # The default `request` dispatches to the per-method hooks, so one of them must be overridden
+        if type(self).request is AsyncBaseTestClient.request:
+            raise NotImplementedError(f'{type(self).__name__} must implement `request` or `{method.lower()}`')
+
+        return await self.request(
+            method=method,
+            url=url,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            data=data.encode('utf-8') if data is not None else None,
+            headers=headers,
+            cookies=cookies
+        )
@@ -1,12 +1,76 @@
 from typing import Any, Union, Dict
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from rest_api_tester.client.response_data import ResponseData
 
+# HTTP method => name of the per-method client hook that handles it
+METHOD_HOOKS = {
+    'GET': 'get',
+    'POST': 'post',
+    'PUT': 'put',
+    'PATCH': 'patch',
+    'DELETE': 'delete',
+    'HEAD': 'head',
+    'OPTIONS': 'options'
+}
+
+# Per-method hooks that take a request body
+METHODS_WITH_DATA = ('POST', 'PUT', 'PATCH')
+
 
 class BaseTestClient(ABC):
+    """
+    Makes requests to your server for `rest_api_tester.runner.TestCaseRunner`
+
+    The runner always calls `request`. Subclasses can either implement `request` directly,
+    which handles every HTTP method in one place, or implement the per-method hooks (`get`, `post`, etc.)
+    that the default `request` dispatches to.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        """
+        Makes a request and returns the response
+
+        :param method:
+            HTTP method (e.g. "GET")
+        :param url:
+            Request URL
+        :param timeout:
+            In seconds
+        :param allow_redirects:
+            Whether redirects should be followed
+        :param data:
+            Raw request body.
+            It is decoded as UTF-8 for the per-method hooks that take a body (i.e. `post`, `put` and `patch`).
+        :param headers:
+            Request headers
+        :param cookies:
+            Request cookies
+        """
+
+        hook_name = get_hook_name(client=self, base=BaseTestClient, method=method)
+        kwargs: Dict[str, Any] = {
+            'url': url,
+            'timeout': timeout,
+            'allow_redirects': allow_redirects,
+            'headers': headers,
+            'cookies': cookies
+        }
+        if method.upper() in METHODS_WITH_DATA:
+            kwargs['data'] = data.decode('utf-8') if data is not None else None
+
+        response: ResponseData = getattr(self, hook_name)(**kwargs)
+        return response
 
-    @abstractmethod
     def get(
         self,
         url: str,
@@ -15,9 +79,10 @@ class BaseTestClient(ABC):
         headers: Union[Dict[str, Any], None] = None,
         cookies: Union[Dict[str, Any], None] = None
     ) -> ResponseData:
-        ...
+        return self._request_from_hook(
+            method='GET', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
 
-    @abstractmethod
     def post(
         self,
         url: str,
@@ -27,9 +92,10 @@ class BaseTestClient(ABC):
         headers: Union[Dict[str, Any], None] = None,
         cookies: Union[Dict[str, Any], None] = None
     ) -> ResponseData:
-        ...
+        return self._request_from_hook(
+            method='POST', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
 
-    @abstractmethod
     def put(
         self,
         url: str,
@@ -39,9 +105,10 @@ class BaseTestClient(ABC):
         headers: Union[Dict[str, Any], None] = None,
         cookies: Union[Dict[str, Any], None] = None
     ) -> ResponseData:
-        ...
+        return self._request_from_hook(
+            method='PUT', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
 
-    @abstractmethod
     def patch(
         self,
         url: str,
@@ -51,9 +118,10 @@ class BaseTestClient(ABC):
         headers: Union[Dict[str, Any], None] = None,
         cookies: Union[Dict[str, Any], None] = None
     ) -> ResponseData:
-        ...
+        return self._request_from_hook(
+            method='PATCH', url=url, data=data, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
 
-    @abstractmethod
     def delete(
         self,
         url: str,
@@ -62,4 +130,69 @@ class BaseTestClient(ABC):
         headers: Union[Dict[str, Any], None] = None,
         cookies: Union[Dict[str, Any], None] = None
     ) -> ResponseData:
-        ...
+        return self._request_from_hook(
+            method='DELETE', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    def head(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._request_from_hook(
+            method='HEAD', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    def options(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._request_from_hook(
+            method='OPTIONS', url=url, data=None, timeout=timeout,
+            allow_redirects=allow_redirects, headers=headers, cookies=cookies)
+
+    def _request_from_hook(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, None],
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None],
+        cookies: Union[Dict[str, Any], None]
+    ) -> ResponseData:
+        # The default `request` dispatches to the per-method hooks, so one of them must be overridden
+        if type(self).request is BaseTestClient.request:
+            raise NotImplementedError(f'{type(self).__name__} must implement `request` or `{method.lower()}`')
+
+        return self.request(
+            method=method,
+            url=url,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            data=data.encode('utf-8') if data is not None else None,
+            headers=headers,
+            cookies=cookies
+        )
+
+
+def get_hook_name(client: Any, base: type, method: str) -> str:
+    """
+    Returns the name of the per-method hook for `method`, which must be overridden by the client
+    """
+
+    hook_name = METHOD_HOOKS.get(method.upper())
+    if hook_name is None:
+        raise ValueError('Unsupported HTTP method')
+
+    if getattr(type(client), hook_name) is getattr(base, hook_name):
+        raise NotImplementedError(f'{type(client).__name__} must implement `request` or `{hook_name}`')
+
+    return hook_name
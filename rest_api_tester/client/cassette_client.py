@@ -0,0 +1,296 @@
+import os
+import json
+import base64
+import hashlib
+import threading
+from typing import Any, Dict, List, Sequence, Union
+
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.client.utils import get_cookie_header
+
+
+class UnrecordedRequestError(Exception):
+    pass
+
+
+class Cassette:
+
+    def __init__(self, file_path: str, match_headers: Union[Sequence[str], None] = None):
+        """
+        JSON Lines file of recorded responses, each keyed by its request's method, URL, headers and body hash
+
+        Requests with the same key are replayed in the order they were recorded,
+        and the last response is repeated once they run out.
+
+        :param file_path:
+            Cassette file
+        :param match_headers:
+            Names of the request headers (and "cookie") that are part of the key.
+            Defaults to all of them. Leave out headers that change between runs, like auth tokens.
+        """
+
+        self.file_path = file_path
+        self.match_headers = None if match_headers is None else {header.lower() for header in match_headers}
+        self._responses: Dict[str, List[ResponseData]] = {}
+        self._num_replays: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        responses: Dict[str, List[ResponseData]] = {}
+        with open(self.file_path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                content = base64.b64decode(entry['content']) if 'content' in entry else entry['text'].encode('utf-8')
+                responses.setdefault(entry['key'], []).append(ResponseData.from_content(
+                    content=content,
+                    headers=entry['headers'],
+                    status_code=entry['status_code'],
+                    extra=entry.get('extra')
+                ))
+
+        with self._lock:
+            self._responses = responses
+            self._num_replays.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            with open(self.file_path, 'w+'):
+                pass
+            self._responses.clear()
+            self._num_replays.clear()
+
+    def get_key(
+        self,
+        method: str,
+        url: str,
+        data: Union[bytes, None],
+        headers: Union[Dict[str, Any], None],
+        cookies: Union[Dict[str, Any], None]
+    ) -> str:
+        request_headers = {str(key).lower(): str(value) for key, value in (headers or {}).items()}
+        if cookies:
+            request_headers['cookie'] = get_cookie_header(cookies=cookies)
+        if self.match_headers is not None:
+            request_headers = {key: value for key, value in request_headers.items() if key in self.match_headers}
+
+        body_hash = hashlib.sha256(data).hexdigest() if data else ''
+        return json.dumps([method.upper(), url, sorted(request_headers.items()), body_hash], separators=(',', ':'))
+
+    def replay(self, key: str) -> Union[ResponseData, None]:
+        """
+        Returns a copy of the next recorded response for a request, or None if it wasn't recorded
+        """
+
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                return None
+
+            num_replays = self._num_replays.get(key, 0)
+            self._num_replays[key] = num_replays + 1
+            response = responses[min(num_replays, len(responses) - 1)]
+
+        return _copy_response(response=response)
+
+    def record(self, key: str, response: ResponseData) -> None:
+        """
+        Appends a response to the cassette file.
+        It isn't kept in memory, so recording a large suite doesn't hold every body at once. Call `load()` to replay it.
+        """
+
+        entry: Dict[str, Any] = {
+            'key': key,
+            'status_code': response.status_code,
+            'headers': response.headers
+        }
+        try:
+            entry['text'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            # Binary bodies (or text in other charsets) are stored as base64
+            entry['content'] = base64.b64encode(response.content).decode('ascii')
+        if response.extra is not None:
+            entry['extra'] = response.extra
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+
+        with self._lock:
+            with open(self.file_path, 'a') as f:
+                f.write(line)
+
+
+class RecordingTestClient(BaseTestClient):
+
+    def __init__(
+        self,
+        client: BaseTestClient,
+        cassette_path: str,
+        match_headers: Union[Sequence[str], None] = None,
+        append: bool = False
+    ):
+        """
+        Wraps another client and records every response to a cassette, for `ReplayTestClient`
+
+        :param client:
+            Client that makes the real requests
+        :param cassette_path:
+            Cassette file
+        :param match_headers:
+            See `Cassette`
+        :param append:
+            If True, responses are added to an existing cassette instead of replacing it
+        """
+
+        self.client = client
+        self.cassette = Cassette(file_path=cassette_path, match_headers=match_headers)
+        # Responses are appended to the file as they're recorded, so an existing cassette doesn't need to be loaded
+        if not append or not os.path.exists(cassette_path):
+            self.cassette.clear()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        response = self.client.request(
+            method=method, url=url, timeout=timeout, allow_redirects=allow_redirects,
+            data=data, headers=headers, cookies=cookies)
+        key = self.cassette.get_key(method=method, url=url, data=data, headers=headers, cookies=cookies)
+        self.cassette.record(key=key, response=response)
+        return response
+
+
+class ReplayTestClient(BaseTestClient):
+
+    def __init__(self, cassette_path: str, strict: bool = True, match_headers: Union[Sequence[str], None] = None):
+        """
+        Serves responses recorded by `RecordingTestClient`, without making any requests
+
+        :param cassette_path:
+            Cassette file
+        :param strict:
+            If True, unrecorded requests raise `UnrecordedRequestError`.
+            Otherwise, they get an empty 404 response (with `extra={'unrecorded': True}`).
+        :param match_headers:
+            See `Cassette`. This must match what the cassette was recorded with.
+        """
+
+        self.strict = strict
+        self.cassette = Cassette(file_path=cassette_path, match_headers=match_headers)
+        self.cassette.load()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return _replay(
+            cassette=self.cassette, strict=self.strict,
+            method=method, url=url, data=data, headers=headers, cookies=cookies)
+
+
+class AsyncRecordingTestClient(AsyncBaseTestClient):
+
+    def __init__(
+        self,
+        client: AsyncBaseTestClient,
+        cassette_path: str,
+        match_headers: Union[Sequence[str], None] = None,
+        append: bool = False
+    ):
+        """
+        Async version of `RecordingTestClient`.
+        See `RecordingTestClient` for details on each param.
+        """
+
+        self.client = client
+        self.cassette = Cassette(file_path=cassette_path, match_headers=match_headers)
+        # Responses are appended to the file as they're recorded, so an existing cassette doesn't need to be loaded
+        if not append or not os.path.exists(cassette_path):
+            self.cassette.clear()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        response = await self.client.request(
+            method=method, url=url, timeout=timeout, allow_redirects=allow_redirects,
+            data=data, headers=headers, cookies=cookies)
+        key = self.cassette.get_key(method=method, url=url, data=data, headers=headers, cookies=cookies)
+        self.cassette.record(key=key, response=response)
+        return response
+
+
+class AsyncReplayTestClient(AsyncBaseTestClient):
+
+    def __init__(self, cassette_path: str, strict: bool = True, match_headers: Union[Sequence[str], None] = None):
+        """
+        Async version of `ReplayTestClient`.
+        See `ReplayTestClient` for details on each param.
+        """
+
+        self.strict = strict
+        self.cassette = Cassette(file_path=cassette_path, match_headers=match_headers)
+        self.cassette.load()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return _replay(
+            cassette=self.cassette, strict=self.strict,
+            method=method, url=url, data=data, headers=headers, cookies=cookies)
+
+
+def _replay(
+    cassette: Cassette,
+    strict: bool,
+    method: str,
+    url: str,
+    data: Union[bytes, None],
+    headers: Union[Dict[str, Any], None],
+    cookies: Union[Dict[str, Any], None]
+) -> ResponseData:
+    key = cassette.get_key(method=method, url=url, data=data, headers=headers, cookies=cookies)
+    response = cassette.replay(key=key)
+    if response is not None:
+        return response
+
+    if strict:
+        raise UnrecordedRequestError(f'No recorded response for {method.upper()} {url} in {cassette.file_path}')
+
+    return ResponseData(text='', headers={}, status_code=404, extra={'unrecorded': True})
+
+
+def _copy_response(response: ResponseData) -> ResponseData:
+    # Cassettes keep their own copies, since verification can modify responses
+    return ResponseData.from_content(
+        content=response.content,
+        headers=dict(response.headers),
+        status_code=response.status_code,
+        extra=dict(response.extra) if response.extra is not None else None
+    )
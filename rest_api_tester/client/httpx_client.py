@@ -0,0 +1,196 @@
+import http.cookiejar
+import urllib.request
+from types import TracebackType
+from typing import Any, Union, Dict, Type
+
+import httpx
+
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+
+
+class HTTPXTestClient(BaseTestClient):
+
+    def __init__(
+        self,
+        base_url: str = '',
+        max_connections: Union[int, None] = 100,
+        max_keepalive_connections: Union[int, None] = 20,
+        keepalive_expiry: Union[float, None] = 5.0,
+        http2: bool = False,
+        verify: Union[bool, str] = True,
+        headers: Union[Dict[str, Any], None] = None,
+        transport: Union[httpx.BaseTransport, None] = None,
+        persist_cookies: bool = False
+    ):
+        """
+        Test client backed by a single `httpx.Client`, so connections are pooled and kept alive across requests.
+        Requires the `httpx` package (`pip install rest_api_tester[httpx]`).
+
+        Cookies set by your server are not kept between requests by default, so results don't depend on test order.
+        Call `close()` (or use the client as a context manager) to close pooled connections.
+
+        :param base_url:
+            Prepended to every test case URL (e.g. "https://api.example.com")
+        :param max_connections:
+            Maximum number of open connections. None means no limit.
+        :param max_keepalive_connections:
+            Maximum number of idle connections kept in the pool. None means no limit.
+        :param keepalive_expiry:
+            Seconds before an idle connection is closed. None means idle connections are never closed.
+        :param http2:
+            If True, HTTP/2 is used when the server supports it.
+            This requires the `h2` package (`pip install rest_api_tester[http2]`).
+        :param verify:
+            Whether to verify TLS certificates, or a path to a CA bundle
+        :param headers:
+            Headers sent with every request. Test case headers take precedence.
+        :param transport:
+            Custom `httpx` transport (e.g. `httpx.WSGITransport` or `httpx.MockTransport`)
+        :param persist_cookies:
+            If True, cookies set by your server are kept in the client's cookie jar and sent with later requests,
+            like a browser
+        """
+
+        self.httpx_client = httpx.Client(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            verify=verify,
+            headers=headers,
+            transport=transport,
+            cookies=None if persist_cookies else _get_ignored_cookie_jar()
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        # Building the request first avoids httpx's deprecation warning for per-request cookies
+        request = self.httpx_client.build_request(
+            method=method,
+            url=url,
+            content=data,
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout
+        )
+        response = self.httpx_client.send(request=request, follow_redirects=allow_redirects)
+        return _extract_response_data(response=response)
+
+    def close(self) -> None:
+        self.httpx_client.close()
+
+    def __enter__(self) -> 'HTTPXTestClient':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None]
+    ) -> None:
+        self.close()
+
+
+class AsyncHTTPXTestClient(AsyncBaseTestClient):
+
+    def __init__(
+        self,
+        base_url: str = '',
+        max_connections: Union[int, None] = 100,
+        max_keepalive_connections: Union[int, None] = 20,
+        keepalive_expiry: Union[float, None] = 5.0,
+        http2: bool = False,
+        verify: Union[bool, str] = True,
+        headers: Union[Dict[str, Any], None] = None,
+        transport: Union[httpx.AsyncBaseTransport, None] = None,
+        persist_cookies: bool = False
+    ):
+        """
+        Async version of `HTTPXTestClient`, backed by a single `httpx.AsyncClient`.
+        See `HTTPXTestClient` for details on each param.
+        Call `await aclose()` (or use the client as an async context manager) to close pooled connections.
+        """
+
+        self.httpx_client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            verify=verify,
+            headers=headers,
+            transport=transport,
+            cookies=None if persist_cookies else _get_ignored_cookie_jar()
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        request = self.httpx_client.build_request(
+            method=method,
+            url=url,
+            content=data,
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout
+        )
+        response = await self.httpx_client.send(request=request, follow_redirects=allow_redirects)
+        return _extract_response_data(response=response)
+
+    async def aclose(self) -> None:
+        await self.httpx_client.aclose()
+
+    async def __aenter__(self) -> 'AsyncHTTPXTestClient':
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Union[Type[BaseException], None],
+        exc_value: Union[BaseException, None],
+        traceback: Union[TracebackType, None]
+    ) -> None:
+        await self.aclose()
+
+
+def _extract_response_data(response: httpx.Response) -> ResponseData:
+    return ResponseData.from_content(
+        content=response.content,
+        headers={key.lower(): value for key, value in response.headers.items()},
+        status_code=response.status_code
+    )
+
+
+class _IgnoreCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """
+    Rejects every cookie set by a response.
+    Cookies passed to a request are still sent, since httpx copies them into a separate jar.
+    """
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: urllib.request.Request) -> bool:
+        return False
+
+
+def _get_ignored_cookie_jar() -> http.cookiejar.CookieJar:
+    return http.cookiejar.CookieJar(policy=_IgnoreCookiesPolicy())
@@ -1,16 +1,157 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Union, Dict
 
+from rest_api_tester.client.utils import get_charset
+from rest_api_tester.slots import add_slots
 
+
+class _ResponseBody:
+    """
+    The body of a `ResponseData`, which is stored as text, raw content or both.
+    The `text` property lives here so that the dataclass's `text` field is backed by it.
+    """
+
+    __slots__ = ('_text', '_content', '_json')
+
+    headers: Dict[str, Any]
+    _text: str
+    _content: bytes
+    _json: Any
+
+    @property
+    def text(self) -> str:
+        """
+        The response body as text.
+        For responses built from `content`, it is decoded on first use.
+        """
+
+        try:
+            return self._text
+        except AttributeError:
+            pass
+
+        self._text = self.content.decode(self._get_charset(), errors='replace')
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        _clear_slots(self, '_content', '_json')
+        self._text = value
+
+    @property
+    def content(self) -> bytes:
+        """
+        The raw response body.
+        For responses built from `text`, this is the UTF-8 encoded text.
+        """
+
+        try:
+            return self._content
+        except AttributeError:
+            pass
+
+        self._content = self.text.encode('utf-8')
+        return self._content
+
+    @property
+    def json(self) -> Any:
+        """
+        The response body parsed as JSON.
+        It is only parsed once (until `text` is reassigned), so modifying the returned value modifies the cached one.
+        """
+
+        try:
+            return self._json
+        except AttributeError:
+            pass
+
+        if hasattr(self, '_text'):
+            self._json = json.loads(self._text)
+        else:
+            # UTF-8 bodies that haven't been decoded yet are parsed directly
+            self._json = json.loads(self.content if self._get_charset() == 'utf-8' else self.text)
+        return self._json
+
+    def set_json(self, value: Any, text: Union[str, None] = None) -> None:
+        """
+        Sets the response body to an already-decoded JSON value, so it doesn't need to be parsed again
+
+        :param value:
+            Decoded JSON body
+        :param text:
+            The body as text, if known. Otherwise, `value` is serialized.
+        """
+
+        self.text = json.dumps(value) if text is None else text
+        self._json = value
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the response body in bytes (UTF-8 encoded, for responses built from `text`)
+        """
+
+        return len(self.content)
+
+    def _get_charset(self) -> str:
+        return get_charset(headers={str(key).lower(): value for key, value in self.headers.items()})
+
+
+@add_slots()
 @dataclass
-class ResponseData:
+class ResponseData(_ResponseBody):
+    """
+    A response from your server
+
+    Clients can build responses from either the decoded `text` or the raw `content` (see `from_content`).
+    The other one is only computed if it's used, and the JSON body is parsed at most once.
+    """
 
-    text: str
+    # Stored by the `_ResponseBody.text` property. `field()` keeps the property from becoming the default.
+    text: str = field()
     headers: Dict[str, Any]
     status_code: int
     extra: Union[Dict[str, Any], None] = None
 
-    @property
-    def json(self) -> Any:
-        return json.loads(self.text)
+    @classmethod
+    def from_content(
+        cls,
+        content: bytes,
+        headers: Dict[str, Any],
+        status_code: int,
+        extra: Union[Dict[str, Any], None] = None
+    ) -> 'ResponseData':
+        """
+        Builds a response from its raw body.
+        `text` is decoded on first use, with the charset from the content type header (UTF-8 by default).
+        """
+
+        response: ResponseData = cls.__new__(cls)
+        response.headers = headers
+        response.status_code = status_code
+        response.extra = extra
+        response._content = content
+        return response
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Raw bodies are compared as bytes, since decoding them replaces invalid bytes
+        body: Union[str, bytes]
+        other_body: Union[str, bytes]
+        if hasattr(self, '_content') or hasattr(other, '_content'):
+            body, other_body = self.content, other.content
+        else:
+            body, other_body = self.text, other.text
+        return (body, self.headers, self.status_code, self.extra) == \
+            (other_body, other.headers, other.status_code, other.extra)
+
+
+def _clear_slots(obj: Any, *names: str) -> None:
+    # Cached values are removed rather than set to a sentinel, so pickled copies stay valid
+    for name in names:
+        try:
+            delattr(obj, name)
+        except AttributeError:
+            pass
@@ -0,0 +1,69 @@
+import codecs
+from typing import Any, Dict, Tuple, Union
+from urllib.parse import urljoin
+
+# Shared by the in-process clients (e.g. `ASGITestClient` and `WSGITestClient`)
+
+MAX_REDIRECTS = 20
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def get_charset(headers: Dict[str, Any]) -> str:
+    """
+    Returns the charset of the (lowercase) response headers' content type, defaulting to UTF-8
+    """
+
+    for param in headers.get('content-type', '').split(';')[1:]:
+        key, _, value = param.strip().partition('=')
+        if key.lower() == 'charset' and value:
+            try:
+                return codecs.lookup(value.strip('"')).name
+            except LookupError:
+                break
+    return 'utf-8'
+
+
+def add_response_header(headers: Dict[str, Any], name: str, value: str) -> None:
+    """
+    Adds a header to a response's (lowercase) headers.
+    Repeated headers are joined with ", ", except "set-cookie" (whose values can contain commas),
+    which becomes a list of every value once it's repeated.
+    """
+
+    name = name.lower()
+    existing = headers.get(name)
+    if existing is None:
+        headers[name] = value
+    elif name != 'set-cookie':
+        headers[name] = f'{existing}, {value}'
+    elif isinstance(existing, list):
+        existing.append(value)
+    else:
+        headers[name] = [existing, value]
+
+
+def get_cookie_header(cookies: Dict[str, Any]) -> str:
+    return '; '.join(f'{key}={value}' for key, value in cookies.items())
+
+
+def get_redirect(
+    url: str,
+    method: str,
+    status_code: int,
+    headers: Dict[str, Any]
+) -> Union[Tuple[str, str], None]:
+    """
+    Returns the (URL, method) to redirect to, or None if the response is not a redirect.
+    Like browsers, 303s and POST 301/302s are redirected as GETs.
+    """
+
+    location = headers.get('location')
+    if status_code not in _REDIRECT_STATUSES or not location:
+        return None
+
+    if status_code == 303 or (status_code in (301, 302) and method == 'POST'):
+        method = 'GET'
+
+    return urljoin(url, location), method
@@ -0,0 +1,149 @@
+import io
+import sys
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type, Union
+from urllib.parse import unquote_to_bytes, urljoin, urlsplit
+
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.client.utils import (
+    DEFAULT_PORTS, MAX_REDIRECTS, add_response_header, get_cookie_header, get_redirect
+)
+
+_ExcInfo = Tuple[Type[BaseException], BaseException, Union[TracebackType, None]]
+WSGIStartResponse = Callable[..., Callable[[bytes], Any]]
+WSGIApp = Callable[[Dict[str, Any], WSGIStartResponse], Iterable[bytes]]
+
+
+class WSGITestClient(BaseTestClient):
+
+    def __init__(self, app: WSGIApp, base_url: str = 'http://testserver', script_name: str = ''):
+        """
+        Test client that calls a WSGI app (e.g. Flask or Django) directly, without a server or sockets
+
+        Like `TestClient`, exceptions raised by your app are raised from the request.
+        Note that `timeout` is ignored, since requests run synchronously in the calling thread.
+
+        :param app:
+            WSGI application
+        :param base_url:
+            Used to build the scheme, host and port of each request
+        :param script_name:
+            WSGI `SCRIPT_NAME`, for apps mounted under a sub-path
+        """
+
+        self.app = app
+        self.base_url = base_url
+        self.script_name = script_name
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        method = method.upper()
+        url = urljoin(self.base_url, url)
+        body = data or b''
+        headers = dict(headers or {})
+        if cookies:
+            headers['cookie'] = get_cookie_header(cookies=cookies)
+
+        for _ in range(MAX_REDIRECTS + 1):
+            status_code, response_headers, content = self._call_app(
+                method=method, url=url, body=body, headers=headers)
+            redirect = get_redirect(url=url, method=method, status_code=status_code, headers=response_headers)
+            if not allow_redirects or redirect is None:
+                break
+
+            url, redirect_method = redirect
+            if redirect_method != method:
+                method = redirect_method
+                body = b''
+                headers = {key: value for key, value in headers.items()
+                           if key.lower() not in ('content-type', 'content-length')}
+        else:
+            raise Exception(f'Exceeded {MAX_REDIRECTS} redirects')
+
+        return ResponseData.from_content(content=content, headers=response_headers, status_code=status_code)
+
+    def _call_app(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any], bytes]:
+        environ = self._build_environ(method=method, url=url, body=body, headers=headers)
+
+        status_code = 500
+        response_headers: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        def start_response(
+            status: str,
+            headers: List[Tuple[str, str]],
+            exc_info: Union[_ExcInfo, None] = None
+        ) -> Callable[[bytes], Any]:
+            nonlocal status_code
+            if exc_info is not None and chunks:
+                raise exc_info[1].with_traceback(exc_info[2])
+
+            status_code = int(status.split(' ', 1)[0])
+            response_headers.clear()
+            for key, value in headers:
+                add_response_header(headers=response_headers, name=key, value=value)
+            return chunks.append
+
+        iterable = self.app(environ, start_response)
+        try:
+            if isinstance(iterable, list) and not chunks:
+                # Avoid copying single-chunk bodies, which is what most frameworks return
+                content = iterable[0] if len(iterable) == 1 else b''.join(iterable)
+            else:
+                chunks.extend(iterable)
+                content = b''.join(chunks)
+        finally:
+            close = getattr(iterable, 'close', None)
+            if close is not None:
+                close()
+
+        return status_code, response_headers, content
+
+    def _build_environ(self, method: str, url: str, body: bytes, headers: Dict[str, Any]) -> Dict[str, Any]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+
+        environ: Dict[str, Any] = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': self.script_name,
+            # PEP 3333 "bytes as latin-1" strings
+            'PATH_INFO': unquote_to_bytes(parts.path or '/').decode('latin-1'),
+            'QUERY_STRING': parts.query,
+            'SERVER_NAME': parts.hostname or 'testserver',
+            'SERVER_PORT': str(parts.port or DEFAULT_PORTS.get(scheme, 80)),
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'HTTP_HOST': parts.netloc or 'testserver',
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scheme,
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': False,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False
+        }
+        if body:
+            environ['CONTENT_LENGTH'] = str(len(body))
+
+        for key, value in headers.items():
+            key = key.upper().replace('-', '_')
+            if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                key = f'HTTP_{key}'
+            environ[key] = str(value)
+
+        return environ
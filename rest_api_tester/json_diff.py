@@ -0,0 +1,162 @@
+import json
+from dataclasses import dataclass
+from typing import Any, List, Tuple, Union
+
+DEFAULT_MAX_MISMATCHES = 10
+
+# Mismatch kinds
+MISMATCH_VALUE = 'value'
+MISMATCH_TYPE = 'type'
+MISMATCH_LENGTH = 'length'
+MISMATCH_MISSING = 'missing'
+MISMATCH_UNEXPECTED = 'unexpected'
+
+_CONTAINERS = (dict, list)
+
+# Longer values are truncated in messages
+_MAX_VALUE_LENGTH = 80
+
+# A path is built as (parent path, key) pairs, so it's only turned into a string for mismatches
+_Path = Union[Tuple[Any, Union[str, int]], None]
+
+
+@dataclass
+class JSONMismatch:
+
+    # JSON path of the mismatched element (see `rest_api_tester.utils.json_remove`), or '' for the root
+    path: str
+    kind: str
+    expected: Any = None
+    actual: Any = None
+
+    def __str__(self) -> str:
+        path = self.path or '<root>'
+        if self.kind == MISMATCH_MISSING:
+            return f'{path}: missing (expected {_format_value(self.expected)})'
+        if self.kind == MISMATCH_UNEXPECTED:
+            return f'{path}: unexpected {_format_value(self.actual)}'
+        if self.kind == MISMATCH_LENGTH:
+            return f'{path}: expected {_pluralize(len(self.expected), "item")}, got {len(self.actual)}'
+        return f'{path}: expected {_format_value(self.expected)}, got {_format_value(self.actual)}'
+
+
+def json_diff(
+    expected: Any,
+    actual: Any,
+    max_mismatches: Union[int, None] = DEFAULT_MAX_MISMATCHES
+) -> List[JSONMismatch]:
+    """
+    Compares two JSON values in a single walk of both trees, and returns where they differ.
+    An empty list means they're equal (with the same semantics as `==`).
+
+    Dicts are compared by key (ignoring order) and lists by index.
+    If lists have different lengths, the length mismatch is reported and the common items are still compared.
+    The walk stops as soon as `max_mismatches` mismatches are found, and its runtime is linear in the size of the
+    documents at worst.
+
+    :param expected:
+        Expected JSON value
+    :param actual:
+        Actual JSON value
+    :param max_mismatches:
+        Maximum number of mismatches to return, or None for all of them
+    :return:
+        Mismatches in depth-first order
+    """
+
+    mismatches: List[JSONMismatch] = []
+    # Equal documents (i.e. passing tests) are the common case, and `==` is much faster than walking them
+    try:
+        if expected == actual:
+            return mismatches
+    except RecursionError:
+        pass
+
+    stack: List[Tuple[Any, Any, _Path]] = [(expected, actual, None)]
+
+    def add(path: _Path, kind: str, expected_value: Any = None, actual_value: Any = None) -> bool:
+        mismatches.append(JSONMismatch(
+            path=_format_path(path=path), kind=kind, expected=expected_value, actual=actual_value))
+        return max_mismatches is not None and len(mismatches) >= max_mismatches
+
+    while stack:
+        expected, actual, path = stack.pop()
+        children: List[Tuple[Any, Any, _Path]] = []
+
+        if isinstance(expected, dict) and isinstance(actual, dict):
+            for key, value in expected.items():
+                if key not in actual:
+                    if add(path=(path, key), kind=MISMATCH_MISSING, expected_value=value):
+                        return mismatches
+                    continue
+                actual_value = actual[key]
+                # Scalars are compared right away, rather than pushed onto the stack
+                if isinstance(value, _CONTAINERS) or isinstance(actual_value, _CONTAINERS):
+                    children.append((value, actual_value, (path, key)))
+                elif value != actual_value and add(
+                        path=(path, key), kind=MISMATCH_VALUE, expected_value=value, actual_value=actual_value):
+                    return mismatches
+            for key, value in actual.items():
+                if key not in expected and add(path=(path, key), kind=MISMATCH_UNEXPECTED, actual_value=value):
+                    return mismatches
+        elif isinstance(expected, list) and isinstance(actual, list):
+            if len(expected) != len(actual) and add(
+                    path=path, kind=MISMATCH_LENGTH, expected_value=expected, actual_value=actual):
+                return mismatches
+            for i, (value, actual_value) in enumerate(zip(expected, actual)):
+                if isinstance(value, _CONTAINERS) or isinstance(actual_value, _CONTAINERS):
+                    children.append((value, actual_value, (path, i)))
+                elif value != actual_value and add(
+                        path=(path, i), kind=MISMATCH_VALUE, expected_value=value, actual_value=actual_value):
+                    return mismatches
+        elif isinstance(expected, _CONTAINERS) or isinstance(actual, _CONTAINERS):
+            if add(path=path, kind=MISMATCH_TYPE, expected_value=expected, actual_value=actual):
+                return mismatches
+        elif expected != actual:
+            if add(path=path, kind=MISMATCH_VALUE, expected_value=expected, actual_value=actual):
+                return mismatches
+
+        # Reversed, so children are compared in order
+        stack.extend(reversed(children))
+
+    return mismatches
+
+
+def format_mismatches(mismatches: List[JSONMismatch], truncated: bool = False) -> str:
+    """
+    Formats mismatches as a message, one per line
+
+    :param truncated:
+        If True, notes that there are more mismatches than listed
+    """
+
+    header = f'JSON does not match (first {len(mismatches)} mismatches):' if truncated else 'JSON does not match:'
+    return '\n'.join([header] + [f'  {m}' for m in mismatches])
+
+
+def _format_path(path: _Path) -> str:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(f'[{key}]' if isinstance(key, int) else str(key))
+    return '.'.join(reversed(keys))
+
+
+def _format_value(value: Any) -> str:
+    # Only local context is shown, so nested values are summarized
+    if isinstance(value, dict):
+        return f'{{...}} ({_pluralize(len(value), "key")})' if value else '{}'
+    if isinstance(value, list):
+        return f'[...] ({_pluralize(len(value), "item")})' if value else '[]'
+
+    try:
+        formatted = json.dumps(value)
+    except (TypeError, ValueError):
+        formatted = repr(value)
+    if len(formatted) > _MAX_VALUE_LENGTH:
+        formatted = formatted[:_MAX_VALUE_LENGTH - 3] + '...'
+    return formatted
+
+
+def _pluralize(count: int, noun: str) -> str:
+    return f'{count} {noun}' if count == 1 else f'{count} {noun}s'
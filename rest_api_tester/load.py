@@ -0,0 +1,319 @@
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+from rest_api_tester.runner import RunSpec, TestCaseRunner
+from rest_api_tester.test import TestCase
+from rest_api_tester.timing import PHASE_REQUEST
+
+# Distinct error messages kept per load test, so a failing server can't grow them without bound
+_MAX_ERROR_MESSAGES = 100
+
+
+class LatencyHistogram:
+
+    def __init__(self, significant_figures: int = 2):
+        """
+        HDR-style histogram of latencies
+
+        Values are recorded in microseconds into log-linear buckets, so memory use doesn't depend on
+        the number of values and every value is kept to `significant_figures` decimal digits of precision.
+
+        :param significant_figures:
+            Decimal digits of precision to keep (1-5)
+        """
+
+        if not 1 <= significant_figures <= 5:
+            raise ValueError('significant_figures must be between 1 and 5')
+
+        self.significant_figures = significant_figures
+        # Enough linear sub-buckets per power of 2 that each bucket is within the requested precision
+        self._sub_bucket_bits: int = (2 * 10 ** significant_figures).bit_length()
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.min_us = 0
+        self.max_us = 0
+        self.total_us = 0
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        value = max(0, int(round(seconds * 1000 * 1000)))
+        index = self._get_index(value=value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        self.min_us = value if self.count == 0 else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+        self.count += count
+        self.total_us += value * count
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        if other.significant_figures != self.significant_figures:
+            raise ValueError('Histograms must have the same significant figures to be merged')
+
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        if other.count:
+            self.min_us = other.min_us if self.count == 0 else min(self.min_us, other.min_us)
+            self.max_us = max(self.max_us, other.max_us)
+            self.count += other.count
+            self.total_us += other.total_us
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the latency in seconds at or below which `percentile` percent of values fall
+        """
+
+        if not self.count:
+            return 0.0
+
+        target = max(1, self.count * min(100.0, max(0.0, percentile)) / 100)
+        for value_us, _, total in self._iter_buckets():
+            if total >= target:
+                return min(value_us, self.max_us) / 1000 / 1000
+        return self.max_us / 1000 / 1000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1000 / 1000 if self.count else 0.0
+
+    def format_percentile_distribution(self) -> str:
+        """
+        Returns the distribution in HdrHistogram's percentile output format, with values in milliseconds
+        """
+
+        lines = [f'{"Value":>12} {"Percentile":>14} {"TotalCount":>10} {"1/(1-Percentile)":>14}', '']
+        for value_us, count, total in self._iter_buckets():
+            percentile = total / self.count
+            inverse = f'{1 / (1 - percentile):14.2f}' if percentile < 1 else f'{"inf":>14}'
+            lines.append(f'{min(value_us, self.max_us) / 1000:12.3f} {percentile:14.12f} {total:10d} {inverse}')
+
+        lines += [
+            f'#[Mean    = {self.mean * 1000:12.3f}, Count = {self.count}]',
+            f'#[Max     = {self.max_us / 1000:12.3f}, Min   = {self.min_us / 1000:.3f}]'
+        ]
+        return '\n'.join(lines)
+
+    def _iter_buckets(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yields (highest equivalent value in microseconds, count, cumulative count) for each non-empty bucket
+        """
+
+        total = 0
+        for index in sorted(self._counts):
+            count = self._counts[index]
+            total += count
+            yield self._get_highest_equivalent_value(index=index), count, total
+
+    def _get_index(self, value: int) -> int:
+        exponent = max(0, value.bit_length() - self._sub_bucket_bits)
+        return (exponent << self._sub_bucket_bits) + (value >> exponent)
+
+    def _get_highest_equivalent_value(self, index: int) -> int:
+        exponent = index >> self._sub_bucket_bits
+        sub_bucket = index & ((1 << self._sub_bucket_bits) - 1)
+        return ((sub_bucket + 1) << exponent) - 1
+
+
+@dataclass
+class LoadScenario:
+    """
+    A test to replay during a load test.
+    Tests are picked at random in proportion to their `weight`.
+    """
+
+    spec: RunSpec
+    weight: float = 1
+
+
+@dataclass
+class LoadTestResult:
+
+    duration: float
+    num_requests: int
+    num_errors: int
+    num_verified: int
+    histogram: LatencyHistogram
+    # Error message => number of occurrences
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Requests per second
+        """
+
+        return self.num_requests / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.num_errors / self.num_requests if self.num_requests else 0.0
+
+    @property
+    def percentiles(self) -> Dict[str, float]:
+        """
+        p50/p95/p99 latencies in seconds
+        """
+
+        return {f'p{p}': self.histogram.percentile(percentile=p) for p in (50, 95, 99)}
+
+    def summary(self) -> str:
+        lines = [
+            f'Requests:   {self.num_requests} in {self.duration:.2f}s ({self.throughput:.1f}/s)',
+            f'Errors:     {self.num_errors} ({self.error_rate:.2%})',
+            f'Verified:   {self.num_verified}',
+            'Latency:    ' + ', '.join(f'{name}={seconds * 1000:.2f}ms' for name, seconds in self.percentiles.items())
+        ]
+        lines += [f'  {count}x {message}' for message, count in sorted(self.errors.items(), key=lambda e: -e[1])]
+        return '\n'.join(lines)
+
+
+class LoadTester:
+
+    def __init__(
+        self,
+        runner: TestCaseRunner,
+        scenarios: Sequence[LoadScenario],
+        verify_sample_rate: float = 0.0,
+        test_case: Union[TestCase, None] = None,
+        seed: Union[int, None] = None
+    ):
+        """
+        Replays a weighted mix of tests against your server to generate load
+
+        A request is an error if it raises an exception or returns a status other than the expected one.
+        A sample of responses can also be fully verified with `TestCase.verify_test_result`,
+        in which case verification failures are errors too.
+        Note that the runner's client must be thread-safe when `concurrency` is more than 1.
+
+        :param runner:
+            Used to parse tests and make requests
+        :param scenarios:
+            The tests to replay
+        :param verify_sample_rate:
+            Fraction of responses (0-1) to verify with `TestCase.verify_test_result`
+        :param test_case:
+            Used to verify responses. Defaults to a plain `TestCase`.
+        :param seed:
+            Seeds the random choice of tests, for reproducible runs
+        """
+
+        if not scenarios:
+            raise ValueError('At least one scenario is required')
+
+        self.runner = runner
+        self.scenarios = scenarios
+        self.verify_sample_rate = verify_sample_rate
+        self.test_case = test_case or TestCase()
+        self.seed = seed
+
+    def run(self, duration: float, concurrency: int = 1, rps: Union[float, None] = None) -> LoadTestResult:
+        """
+        Runs the load test and returns its results
+
+        :param duration:
+            In seconds
+        :param concurrency:
+            Number of requests that can be in flight at the same time
+        :param rps:
+            Target requests per second across all workers.
+            If not given, every worker sends requests back to back.
+        """
+
+        specs = [scenario.spec for scenario in self.scenarios]
+        weights = [scenario.weight for scenario in self.scenarios]
+        start = time.perf_counter()
+        deadline = start + duration
+        schedule = _Schedule(start=start, rps=rps)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self._run_worker,
+                    specs, weights, deadline, schedule,
+                    random.Random(None if self.seed is None else self.seed + i)
+                )
+                for i in range(concurrency)
+            ]
+            workers = [future.result() for future in futures]
+
+        result = LoadTestResult(
+            duration=time.perf_counter() - start,
+            num_requests=0,
+            num_errors=0,
+            num_verified=0,
+            histogram=LatencyHistogram()
+        )
+        for worker in workers:
+            result.num_requests += worker.num_requests
+            result.num_errors += worker.num_errors
+            result.num_verified += worker.num_verified
+            result.histogram.merge(worker.histogram)
+            for message, count in worker.errors.items():
+                if message in result.errors or len(result.errors) < _MAX_ERROR_MESSAGES:
+                    result.errors[message] = result.errors.get(message, 0) + count
+
+        return result
+
+    def _run_worker(
+        self,
+        specs: List[RunSpec],
+        weights: List[float],
+        deadline: float,
+        schedule: '_Schedule',
+        rand: random.Random
+    ) -> LoadTestResult:
+        result = LoadTestResult(duration=0, num_requests=0, num_errors=0, num_verified=0, histogram=LatencyHistogram())
+
+        while True:
+            slot = schedule.next_slot()
+            if slot >= deadline:
+                break
+            delay = slot - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            spec = rand.choices(specs, weights=weights)[0]
+            start = time.perf_counter()
+            result.num_requests += 1
+            try:
+                test_result = self.runner.run_spec(spec=spec)
+                result.histogram.record(seconds=test_result.timings.get(PHASE_REQUEST, time.perf_counter() - start))
+
+                if rand.random() < self.verify_sample_rate:
+                    result.num_verified += 1
+                    self.test_case.verify_test_result(result=test_result)
+                elif test_result.response.status_code != test_result.test_data.expected_status:
+                    raise AssertionError(
+                        f'{spec.test_name}: Expected status {test_result.test_data.expected_status}, '
+                        f'got {test_result.response.status_code}')
+            except Exception as e:
+                result.num_errors += 1
+                # Only the first line, since verification messages include whole responses
+                message = (str(e).strip().splitlines() or [''])[0]
+                message = f'{type(e).__name__}: {message}'
+                if message in result.errors or len(result.errors) < _MAX_ERROR_MESSAGES:
+                    result.errors[message] = result.errors.get(message, 0) + 1
+
+        return result
+
+
+class _Schedule:
+    """
+    Hands out request start times, spaced 1/rps apart, to all workers
+    """
+
+    def __init__(self, start: float, rps: Union[float, None]):
+        self.start = start
+        self.interval = 1 / rps if rps else 0.0
+        self.num_slots = 0
+        self.lock = threading.Lock()
+
+    def next_slot(self) -> float:
+        if not self.interval:
+            return time.perf_counter()
+
+        with self.lock:
+            slot = self.start + self.num_slots * self.interval
+            self.num_slots += 1
+        return slot
@@ -0,0 +1,374 @@
+import os
+import re
+import json
+import asyncio
+import argparse
+from http import HTTPStatus
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Pattern, Sequence, Tuple, Type, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from rest_api_tester.parser.base_parser import BaseParser
+from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.parser.scenario_cache import SCENARIO_CACHE
+from rest_api_tester.test import TestData
+
+# Matches `{param}` placeholders in scenario URLs
+_URL_PARAM_PATTERN = re.compile(r'{([^{}/]+)}')
+_HEADERS_END = b'\r\n\r\n'
+# Upper bound on a request's headers, above which the connection is closed
+_MAX_HEADERS_BYTES = 64 * 1024
+
+
+@dataclass
+class MockResponse:
+
+    test_data: TestData
+    # Full HTTP/1.1 response, built once when the server starts
+    raw: bytes
+    # Request constraints from the scenario, all of which must match for it to be used
+    headers: Dict[str, str] = field(default_factory=dict)
+    cookies: Dict[str, str] = field(default_factory=dict)
+    query: List[Tuple[str, str]] = field(default_factory=list)
+    body: Any = None
+
+    @property
+    def specificity(self) -> int:
+        return len(self.headers) + len(self.cookies) + len(self.query) + (self.body is not None)
+
+
+class MockRouter:
+
+    def __init__(self, test_data: Iterable[TestData]):
+        """
+        Routes requests to the scenarios with the same method and URL
+
+        Static URLs are looked up in a dict, and URL templates (e.g. "/items/{item_id}") are matched
+        by a single compiled regex per method. Static URLs take precedence over templates.
+        When several scenarios share a route, the most specific one whose headers, cookies, query params
+        and request body all match the request is used. Otherwise, the least specific one is used.
+        """
+
+        self._static: Dict[Tuple[str, str], List[MockResponse]] = {}
+        self._templates: Dict[str, List[Tuple[str, List[MockResponse]]]] = {}
+        templates: Dict[Tuple[str, str], List[MockResponse]] = {}
+
+        for data in test_data:
+            parts = urlsplit(data.url)
+            path = parts.path or '/'
+            key = (data.method.upper(), path)
+            routes = templates if _URL_PARAM_PATTERN.search(path) else self._static
+            routes.setdefault(key, []).append(_build_mock_response(test_data=data, query=parts.query))
+
+        for routes in (self._static, templates):
+            for responses in routes.values():
+                responses.sort(key=lambda r: -r.specificity)
+
+        for (method, path), responses in templates.items():
+            self._templates.setdefault(method, []).append((path, responses))
+        self._template_patterns: Dict[str, Pattern[str]] = {
+            method: self._compile(paths=[path for path, _ in routes])
+            for method, routes in self._templates.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(r) for r in self._static.values()) + sum(
+            len(r) for routes in self._templates.values() for _, r in routes)
+
+    def match(
+        self,
+        method: str,
+        path: str,
+        query: str = '',
+        headers: Union[Dict[str, str], None] = None,
+        body: bytes = b''
+    ) -> Union[MockResponse, None]:
+        """
+        Returns the response for a request, or None if no scenario has the same method and URL
+
+        :param headers:
+            Request headers, with lowercase names
+        """
+
+        responses = self._static.get((method, path))
+        if responses is None:
+            pattern = self._template_patterns.get(method)
+            match = pattern.fullmatch(path) if pattern is not None else None
+            if match is None or match.lastindex is None:
+                return None
+            responses = self._templates[method][match.lastindex - 1][1]
+
+        if len(responses) == 1:
+            return responses[0]
+
+        headers = headers or {}
+        cookies = dict(
+            cookie.strip().partition('=')[::2] for cookie in headers.get('cookie', '').split(';') if cookie.strip())
+        query_params = parse_qsl(query, keep_blank_values=True)
+        body_json = _NOT_PARSED
+        for response in responses:
+            if any(headers.get(key) != value for key, value in response.headers.items()):
+                continue
+            if any(cookies.get(key) != value for key, value in response.cookies.items()):
+                continue
+            if any(param not in query_params for param in response.query):
+                continue
+            if response.body is not None:
+                if body_json is _NOT_PARSED:
+                    body_json = _parse_body(body=body)
+                if body_json != response.body:
+                    continue
+            return response
+
+        least_specificity = responses[-1].specificity
+        return next(response for response in responses if response.specificity == least_specificity)
+
+    @staticmethod
+    def _compile(paths: Sequence[str]) -> Pattern[str]:
+        # One capturing group per template, so the index of the matched group identifies the route
+        alternatives = []
+        for path in paths:
+            pieces = []
+            position = 0
+            for param in _URL_PARAM_PATTERN.finditer(path):
+                pieces.append(re.escape(path[position:param.start()]))
+                pieces.append('(?:[^/]+)')
+                position = param.end()
+            pieces.append(re.escape(path[position:]))
+            alternatives.append(f'({"".join(pieces)})')
+        return re.compile('|'.join(alternatives))
+
+
+class MockServer:
+
+    def __init__(
+        self,
+        path_to_scenarios_dir: str,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        paths_to_test_cases: Union[Sequence[str], None] = None,
+        file_parser: Type[BaseParser] = JSONParser
+    ):
+        """
+        Local HTTP/1.1 server that serves the expected responses of your scenarios, e.g. as a stub of your API
+        for frontend development or consumer load tests
+
+        Responses are built once when the server starts, and connections are kept alive,
+        so a single process can serve thousands of requests per second.
+        Chunked request bodies are not supported.
+
+        :param path_to_scenarios_dir:
+            Path to your scenarios directory
+        :param host:
+            Interface to listen on. Defaults to loopback only.
+        :param port:
+            Port to listen on. Defaults to a free port (see `port` once started).
+        :param paths_to_test_cases:
+            Scenario files to serve, relative to `path_to_scenarios_dir`.
+            Defaults to every JSON scenario file in the directory and its subdirectories.
+        :param file_parser:
+            Parser used to read the scenario files. It must support `iter_test_data`.
+        """
+
+        self.path_to_scenarios_dir = path_to_scenarios_dir
+        self.host = host
+        self.port = port
+        self.file_parser = file_parser
+        if paths_to_test_cases is None:
+            paths_to_test_cases = self._find_scenario_files(path_to_scenarios_dir=path_to_scenarios_dir)
+
+        self.router = MockRouter(test_data=(
+            test_data
+            for path_to_test_cases in paths_to_test_cases
+            for test_data in file_parser.iter_test_data(
+                path_to_scenarios_dir=path_to_scenarios_dir, path_to_test_cases=path_to_test_cases)
+        ))
+        self._server: Union[asyncio.AbstractServer, None] = None
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=self.host, port=self.port, limit=_MAX_HEADERS_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def __aenter__(self) -> 'MockServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(_HEADERS_END)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                method, target, version, headers = _parse_head(head=head)
+                if 'chunked' in headers.get('transfer-encoding', ''):
+                    writer.write(_build_raw_response(status_code=501, headers={}, body=b'', close=True))
+                    break
+
+                content_length = int(headers.get('content-length') or 0)
+                body = await reader.readexactly(content_length) if content_length else b''
+
+                path, _, query = target.partition('?')
+                response = self.router.match(
+                    method=method, path=unquote(path), query=query, headers=headers, body=body)
+                if response is None and method == 'HEAD':
+                    # Like most servers, HEAD requests get the headers of the GET response by default
+                    response = self.router.match(
+                        method='GET', path=unquote(path), query=query, headers=headers, body=body)
+                if response is not None:
+                    raw = response.raw
+                else:
+                    message = json.dumps({'detail': f'No scenario matches {method} {path}'}).encode()
+                    raw = _build_raw_response(
+                        status_code=404, headers={'content-type': 'application/json'}, body=message)
+                if method == 'HEAD':
+                    # HEAD responses keep the content-length of the body, but never include it
+                    raw = raw[:raw.index(_HEADERS_END) + len(_HEADERS_END)]
+                writer.write(raw)
+
+                if version == 'HTTP/1.0' or headers.get('connection', '').lower() == 'close':
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _find_scenario_files(path_to_scenarios_dir: str) -> List[str]:
+        paths_to_test_cases = []
+        for dir_path, _, file_names in os.walk(path_to_scenarios_dir):
+            for file_name in sorted(file_names):
+                file_path = os.path.join(dir_path, file_name)
+                if file_name.endswith('.json') and _is_scenario_file(file_path=file_path):
+                    paths_to_test_cases.append(os.path.relpath(file_path, path_to_scenarios_dir))
+        return sorted(paths_to_test_cases)
+
+
+_NOT_PARSED = object()
+
+
+def _is_scenario_file(file_path: str) -> bool:
+    """
+    Returns whether a JSON file holds scenarios, as opposed to e.g. a request body referenced via "file::"
+    """
+
+    is_scenario_file = False
+    try:
+        for _, test_case in SCENARIO_CACHE.iter_test_cases(file_path=file_path):
+            if not (isinstance(test_case, dict) and 'url' in test_case and 'method' in test_case):
+                return False
+            is_scenario_file = True
+    except ValueError:
+        return False
+    return is_scenario_file
+
+
+def _parse_body(body: Union[bytes, str, None]) -> Any:
+    if not body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode('utf-8', errors='replace') if isinstance(body, bytes) else body
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+    lines = head.decode('latin-1').split('\r\n')
+    method, target, version = lines[0].split(' ', 2)
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        key, separator, value = line.partition(':')
+        if separator:
+            key, value = key.strip().lower(), value.strip()
+            if key in headers:
+                # Repeated headers are combined, with cookies joined the way a single cookie header would be
+                value = f'{headers[key]}{"; " if key == "cookie" else ", "}{value}'
+            headers[key] = value
+    return method.upper(), target, version, headers
+
+
+def _build_mock_response(test_data: TestData, query: str) -> MockResponse:
+    response = test_data.expected_response or ''
+    # Lists (e.g. of several set-cookie values) are sent as repeated headers
+    headers: Dict[str, Union[str, List[str]]] = {
+        str(key).lower(): [str(item) for item in value] if isinstance(value, list) else str(value)
+        for key, value in (test_data.expected_headers or {}).items()
+    }
+    if test_data.expected_response_content is not None:
+        body = test_data.expected_response_content
+        headers.setdefault('content-type', 'application/octet-stream')
+    else:
+        body = response.encode()
+        if response and 'content-type' not in headers:
+            is_json = not isinstance(_parse_body(body=response), str)
+            headers['content-type'] = 'application/json' if is_json else 'text/plain; charset=utf-8'
+
+    request_body = test_data.request_content if test_data.request_content is not None else test_data.request_data
+    return MockResponse(
+        test_data=test_data,
+        raw=_build_raw_response(status_code=test_data.expected_status, headers=headers, body=body),
+        headers={str(key).lower(): str(value) for key, value in (test_data.headers or {}).items()},
+        cookies={str(key): str(value) for key, value in (test_data.cookies or {}).items()},
+        query=parse_qsl(query, keep_blank_values=True),
+        body=_parse_body(body=request_body)
+    )
+
+
+def _build_raw_response(
+    status_code: int,
+    headers: Dict[str, Union[str, List[str]]],
+    body: bytes,
+    close: bool = False
+) -> bytes:
+    try:
+        reason = HTTPStatus(status_code).phrase
+    except ValueError:
+        reason = ''
+
+    lines = [f'HTTP/1.1 {status_code} {reason}']
+    for key, value in headers.items():
+        if key not in ('content-length', 'connection'):
+            lines += [f'{key}: {item}' for item in (value if isinstance(value, list) else [value])]
+    lines.append(f'content-length: {len(body)}')
+    if close:
+        lines.append('connection: close')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serves the expected responses of your scenarios')
+    parser.add_argument('path_to_scenarios_dir')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = MockServer(path_to_scenarios_dir=args.path_to_scenarios_dir, host=args.host, port=args.port)
+    print(f'Serving {len(server.router)} scenarios on {server.url}')
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == '__main__':
+    main()
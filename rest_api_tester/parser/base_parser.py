@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Union, Any, Dict
+from typing import Union, Iterator
 
 from rest_api_tester.test import TestData
+from rest_api_tester import utils
+from rest_api_tester.utils import JSONModifiers
 
 
 class BaseParser(ABC):
@@ -12,9 +14,61 @@ class BaseParser(ABC):
         path_to_scenarios_dir: str,
         path_to_test_cases: str,
         test_name: str,
-        request_json_modifiers: Union[Dict[str, Any], None],
-        response_json_modifiers: Union[Dict[str, Any], None],
-        request_header_modifiers: Union[Dict[str, Any], None],
-        response_header_modifiers: Union[Dict[str, Any], None]
+        request_json_modifiers: Union[JSONModifiers, None],
+        response_json_modifiers: Union[JSONModifiers, None],
+        request_header_modifiers: Union[JSONModifiers, None],
+        response_header_modifiers: Union[JSONModifiers, None]
     ) -> TestData:
         ...
+
+    @classmethod
+    def iter_test_data(
+        cls,
+        path_to_scenarios_dir: str,
+        path_to_test_cases: str,
+        request_json_modifiers: Union[JSONModifiers, None] = None,
+        response_json_modifiers: Union[JSONModifiers, None] = None,
+        request_header_modifiers: Union[JSONModifiers, None] = None,
+        response_header_modifiers: Union[JSONModifiers, None] = None
+    ) -> Iterator[TestData]:
+        """
+        Lazily yields a TestData object for every test case in a test cases file.
+        Implementations should read the file only once.
+        """
+
+        raise NotImplementedError(f'{cls.__name__} does not support iterating over all test cases')
+
+
+def apply_modifiers(
+    test_data: TestData,
+    request_json_modifiers: Union[JSONModifiers, None] = None,
+    response_json_modifiers: Union[JSONModifiers, None] = None,
+    request_header_modifiers: Union[JSONModifiers, None] = None,
+    response_header_modifiers: Union[JSONModifiers, None] = None
+) -> None:
+    """
+    Applies JSON and header modifiers to freshly parsed test data, in place.
+    Parsers use this for the modifiers passed to `parse`.
+
+    The test data must own its decoded bodies (as parsed test data does), since they are modified in place.
+    """
+
+    if request_json_modifiers:
+        request_json = test_data.request_data_json if test_data.request_data else {}
+        request_json = utils.json_update_many(j=request_json, updates=request_json_modifiers, copy=utils.COPY_NONE)
+        test_data.set_request_data_json(value=request_json)
+
+    if request_header_modifiers:
+        headers = utils.json_update_many(
+            j=test_data.headers or {}, updates=request_header_modifiers, copy=utils.COPY_PATH)
+        # Request header names are lowercase, including the ones added by modifiers
+        test_data.headers = {key.lower(): value for key, value in headers.items()}
+
+    if response_json_modifiers:
+        response_json = test_data.expected_response_json if test_data.expected_response else {}
+        response_json = utils.json_update_many(j=response_json, updates=response_json_modifiers, copy=utils.COPY_NONE)
+        test_data.set_expected_response_json(value=response_json)
+
+    if response_header_modifiers:
+        test_data.expected_headers = utils.json_update_many(
+            j=test_data.expected_headers or {}, updates=response_header_modifiers, copy=utils.COPY_PATH)
@@ -1,32 +1,97 @@
 import os
 import json
-from typing import Any, Union, Dict
+import time
+from typing import Any, Union, Dict, Iterator, Tuple, cast
 
 from rest_api_tester.test import TestData
-from rest_api_tester.parser.base_parser import BaseParser
-from rest_api_tester import utils
+from rest_api_tester.parser.base_parser import BaseParser, apply_modifiers
+from rest_api_tester.parser.scenario_cache import SCENARIO_CACHE
+from rest_api_tester.utils import JSONModifiers
 
 EXTERNAL_FILE_PREFIX = 'file::'
+# Marks a scenario body that is only available as text
+_NOT_DECODED = object()
 
 
 class JSONParser(BaseParser):
 
-    @staticmethod
+    @classmethod
     def parse(
+        cls,
         path_to_scenarios_dir: str,
         path_to_test_cases: str,
         test_name: str,
-        request_json_modifiers: Union[Dict[str, Any], None],
-        response_json_modifiers: Union[Dict[str, Any], None],
-        request_header_modifiers: Union[Dict[str, Any], None],
-        response_header_modifiers: Union[Dict[str, Any], None],
+        request_json_modifiers: Union[JSONModifiers, None],
+        response_json_modifiers: Union[JSONModifiers, None],
+        request_header_modifiers: Union[JSONModifiers, None],
+        response_header_modifiers: Union[JSONModifiers, None],
     ) -> TestData:
         test_cases_file_path = os.path.join(path_to_scenarios_dir, path_to_test_cases)
-        with open(test_cases_file_path, 'r') as f:
-            test_cases = json.loads(f.read())
+        test_case = cls._load_test_case(test_cases_file_path=test_cases_file_path, test_name=test_name)
+        return cls._build_test_data(
+            path_to_scenarios_dir=path_to_scenarios_dir,
+            test_cases_file_path=test_cases_file_path,
+            test_name=test_name,
+            test_case=test_case,
+            request_json_modifiers=request_json_modifiers,
+            response_json_modifiers=response_json_modifiers,
+            request_header_modifiers=request_header_modifiers,
+            response_header_modifiers=response_header_modifiers
+        )
+
+    @classmethod
+    def iter_test_data(
+        cls,
+        path_to_scenarios_dir: str,
+        path_to_test_cases: str,
+        request_json_modifiers: Union[JSONModifiers, None] = None,
+        response_json_modifiers: Union[JSONModifiers, None] = None,
+        request_header_modifiers: Union[JSONModifiers, None] = None,
+        response_header_modifiers: Union[JSONModifiers, None] = None
+    ) -> Iterator[TestData]:
+        test_cases_file_path = os.path.join(path_to_scenarios_dir, path_to_test_cases)
+        for test_name, test_case in cls._iter_test_cases(test_cases_file_path=test_cases_file_path):
+            yield cls._build_test_data(
+                path_to_scenarios_dir=path_to_scenarios_dir,
+                test_cases_file_path=test_cases_file_path,
+                test_name=test_name,
+                test_case=test_case,
+                request_json_modifiers=request_json_modifiers,
+                response_json_modifiers=response_json_modifiers,
+                request_header_modifiers=request_header_modifiers,
+                response_header_modifiers=response_header_modifiers
+            )
+
+    @staticmethod
+    def _iter_test_cases(test_cases_file_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields (test name, raw test case dict) for every test case in the file.
+        Subclasses can override this to read scenarios from other file layouts.
+        """
+
+        yield from SCENARIO_CACHE.iter_test_cases(file_path=test_cases_file_path)
+
+    @staticmethod
+    def _load_test_case(test_cases_file_path: str, test_name: str) -> Dict[str, Any]:
+        """
+        Returns the raw test case dict for `test_name`.
+        The returned dict is modified while building TestData, so it must not be shared with other callers.
+        Subclasses can override this to read scenarios from other file layouts.
+        """
 
-        test_case = test_cases[test_name]
+        return SCENARIO_CACHE.get_test_case(file_path=test_cases_file_path, test_name=test_name)
 
+    @staticmethod
+    def _build_test_data(
+        path_to_scenarios_dir: str,
+        test_cases_file_path: str,
+        test_name: str,
+        test_case: Dict[str, Any],
+        request_json_modifiers: Union[JSONModifiers, None],
+        response_json_modifiers: Union[JSONModifiers, None],
+        request_header_modifiers: Union[JSONModifiers, None],
+        response_header_modifiers: Union[JSONModifiers, None],
+    ) -> TestData:
         assert isinstance(test_case.get('url'), str)
         assert isinstance(test_case.get('status'), int)
         assert isinstance(test_case.get('method'), str)
@@ -38,72 +103,89 @@ class JSONParser(BaseParser):
             assert isinstance(test_case['response_headers'], dict)
         if 'allow_redirects' in test_case:
             assert isinstance(test_case['allow_redirects'], bool)
+        if 'max_latency_ms' in test_case:
+            assert isinstance(test_case['max_latency_ms'], (int, float))
+        if 'max_response_bytes' in test_case:
+            assert isinstance(test_case['max_response_bytes'], int)
 
-        request = test_case.get('request')
-        if request is not None:
-            if isinstance(request, (dict, list)):
-                request = json.dumps(request)
-            elif isinstance(request, str):
-                if request.startswith(EXTERNAL_FILE_PREFIX):
-                    request_file_path = os.path.join(path_to_scenarios_dir, request[len(EXTERNAL_FILE_PREFIX):])
-                    with open(request_file_path, 'r') as f:
-                        request = str(f.read().strip())
-            else:
-                raise Exception('Request format is invalid')
-
-        if request_json_modifiers:
-            request_json = json.loads(request or '{}')
-            for path, value in request_json_modifiers.items():
-                request_json = utils.json_update(j=request_json, path=path, value=value)
+        request, request_json, request_content = _read_body(
+            body=test_case.get('request'), path_to_scenarios_dir=path_to_scenarios_dir, name='Request')
+        if request_json is not _NOT_DECODED:
             request = json.dumps(request_json)
 
-        if request_header_modifiers:
-            headers = test_case.get('headers') or {}
-            for path, value in request_header_modifiers.items():
-                headers = utils.json_update(j=headers, path=path, value=value)
-            test_case['headers'] = headers
-
-        response = test_case.get('response')
-        if response is not None:
-            if isinstance(response, (dict, list)):
-                response = json.dumps(response)
-            elif isinstance(response, str):
-                if response.startswith(EXTERNAL_FILE_PREFIX):
-                    response_file_path = os.path.join(path_to_scenarios_dir, response[len(EXTERNAL_FILE_PREFIX):])
-                    with open(response_file_path, 'r') as f:
-                        response = str(f.read().strip())
-            else:
-                raise Exception('Response format is invalid')
-
-        if response_json_modifiers:
-            response_json = json.loads(response or '{}')
-            for path, value in response_json_modifiers.items():
-                response_json = utils.json_update(j=response_json, path=path, value=value)
+        response, response_json, response_content = _read_body(
+            body=test_case.get('response'), path_to_scenarios_dir=path_to_scenarios_dir, name='Response')
+        if response_json is not _NOT_DECODED:
             response = json.dumps(response_json)
 
-        if response_header_modifiers:
-            response_headers = test_case.get('response_headers') or {}
-            for path, value in response_header_modifiers.items():
-                response_headers = utils.json_update(j=response_headers, path=path, value=value)
-            test_case['response_headers'] = response_headers
-
         headers = test_case.get('headers')
         if headers:
             headers = {
                 key.lower(): value for key, value in headers.items()
             }
 
-        return TestData(
+        test_data = TestData(
             name=test_name,
             url=test_case['url'],
             method=test_case['method'],
             headers=headers,
-            cookies=test_case.get('cookies'),
+            cookies=cast(Dict[str, Any], test_case.get('cookies')),
             request_data=request,
             expected_status=test_case['status'],
             expected_response=response,
             expected_headers=test_case.get('response_headers'),
             allow_redirects=test_case.get('allow_redirects', True),
             file_path=test_cases_file_path,
-            description=test_case.get('description')
+            description=test_case.get('description'),
+            max_latency_ms=test_case.get('max_latency_ms'),
+            max_response_bytes=test_case.get('max_response_bytes'),
+            request_content=request_content,
+            expected_response_content=response_content
         )
+
+        # Hand over the decoded bodies, so they aren't parsed again by modifiers or during verification.
+        # The test case is never shared, so they can be modified in place.
+        if request_json is not _NOT_DECODED:
+            test_data.set_request_data_json(value=request_json, request_data=request)
+        if response_json is not _NOT_DECODED:
+            test_data.set_expected_response_json(value=response_json, expected_response=response)
+
+        # Timed separately, so runners can record it under "modify" rather than "parse"
+        start = time.perf_counter()
+        apply_modifiers(
+            test_data=test_data,
+            request_json_modifiers=request_json_modifiers,
+            response_json_modifiers=response_json_modifiers,
+            request_header_modifiers=request_header_modifiers,
+            response_header_modifiers=response_header_modifiers
+        )
+        test_data.modifier_seconds = time.perf_counter() - start
+        return test_data
+
+
+def _read_body(
+    body: Any,
+    path_to_scenarios_dir: str,
+    name: str
+) -> Tuple[Union[str, None], Any, Union[bytes, None]]:
+    """
+    Returns a scenario's request or response body as (text, decoded JSON, raw bytes).
+    The decoded JSON is `_NOT_DECODED` if the body is text (e.g. from an external file), which is left unparsed.
+    External files that aren't UTF-8 text (e.g. images) are only returned as raw bytes.
+    """
+
+    if body is None:
+        return None, _NOT_DECODED, None
+    if isinstance(body, (dict, list)):
+        return None, body, None
+    if isinstance(body, str):
+        if body.startswith(EXTERNAL_FILE_PREFIX):
+            with open(os.path.join(path_to_scenarios_dir, body[len(EXTERNAL_FILE_PREFIX):]), 'rb') as f:
+                content = f.read()
+            try:
+                text = content.decode('utf-8')
+            except UnicodeDecodeError:
+                return None, _NOT_DECODED, content
+            return text.replace('\r\n', '\n').replace('\r', '\n').strip(), _NOT_DECODED, None
+        return body, _NOT_DECODED, None
+    raise Exception(f'{name} format is invalid')
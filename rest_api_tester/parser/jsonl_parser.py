@@ -0,0 +1,166 @@
+import os
+import json
+import threading
+from typing import Any, Dict, Iterator, Tuple, Union
+
+from rest_api_tester.test import JSONL_EXTENSION
+from rest_api_tester.parser.json_parser import JSONParser
+
+# Maps absolute file path => ((mtime_ns, size), test name => byte offset of the test's line)
+_IndexEntry = Tuple[Tuple[int, int], Dict[str, int]]
+
+_KEY_DECODER = json.JSONDecoder()
+
+
+class JSONLParser(JSONParser):
+    """
+    Parses JSON Lines scenario files
+
+    Each non-empty line holds exactly one test case, keyed by test name:
+        {"test_get_item__200": {"url": "/items/1", "method": "GET", "status": 200}}
+
+    The first lookup in a file builds an index of test name => byte offset by decoding only the keys.
+    Every lookup after that seeks directly to the requested line and decodes only that test case.
+    Scenario values (e.g. `file::` references) are handled exactly like `JSONParser`.
+    See `convert_json_to_jsonl` to convert existing JSON scenario files.
+    """
+
+    _indexes: Dict[str, _IndexEntry] = {}
+    _indexes_lock = threading.Lock()
+
+    @classmethod
+    def _load_test_case(cls, test_cases_file_path: str, test_name: str) -> Dict[str, Any]:
+        index = cls._get_index(test_cases_file_path=test_cases_file_path)
+        offset = index.get(test_name)
+        if offset is not None:
+            test_case = cls._read_test_case(
+                test_cases_file_path=test_cases_file_path, test_name=test_name, offset=offset)
+            if test_case is not None:
+                return test_case
+
+        # The file may have changed without changing its mtime or size, so rebuild the index once
+        cls.invalidate_index(test_cases_file_path=test_cases_file_path)
+        index = cls._get_index(test_cases_file_path=test_cases_file_path)
+        test_case = cls._read_test_case(
+            test_cases_file_path=test_cases_file_path, test_name=test_name, offset=index[test_name])
+        if test_case is None:
+            raise KeyError(test_name)
+        return test_case
+
+    @staticmethod
+    def _iter_test_cases(test_cases_file_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with open(test_cases_file_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    test_cases = json.loads(line)
+                    if not isinstance(test_cases, dict) or len(test_cases) != 1:
+                        raise Exception('Each scenario line must contain a single test case')
+                    yield from test_cases.items()
+
+    @classmethod
+    def invalidate_index(cls, test_cases_file_path: Union[str, None] = None) -> None:
+        """
+        Removes a file's index from memory.
+        If no file path is given, all indexes are removed.
+        """
+
+        with cls._indexes_lock:
+            if test_cases_file_path is None:
+                cls._indexes.clear()
+            else:
+                cls._indexes.pop(os.path.abspath(test_cases_file_path), None)
+
+    @classmethod
+    def _get_index(cls, test_cases_file_path: str) -> Dict[str, int]:
+        key = os.path.abspath(test_cases_file_path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with cls._indexes_lock:
+            entry = cls._indexes.get(key)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+
+        index = cls._build_index(test_cases_file_path=key)
+        with cls._indexes_lock:
+            cls._indexes[key] = (stamp, index)
+        return index
+
+    @staticmethod
+    def _build_index(test_cases_file_path: str) -> Dict[str, int]:
+        index = {}
+        offset = 0
+        with open(test_cases_file_path, 'rb') as f:
+            for line in f:
+                test_name = _decode_test_name(line=line)
+                if test_name is not None:
+                    if test_name in index:
+                        raise Exception(f'Duplicate test name in {test_cases_file_path}: {test_name}')
+                    index[test_name] = offset
+                offset += len(line)
+        return index
+
+    @staticmethod
+    def _read_test_case(test_cases_file_path: str, test_name: str, offset: int) -> Union[Dict[str, Any], None]:
+        with open(test_cases_file_path, 'rb') as f:
+            f.seek(offset)
+            line = f.readline()
+
+        try:
+            test_cases = json.loads(line)
+        except ValueError:
+            return None
+
+        if not isinstance(test_cases, dict) or test_name not in test_cases:
+            return None
+
+        test_case: Dict[str, Any] = test_cases[test_name]
+        return test_case
+
+
+def convert_json_to_jsonl(json_file_path: str, jsonl_file_path: Union[str, None] = None) -> str:
+    """
+    Converts a JSON scenario file (as read by `JSONParser`) to a JSON Lines scenario file (as read by `JSONLParser`)
+
+    :param json_file_path:
+        Path to the existing JSON scenario file
+    :param jsonl_file_path:
+        Path to write the JSON Lines scenario file to.
+        Defaults to `json_file_path` with a ".jsonl" extension.
+    :return:
+        Path of the JSON Lines scenario file
+    """
+
+    if jsonl_file_path is None:
+        jsonl_file_path = os.path.splitext(json_file_path)[0] + JSONL_EXTENSION
+
+    with open(json_file_path, 'r') as f:
+        test_cases = json.loads(f.read())
+
+    if not isinstance(test_cases, dict):
+        raise Exception('Scenario file must contain a JSON object')
+
+    with open(jsonl_file_path, 'w+') as f:
+        for test_name, test_case in test_cases.items():
+            f.write(json.dumps({test_name: test_case}) + '\n')
+
+    return jsonl_file_path
+
+
+def _decode_test_name(line: bytes) -> Union[str, None]:
+    text = line.decode('utf-8').strip()
+    if not text:
+        return None
+
+    if not text.startswith('{'):
+        raise Exception('Each scenario line must contain a JSON object')
+
+    start = text.find('"')
+    if start < 0:
+        raise Exception('Each scenario line must contain a test name')
+
+    test_name, _ = _KEY_DECODER.raw_decode(text, start)
+    if not isinstance(test_name, str):
+        raise Exception('Each scenario line must contain a test name')
+
+    return test_name
@@ -0,0 +1,126 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Tuple, Union
+
+# Cache entries are keyed by absolute path and stamped with (mtime_ns, size)
+_FileStamp = Tuple[int, int]
+
+# Parsed scenarios typically take several times more memory than their files, so this is kept small
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ScenarioFileCache:
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = 128
+    ):
+        """
+        LRU cache of parsed scenario files
+
+        Entries are invalidated automatically when a file's mtime or size changes.
+        Callers always receive fresh copies of the test cases they ask for, so cached state can't be modified.
+
+        :param max_bytes:
+            Upper bound on the total size (on disk) of all cached files.
+            Files larger than this are parsed but never cached.
+            Note that the parsed files take several times more memory than this.
+            The default (16 MiB) keeps the shared `SCENARIO_CACHE` from holding on to much more than ~100 MiB.
+        :param max_entries:
+            Upper bound on the number of cached files
+        """
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[_FileStamp, Dict[str, Any]]]' = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.RLock()
+
+    def get_test_case(self, file_path: str, test_name: str) -> Dict[str, Any]:
+        """
+        Returns a fresh copy of a single test case from a scenario file
+
+        :raises KeyError:
+            If the test case does not exist
+        """
+
+        test_case: Dict[str, Any] = self._copy(self._get_test_cases(file_path=file_path)[test_name])
+        return test_case
+
+    def iter_test_cases(self, file_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yields (test name, fresh copy of the test case) for every test case in a scenario file.
+        Each test case is only copied when it's reached, rather than copying the whole file up front.
+
+        :raises ValueError:
+            If the file isn't valid JSON or doesn't hold a JSON object
+        """
+
+        test_cases = self._get_test_cases(file_path=file_path)
+        if not isinstance(test_cases, dict):
+            raise ValueError(f'{file_path} does not contain a JSON object of test cases')
+        for test_name, test_case in test_cases.items():
+            yield test_name, self._copy(test_case)
+
+    def invalidate(self, file_path: Union[str, None] = None) -> None:
+        """
+        Removes a file from the cache.
+        If no file path is given, the entire cache is cleared.
+        """
+
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._num_bytes = 0
+                return
+
+            entry = self._entries.pop(os.path.abspath(file_path), None)
+            if entry is not None:
+                self._num_bytes -= entry[0][1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: object) -> bool:
+        return isinstance(file_path, str) and os.path.abspath(file_path) in self._entries
+
+    def _get_test_cases(self, file_path: str) -> Dict[str, Any]:
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                self.invalidate(file_path=key)
+
+        with open(key, 'r') as f:
+            test_cases: Dict[str, Any] = json.loads(f.read())
+
+        if stamp[1] <= self.max_bytes and self.max_entries > 0:
+            with self._lock:
+                self.invalidate(file_path=key)
+                self._entries[key] = (stamp, test_cases)
+                self._num_bytes += stamp[1]
+                self._evict()
+
+        return test_cases
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._num_bytes > self.max_bytes):
+            _, (stamp, _) = self._entries.popitem(last=False)
+            self._num_bytes -= stamp[1]
+
+    @staticmethod
+    def _copy(j: Any) -> Any:
+        return json.loads(json.dumps(j))
+
+
+# Shared by all parsers that read JSON scenario files
+SCENARIO_CACHE = ScenarioFileCache()
@@ -0,0 +1,190 @@
+import re
+import json
+from typing import Any, Callable, Dict, IO, Iterator, List, Tuple
+
+from rest_api_tester.parser.json_parser import JSONParser
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_STRUCTURAL_CHARS = re.compile(r'[{}\[\]"]')
+_STRING_CHARS = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[\s,}\]]')
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    Parses JSON scenario files incrementally
+
+    The file is read in chunks of `chunk_size` characters and the top-level object is scanned without decoding
+    the test cases that are skipped over. Scanning stops as soon as `test_name` is found, so peak memory is
+    proportional to the requested test case instead of the whole file.
+    This is slower than `JSONParser` for small files, so it is only worth using for very large scenario files.
+
+    Note that if a test name appears more than once in a file, the first one is used.
+    """
+
+    chunk_size = 64 * 1024
+
+    @classmethod
+    def _load_test_case(cls, test_cases_file_path: str, test_name: str) -> Dict[str, Any]:
+        with open(test_cases_file_path, 'r') as f:
+            scanner = _JSONObjectScanner(f=f, chunk_size=cls.chunk_size)
+            for _, value in scanner.iter_items(is_wanted=lambda key: key == test_name):
+                test_case: Dict[str, Any] = json.loads(value)
+                return test_case
+
+        raise KeyError(test_name)
+
+    @classmethod
+    def _iter_test_cases(cls, test_cases_file_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with open(test_cases_file_path, 'r') as f:
+            scanner = _JSONObjectScanner(f=f, chunk_size=cls.chunk_size)
+            for test_name, value in scanner.iter_items(is_wanted=lambda key: True):
+                yield test_name, json.loads(value)
+
+
+class _JSONObjectScanner:
+    """
+    Scans the items of a top-level JSON object from a text stream.
+    Only the values of wanted keys are captured, everything else is skipped chunk by chunk.
+    """
+
+    def __init__(self, f: IO[str], chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def iter_items(self, is_wanted: Callable[[str], bool]) -> Iterator[Tuple[str, str]]:
+        """
+        Yields (key, raw JSON value) for each wanted item of the object
+        """
+
+        self._expect(char='{')
+        if self._peek() == '}':
+            return
+
+        while True:
+            key = self._read_key()
+            self._expect(char=':')
+            if not self._peek():
+                raise ValueError('Unexpected end of scenario file')
+            if is_wanted(key):
+                yield key, self._scan_value(capture=True)
+            else:
+                self._scan_value(capture=False)
+
+            char = self._peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f'Expected "," or "}}" at position {self.pos} of the scenario file')
+
+    def _fill(self, keep_from: int) -> bool:
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[keep_from:] + chunk
+        self.pos -= keep_from
+        return True
+
+    def _peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, or an empty string at the end of the stream
+        """
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(keep_from=self.pos):
+                return ''
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f'Expected "{char}" in the scenario file')
+        self.pos += 1
+
+    def _read_key(self) -> str:
+        if self._peek() != '"':
+            raise ValueError('Expected a test name in the scenario file')
+
+        while True:
+            try:
+                key, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(keep_from=self.pos):
+                    raise
+            else:
+                self.pos = end
+                assert isinstance(key, str)
+                return key
+
+    def _scan_value(self, capture: bool) -> str:
+        pieces: List[str] = []
+        start = self.pos
+
+        def fill() -> None:
+            nonlocal start
+            if capture:
+                pieces.append(self.buffer[start:])
+            if not self._fill(keep_from=len(self.buffer)):
+                raise ValueError('Unexpected end of scenario file')
+            start = 0
+
+        if self.buffer[self.pos] not in '{["':
+            # Scalars are short, so keep them in the buffer until they are complete
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.pos)
+                if match:
+                    self.pos = match.start()
+                    break
+                if not self._fill(keep_from=start):
+                    self.pos = len(self.buffer)
+                    break
+                start = 0
+            return self.buffer[start:self.pos] if capture else ''
+
+        depth = 0
+        in_string = False
+        escaped = False
+        while True:
+            if self.pos >= len(self.buffer):
+                fill()
+
+            if escaped:
+                self.pos += 1
+                escaped = False
+            elif in_string:
+                match = _STRING_CHARS.search(self.buffer, self.pos)
+                if not match:
+                    self.pos = len(self.buffer)
+                elif match.group() == '\\':
+                    self.pos = match.end()
+                    escaped = True
+                else:
+                    self.pos = match.end()
+                    in_string = False
+                    if depth == 0:
+                        break
+            else:
+                match = _STRUCTURAL_CHARS.search(self.buffer, self.pos)
+                if not match:
+                    self.pos = len(self.buffer)
+                    continue
+                self.pos = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in '{[':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        break
+
+        if capture:
+            pieces.append(self.buffer[start:self.pos])
+        return ''.join(pieces)
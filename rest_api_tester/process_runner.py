@@ -0,0 +1,189 @@
+import os
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.runner import RunSpec, TestCaseRunner
+from rest_api_tester.test import TestCase
+from rest_api_tester.utils import PathLike
+
+# A shard is a list of (index in the batch, spec)
+_Shard = List[Tuple[int, RunSpec]]
+
+# Shards are made several times smaller than an even split, so idle workers can pick up the remaining ones
+_SHARDS_PER_WORKER = 4
+
+# Built once per worker process by `_init_worker`
+_worker_runner: Union[TestCaseRunner, None] = None
+
+
+@dataclass
+class ProcessTestResult:
+    """
+    Compact result of a test run by `ProcessPoolTestCaseRunner`
+    """
+
+    path_to_test_cases: str
+    test_name: str
+    passed: bool
+    status_code: Union[int, None] = None
+    error: Union[str, None] = None
+    response: Union[ResponseData, None] = None
+    # Seconds spent in each phase of the test (see `rest_api_tester.timing`)
+    timings: Dict[str, float] = field(default_factory=dict)
+    __test__ = False
+
+
+class ProcessPoolTestCaseRunner:
+
+    __test__ = False
+
+    def __init__(
+        self,
+        client_factory: Callable[[], BaseTestClient],
+        path_to_scenarios_dir: str,
+        request_timeout: int = 10,
+        default_content_type: Union[str, None] = None,
+        max_workers: Union[int, None] = None
+    ):
+        """
+        Runs and verifies tests across a pool of worker processes
+
+        This is useful when verification is CPU-bound (e.g. large JSON responses), since threads are limited by the GIL.
+        Tests are split into small shards of tests from the same scenario file, so workers only read the scenario files
+        they need. There are several shards per worker, and idle workers pick up the remaining shards as they go, so
+        large or slow scenario files are spread across workers.
+
+        :param client_factory:
+            Function that returns a new test client.
+            It is called once in each worker process, so it must be picklable (e.g. a class or module-level function).
+        :param path_to_scenarios_dir:
+            Absolute path to the directory containing test case files
+        :param request_timeout:
+            In seconds
+        :param default_content_type:
+            If given, this will automatically be added to all test case request headers.
+            If a test case already includes a 'Content-Type' header, that will be used instead.
+        :param max_workers:
+            Number of worker processes. Defaults to the number of CPUs.
+        """
+
+        self.client_factory = client_factory
+        self.path_to_scenarios_dir = path_to_scenarios_dir
+        self.request_timeout = request_timeout
+        self.default_content_type = default_content_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run_many(
+        self,
+        specs: Sequence[RunSpec],
+        excluded_response_paths: Union[Sequence[PathLike], None] = None,
+        include_responses: bool = False
+    ) -> List[ProcessTestResult]:
+        """
+        Runs and verifies many tests in worker processes and returns their results in the same order as `specs`.
+        Tests are verified with `TestCase.verify_test_result` and the default verifier.
+        Note that any modifiers given in `specs` must be picklable.
+
+        :param specs:
+            The tests to run. See `TestCaseRunner.run` for details.
+        :param excluded_response_paths:
+            JSON paths to exclude from every response during verification.
+            See `TestCase.verify_test_result` for details.
+        :param include_responses:
+            If True, each result includes the full response.
+            This is disabled by default to keep the results sent back from workers small.
+        """
+
+        shards = _shard_specs(specs=specs, num_workers=self.max_workers)
+        results: List[Union[ProcessTestResult, None]] = [None] * len(specs)
+
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(shards))),
+            initializer=_init_worker,
+            initargs=(self.client_factory, self.path_to_scenarios_dir, self.request_timeout, self.default_content_type)
+        ) as executor:
+            futures = [
+                executor.submit(_run_shard, shard, excluded_response_paths, include_responses)
+                for shard in shards
+            ]
+            for future in futures:
+                for i, result in future.result():
+                    results[i] = result
+
+        return [result for result in results if result is not None]
+
+
+def _shard_specs(specs: Sequence[RunSpec], num_workers: int) -> List[_Shard]:
+    """
+    Groups specs by scenario file and splits the groups into shards of at most
+    len(specs) / (num_workers * _SHARDS_PER_WORKER) specs (rounded up), largest first.
+    A shard only holds specs from a single scenario file.
+    """
+
+    groups: Dict[str, _Shard] = {}
+    for i, spec in enumerate(specs):
+        groups.setdefault(spec.path_to_test_cases, []).append((i, spec))
+
+    max_shard_size = max(1, -(-len(specs) // (num_workers * _SHARDS_PER_WORKER)))
+    shards = [
+        group[start:start + max_shard_size]
+        for group in groups.values()
+        for start in range(0, len(group), max_shard_size)
+    ]
+    # Larger shards are started first, so the last ones to finish are small
+    shards.sort(key=len, reverse=True)
+
+    return shards
+
+
+def _init_worker(
+    client_factory: Callable[[], BaseTestClient],
+    path_to_scenarios_dir: str,
+    request_timeout: int,
+    default_content_type: Union[str, None]
+) -> None:
+    global _worker_runner
+    _worker_runner = TestCaseRunner(
+        client=client_factory(),
+        path_to_scenarios_dir=path_to_scenarios_dir,
+        request_timeout=request_timeout,
+        default_content_type=default_content_type
+    )
+
+
+def _run_shard(
+    shard: _Shard,
+    excluded_response_paths: Union[Sequence[PathLike], None],
+    include_responses: bool
+) -> List[Tuple[int, ProcessTestResult]]:
+    assert _worker_runner is not None
+    test_case = TestCase()
+
+    results = []
+    for i, spec in shard:
+        result = ProcessTestResult(
+            path_to_test_cases=spec.path_to_test_cases,
+            test_name=spec.test_name,
+            passed=False
+        )
+        try:
+            test_result = _worker_runner.run_spec(spec=spec)
+            result.status_code = test_result.response.status_code
+            result.timings = test_result.timings
+            if include_responses:
+                # Verification may rewrite the response text, so keep the original
+                result.response = copy.copy(test_result.response)
+            test_case.verify_test_result(result=test_result, excluded_response_paths=excluded_response_paths)
+        except AssertionError as e:
+            result.error = str(e)
+        except Exception as e:
+            result.error = f'{type(e).__name__}: {e}'
+        else:
+            result.passed = True
+        results.append((i, result))
+
+    return results
@@ -1,21 +1,167 @@
-from typing import Any, Union, Callable, cast, Dict, Type, List
+import time
+import asyncio
+import statistics
+from typing import Any, Union, Callable, Dict, Type, List, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
-from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.base_client import BaseTestClient, METHOD_HOOKS
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
 from rest_api_tester.test import TestResult, TestData
 from rest_api_tester.parser.base_parser import BaseParser
 from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.timing import PHASE_MODIFY, PHASE_PARSE, PHASE_REQUEST, TimingHook, record_timing
+from rest_api_tester.utils import JSONModifiers
 
 
-class TestCaseRunner:
+@dataclass
+class RunSpec:
+    """
+    The arguments of a single `TestCaseRunner.run` call, for batch APIs like `TestCaseRunner.run_many`.
+    See `TestCaseRunner.run` for details on each field.
+    """
+
+    path_to_test_cases: str
+    test_name: str
+    url_params: Union[Dict[str, Any], None] = None
+    file_parser: Type[BaseParser] = JSONParser
+    test_data_modifier: Union[Callable[[TestData], TestData], List[Callable[[TestData], TestData]], None] = None
+    request_json_modifiers: Union[JSONModifiers, None] = None
+    response_json_modifiers: Union[JSONModifiers, None] = None
+    request_header_modifiers: Union[JSONModifiers, None] = None
+    response_header_modifiers: Union[JSONModifiers, None] = None
+
+
+class BaseTestCaseRunner:
+    """
+    Logic shared by `TestCaseRunner` and `AsyncTestCaseRunner` for building the test data and requests of a test
+    """
 
     __test__ = False
 
+    path_to_scenarios_dir: str
+    request_timeout: int
+    default_content_type: Union[str, None]
+    timing_hook: Union[TimingHook, None]
+    latency_warmups: int
+    latency_samples: int
+
+    def _get_test_data(
+        self,
+        path_to_test_cases: str,
+        test_name: str,
+        url_params: Union[Dict[str, Any], None] = None,
+        file_parser: Type[BaseParser] = JSONParser,
+        test_data_modifier: Union[Callable[[TestData], TestData], List[Callable[[TestData], TestData]], None] = None,
+        request_json_modifiers: Union[JSONModifiers, None] = None,
+        response_json_modifiers: Union[JSONModifiers, None] = None,
+        request_header_modifiers: Union[JSONModifiers, None] = None,
+        response_header_modifiers: Union[JSONModifiers, None] = None,
+        timings: Union[Dict[str, float], None] = None
+    ) -> TestData:
+        timings = {} if timings is None else timings
+
+        start = time.perf_counter()
+        test_data = file_parser.parse(
+            path_to_scenarios_dir=self.path_to_scenarios_dir,
+            path_to_test_cases=path_to_test_cases,
+            test_name=test_name,
+            request_json_modifiers=request_json_modifiers,
+            response_json_modifiers=response_json_modifiers,
+            request_header_modifiers=request_header_modifiers,
+            response_header_modifiers=response_header_modifiers
+        )
+        # The time the parser spent applying JSON and header modifiers (if it reports it) counts as "modify"
+        modifier_seconds = test_data.modifier_seconds
+        parse_seconds = time.perf_counter() - start - modifier_seconds
+        self._record_seconds(timings=timings, phase=PHASE_PARSE, seconds=parse_seconds, test_data=test_data)
+
+        start = time.perf_counter() - modifier_seconds
+        test_data.response_json_modifiers = response_json_modifiers
+        test_data.response_header_modifiers = response_header_modifiers
+
+        test_data.headers = test_data.headers or {}
+        if self.default_content_type and 'content-type' not in test_data.headers:
+            test_data.headers['content-type'] = self.default_content_type
+
+        if url_params:
+            test_data.url = test_data.url.format(**url_params)
+
+        if test_data_modifier:
+            if isinstance(test_data_modifier, list):
+                for func in test_data_modifier:
+                    test_data = func(test_data)
+            else:
+                test_data = test_data_modifier(test_data)
+        self._record_timing(timings=timings, phase=PHASE_MODIFY, start=start, test_data=test_data)
+
+        return test_data
+
+    def _get_spec_test_data(self, spec: RunSpec, timings: Union[Dict[str, float], None] = None) -> TestData:
+        return self._get_test_data(
+            path_to_test_cases=spec.path_to_test_cases,
+            test_name=spec.test_name,
+            url_params=spec.url_params,
+            file_parser=spec.file_parser,
+            test_data_modifier=spec.test_data_modifier,
+            request_json_modifiers=spec.request_json_modifiers,
+            response_json_modifiers=spec.response_json_modifiers,
+            request_header_modifiers=spec.request_header_modifiers,
+            response_header_modifiers=spec.response_header_modifiers,
+            timings=timings
+        )
+
+    def _get_request(self, test_data: TestData) -> Dict[str, Any]:
+        """
+        Returns the keyword arguments of the client's `request` call for a test
+        """
+
+        method = test_data.method.upper()
+        if method not in METHOD_HOOKS:
+            raise ValueError('Unsupported HTTP method')
+
+        data = test_data.request_content
+        if data is None and test_data.request_data is not None:
+            data = test_data.request_data.encode('utf-8')
+        return {
+            'method': method,
+            'url': test_data.url,
+            'data': data,
+            'headers': test_data.headers,
+            'cookies': test_data.cookies,
+            'timeout': self.request_timeout,
+            'allow_redirects': test_data.allow_redirects
+        }
+
+    def _get_request_repeats(self, test_data: TestData) -> Tuple[int, int]:
+        """
+        Returns the number of (warm-up, timed) requests to make for a test.
+        Requests are only repeated for tests with a latency budget.
+        """
+
+        if test_data.max_latency_ms is None:
+            return 0, 1
+        return self.latency_warmups, max(1, self.latency_samples)
+
+    def _record_timing(self, timings: Dict[str, float], phase: str, start: float, test_data: TestData) -> None:
+        self._record_seconds(timings=timings, phase=phase, seconds=time.perf_counter() - start, test_data=test_data)
+
+    def _record_seconds(self, timings: Dict[str, float], phase: str, seconds: float, test_data: TestData) -> None:
+        record_timing(
+            timings=timings, phase=phase, seconds=seconds, test_data=test_data, timing_hook=self.timing_hook)
+
+
+class TestCaseRunner(BaseTestCaseRunner):
+
     def __init__(
         self,
         client: BaseTestClient,
         path_to_scenarios_dir: str,
         request_timeout: int = 10,
-        default_content_type: Union[str, None] = None
+        default_content_type: Union[str, None] = None,
+        timing_hook: Union[TimingHook, None] = None,
+        latency_warmups: int = 0,
+        latency_samples: int = 1
     ):
         """
         :param client:
@@ -27,12 +173,26 @@ class TestCaseRunner:
         :param default_content_type:
             If given, this will automatically be added to all test case request headers.
             If a test case already includes a 'Content-Type' header, that will be used instead.
+        :param timing_hook:
+            Function called with (test data, phase, seconds) each time a phase of a test finishes.
+            This can be used to export timings to a metrics system.
+            See `rest_api_tester.timing` for the phases. Timings are also available via `TestResult.timings`.
+        :param latency_warmups:
+            For tests with a latency budget (i.e. "max_latency_ms"), the number of untimed requests
+            to make before the timed ones
+        :param latency_samples:
+            For tests with a latency budget, the number of timed requests to make.
+            The median is used as the request time and the last response is verified.
+            Note that requests are repeated as-is, so only use this with idempotent requests.
         """
 
         self.client = client
         self.path_to_scenarios_dir = path_to_scenarios_dir
         self.request_timeout = request_timeout
         self.default_content_type = default_content_type
+        self.timing_hook = timing_hook
+        self.latency_warmups = latency_warmups
+        self.latency_samples = latency_samples
 
     def run(
         self,
@@ -41,10 +201,10 @@ class TestCaseRunner:
         url_params: Union[Dict[str, Any], None] = None,
         file_parser: Type[BaseParser] = JSONParser,
         test_data_modifier: Union[Callable[[TestData], TestData], List[Callable[[TestData], TestData]], None] = None,
-        request_json_modifiers: Union[Dict[str, Any], None] = None,
-        response_json_modifiers: Union[Dict[str, Any], None] = None,
-        request_header_modifiers: Union[Dict[str, Any], None] = None,
-        response_header_modifiers: Union[Dict[str, Any], None] = None
+        request_json_modifiers: Union[JSONModifiers, None] = None,
+        response_json_modifiers: Union[JSONModifiers, None] = None,
+        request_header_modifiers: Union[JSONModifiers, None] = None,
+        response_header_modifiers: Union[JSONModifiers, None] = None
     ) -> TestResult:
         """
         Runs a test and returns a TestResult
@@ -66,6 +226,7 @@ class TestCaseRunner:
             A dict of (JSON path => value) key-value pairs.
             The element(s) at each path in the request body JSON will be updated with the given value.
             See `rest_api_tester.utils.json_update` for more details.
+            Paths can also be compiled ahead of time via `rest_api_tester.utils.compile_path`.
             This can be used to modify values in the request JSON dynamically at runtime.
         :param response_json_modifiers:
             A dict of (JSON path => value) key-value pairs.
@@ -78,6 +239,7 @@ class TestCaseRunner:
             Similar to `response_json_modifiers` except for response headers
         """
 
+        timings: Dict[str, float] = {}
         test_data = self._get_test_data(
             path_to_test_cases=path_to_test_cases,
             test_name=test_name,
@@ -88,100 +250,202 @@ class TestCaseRunner:
             response_json_modifiers=response_json_modifiers,
             request_header_modifiers=request_header_modifiers,
             response_header_modifiers=response_header_modifiers,
+            timings=timings
         )
-        return self._run(test_data=test_data)
+        return self._run(test_data=test_data, timings=timings)
 
-    def _get_test_data(
+    def run_many(
+        self,
+        specs: Sequence[RunSpec],
+        max_workers: int = 8
+    ) -> List[Union[TestResult, Exception]]:
+        """
+        Runs many tests concurrently on a thread pool and returns their results in the same order as `specs`.
+        This is useful for I/O-bound suites, since requests to your server can overlap.
+        Note that your client must be thread-safe to use this.
+
+        If a test raises an exception, the exception is returned in place of its TestResult
+        and the rest of the batch still runs.
+
+        :param specs:
+            The tests to run. See `TestCaseRunner.run` for details.
+        :param max_workers:
+            Maximum number of tests to run at the same time
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.run_spec, spec) for spec in specs]
+
+        results: List[Union[TestResult, Exception]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def run_spec(self, spec: RunSpec) -> TestResult:
+        """
+        Runs a single test described by a RunSpec.
+        This is the same as calling `run` with the spec's fields.
+        """
+
+        timings: Dict[str, float] = {}
+        return self._run(test_data=self._get_spec_test_data(spec=spec, timings=timings), timings=timings)
+
+    def _run(self, test_data: TestData, timings: Dict[str, float]) -> TestResult:
+        request = self._get_request(test_data=test_data)
+        warmups, samples = self._get_request_repeats(test_data=test_data)
+        for _ in range(warmups):
+            self.client.request(**request)
+
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            response = self.client.request(**request)
+            durations.append(time.perf_counter() - start)
+        self._record_seconds(
+            timings=timings, phase=PHASE_REQUEST, seconds=statistics.median(durations), test_data=test_data)
+
+        return TestResult(
+            response=response,
+            test_data=test_data,
+            timings=timings
+        )
+
+
+class AsyncTestCaseRunner(BaseTestCaseRunner):
+
+    def __init__(
+        self,
+        client: AsyncBaseTestClient,
+        path_to_scenarios_dir: str,
+        request_timeout: int = 10,
+        default_content_type: Union[str, None] = None,
+        timing_hook: Union[TimingHook, None] = None,
+        latency_warmups: int = 0,
+        latency_samples: int = 1
+    ):
+        """
+        Async version of `TestCaseRunner`, which makes requests with an `AsyncBaseTestClient`.
+        Scenario files are parsed and modified exactly like `TestCaseRunner`.
+
+        :param client:
+            Async test client that will make requests to your server
+        :param path_to_scenarios_dir:
+            Absolute path to the directory containing test case files
+        :param request_timeout:
+            In seconds
+        :param default_content_type:
+            If given, this will automatically be added to all test case request headers.
+            If a test case already includes a 'Content-Type' header, that will be used instead.
+        :param timing_hook:
+            Function called with (test data, phase, seconds) each time a phase of a test finishes.
+            This can be used to export timings to a metrics system.
+            See `rest_api_tester.timing` for the phases. Timings are also available via `TestResult.timings`.
+        :param latency_warmups:
+            For tests with a latency budget (i.e. "max_latency_ms"), the number of untimed requests
+            to make before the timed ones
+        :param latency_samples:
+            For tests with a latency budget, the number of timed requests to make.
+            The median is used as the request time and the last response is verified.
+            Note that requests are repeated as-is, so only use this with idempotent requests.
+        """
+
+        self.client = client
+        self.path_to_scenarios_dir = path_to_scenarios_dir
+        self.request_timeout = request_timeout
+        self.default_content_type = default_content_type
+        self.timing_hook = timing_hook
+        self.latency_warmups = latency_warmups
+        self.latency_samples = latency_samples
+
+    async def run(
         self,
         path_to_test_cases: str,
         test_name: str,
         url_params: Union[Dict[str, Any], None] = None,
         file_parser: Type[BaseParser] = JSONParser,
         test_data_modifier: Union[Callable[[TestData], TestData], List[Callable[[TestData], TestData]], None] = None,
-        request_json_modifiers: Union[Dict[str, Any], None] = None,
-        response_json_modifiers: Union[Dict[str, Any], None] = None,
-        request_header_modifiers: Union[Dict[str, Any], None] = None,
-        response_header_modifiers: Union[Dict[str, Any], None] = None
-    ) -> TestData:
-        test_data = file_parser.parse(
-            path_to_scenarios_dir=self.path_to_scenarios_dir,
+        request_json_modifiers: Union[JSONModifiers, None] = None,
+        response_json_modifiers: Union[JSONModifiers, None] = None,
+        request_header_modifiers: Union[JSONModifiers, None] = None,
+        response_header_modifiers: Union[JSONModifiers, None] = None
+    ) -> TestResult:
+        """
+        Runs a test and returns a TestResult
+        See `TestCaseRunner.run` for details on each param.
+        """
+
+        timings: Dict[str, float] = {}
+        test_data = self._get_test_data(
             path_to_test_cases=path_to_test_cases,
             test_name=test_name,
+            url_params=url_params,
+            file_parser=file_parser,
+            test_data_modifier=test_data_modifier,
             request_json_modifiers=request_json_modifiers,
             response_json_modifiers=response_json_modifiers,
             request_header_modifiers=request_header_modifiers,
-            response_header_modifiers=response_header_modifiers
+            response_header_modifiers=response_header_modifiers,
+            timings=timings
         )
+        return await self._run(test_data=test_data, timings=timings)
 
-        test_data.response_json_modifiers = response_json_modifiers
-        test_data.response_header_modifiers = response_header_modifiers
+    async def run_many(
+        self,
+        specs: Sequence[RunSpec],
+        max_concurrency: int = 100
+    ) -> List[Union[TestResult, Exception]]:
+        """
+        Runs many tests concurrently on the current event loop and returns their results in the same order as `specs`.
 
-        test_data.headers = test_data.headers or {}
-        if self.default_content_type and 'content-type' not in test_data.headers:
-            test_data.headers['content-type'] = self.default_content_type
+        If a test raises an exception, the exception is returned in place of its TestResult
+        and the rest of the batch still runs.
 
-        if url_params:
-            test_data.url = test_data.url.format(**url_params)
+        :param specs:
+            The tests to run. See `TestCaseRunner.run` for details.
+        :param max_concurrency:
+            Maximum number of requests in flight at the same time
+        """
 
-        if test_data_modifier:
-            if isinstance(test_data_modifier, list):
-                for func in test_data_modifier:
-                    test_data = func(test_data)
-            else:
-                test_data = test_data_modifier(test_data)
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        return test_data
+        async def run_spec(spec: RunSpec) -> Union[TestResult, Exception]:
+            async with semaphore:
+                try:
+                    return await self.run_spec(spec=spec)
+                except Exception as e:
+                    return e
 
-    def _run(self, test_data: TestData) -> TestResult:
-        method = test_data.method.upper()
+        return list(await asyncio.gather(*(run_spec(spec) for spec in specs)))
 
-        if method == 'GET':
-            response = self.client.get(
-                url=test_data.url,
-                headers=test_data.headers,
-                cookies=test_data.cookies,
-                timeout=self.request_timeout,
-                allow_redirects=test_data.allow_redirects
-            )
-        elif method == 'POST':
-            response = self.client.post(
-                url=test_data.url,
-                headers=test_data.headers,
-                cookies=test_data.cookies,
-                data=cast(str, test_data.request_data),
-                timeout=self.request_timeout,
-                allow_redirects=test_data.allow_redirects
-            )
-        elif method == 'PUT':
-            response = self.client.put(
-                url=test_data.url,
-                headers=test_data.headers,
-                cookies=test_data.cookies,
-                data=cast(str, test_data.request_data),
-                timeout=self.request_timeout,
-                allow_redirects=test_data.allow_redirects
-            )
-        elif method == 'PATCH':
-            response = self.client.patch(
-                url=test_data.url,
-                headers=test_data.headers,
-                cookies=test_data.cookies,
-                data=cast(str, test_data.request_data),
-                timeout=self.request_timeout,
-                allow_redirects=test_data.allow_redirects
-            )
-        elif method == 'DELETE':
-            response = self.client.delete(
-                url=test_data.url,
-                headers=test_data.headers,
-                cookies=test_data.cookies,
-                timeout=self.request_timeout,
-                allow_redirects=test_data.allow_redirects
-            )
-        else:
-            raise ValueError('Unsupported HTTP method')
+    async def run_spec(self, spec: RunSpec) -> TestResult:
+        """
+        Runs a single test described by a RunSpec.
+        This is the same as calling `run` with the spec's fields.
+        """
+
+        timings: Dict[str, float] = {}
+        test_data = self._get_spec_test_data(spec=spec, timings=timings)
+        return await self._run(test_data=test_data, timings=timings)
+
+    async def _run(self, test_data: TestData, timings: Dict[str, float]) -> TestResult:
+        request = self._get_request(test_data=test_data)
+        warmups, samples = self._get_request_repeats(test_data=test_data)
+        for _ in range(warmups):
+            await self.client.request(**request)
+
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            response = await self.client.request(**request)
+            durations.append(time.perf_counter() - start)
+        self._record_seconds(
+            timings=timings, phase=PHASE_REQUEST, seconds=statistics.median(durations), test_data=test_data)
 
         return TestResult(
             response=response,
-            test_data=test_data
+            test_data=test_data,
+            timings=timings
         )
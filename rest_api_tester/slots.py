@@ -0,0 +1,37 @@
+from typing import Any, Callable, Type, TypeVar
+import dataclasses
+
+_T = TypeVar('_T')
+
+
+def add_slots(*extra_slots: str) -> Callable[[Type[_T]], Type[_T]]:
+    """
+    Class decorator that rebuilds a dataclass with `__slots__`, so instances don't carry a `__dict__`.
+    This is `@dataclass(slots=True)` for Python versions before 3.10.
+    It must be applied after (i.e. above) `@dataclass`, and the class's methods can't use zero-argument `super()`.
+
+    Fields backed by a property (inherited from a base class) don't get a slot, since the property stores them.
+
+    :param extra_slots:
+        Slots for attributes that aren't fields (e.g. caches)
+    """
+
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        field_names = tuple(f.name for f in dataclasses.fields(cls))  # type: ignore[arg-type]
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = tuple(
+            name for name in field_names if not isinstance(getattr(cls, name, None), property)
+        ) + extra_slots
+        # Class attributes hold the field defaults, which would conflict with the slots.
+        # The generated `__init__` already has them.
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+
+        metaclass: Any = type(cls)
+        slotted_cls: Type[_T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+        slotted_cls.__qualname__ = cls.__qualname__
+        return slotted_cls
+
+    return wrap
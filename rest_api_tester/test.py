@@ -1,13 +1,32 @@
-from typing import Any, Callable, Union, Dict, List
-from dataclasses import dataclass
+from typing import Any, Callable, Union, Dict, Sequence
+from dataclasses import dataclass, field
 import unittest
+import time
 import pprint
 import json
 
+from rest_api_tester.baseline import BaselineStore
 from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.json_diff import DEFAULT_MAX_MISMATCHES, format_mismatches, json_diff
+from rest_api_tester.parser.scenario_cache import SCENARIO_CACHE
 from rest_api_tester import utils
+from rest_api_tester.slots import add_slots
+from rest_api_tester.timing import PHASE_REQUEST, PHASE_VERIFY, TimingHook, record_timing
+from rest_api_tester.utils import JSONModifiers, PathLike
 
+JSONL_EXTENSION = '.jsonl'
 
+# TestData fields that are cached once parsed as JSON => name of their cache attribute
+_JSON_CACHE_NAMES = {
+    'request_data': '_request_data_json',
+    'expected_response': '_expected_response_json'
+}
+# Marks a JSON value that hasn't been parsed yet (None is valid JSON).
+# Cached values are removed rather than set to this, so pickled copies stay valid.
+_NOT_PARSED = object()
+
+
+@add_slots(*_JSON_CACHE_NAMES.values())
 @dataclass
 class TestData:
 
@@ -23,28 +42,82 @@ class TestData:
     expected_headers: Union[Dict[str, Any], None]
     description: Union[str, None]
     file_path: str
-    response_json_modifiers: Union[Dict[str, Any], None] = None
-    response_header_modifiers: Union[Dict[str, Any], None] = None
+    response_json_modifiers: Union[JSONModifiers, None] = None
+    response_header_modifiers: Union[JSONModifiers, None] = None
+    max_latency_ms: Union[float, None] = None
+    max_response_bytes: Union[int, None] = None
+    # Raw bodies of binary scenarios (e.g. "file::image.png"), which are never decoded.
+    # These take precedence over `request_data` and `expected_response`.
+    request_content: Union[bytes, None] = None
+    expected_response_content: Union[bytes, None] = None
+    # Seconds the parser spent applying JSON and header modifiers, which runners time under "modify".
+    # Custom parsers that apply modifiers can set this too, otherwise it counts as "parse".
+    modifier_seconds: float = field(default=0.0, compare=False, repr=False)
     __test__ = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        cache_name = _JSON_CACHE_NAMES.get(name)
+        if cache_name is not None:
+            try:
+                object.__delattr__(self, cache_name)
+            except AttributeError:
+                pass
+        object.__setattr__(self, name, value)
+
     @property
     def request_data_json(self) -> Any:
-        if not self.request_data:
-            return None
-        return json.loads(self.request_data)
+        """
+        The request data parsed as JSON.
+        It is only parsed once (until `request_data` is reassigned).
+        """
+
+        return self._get_json(name='request_data')
 
     @property
     def expected_response_json(self) -> Any:
-        if not self.expected_response:
-            return None
-        return json.loads(self.expected_response)
+        """
+        The expected response parsed as JSON.
+        It is only parsed once (until `expected_response` is reassigned).
+        """
+
+        return self._get_json(name='expected_response')
+
+    def set_request_data_json(self, value: Any, request_data: Union[str, None] = None) -> None:
+        """
+        Sets the request data to an already-decoded JSON value, so it doesn't need to be parsed again.
+        `value` is serialized unless `request_data` is given.
+        """
+
+        self.request_data = json.dumps(value) if request_data is None else request_data
+        object.__setattr__(self, _JSON_CACHE_NAMES['request_data'], value)
+
+    def set_expected_response_json(self, value: Any, expected_response: Union[str, None] = None) -> None:
+        """
+        Sets the expected response to an already-decoded JSON value, so it doesn't need to be parsed again.
+        `value` is serialized unless `expected_response` is given.
+        """
 
+        self.expected_response = json.dumps(value) if expected_response is None else expected_response
+        object.__setattr__(self, _JSON_CACHE_NAMES['expected_response'], value)
 
+    def _get_json(self, name: str) -> Any:
+        cache_name = _JSON_CACHE_NAMES[name]
+        parsed = getattr(self, cache_name, _NOT_PARSED)
+        if parsed is _NOT_PARSED:
+            text = getattr(self, name)
+            parsed = json.loads(text) if text else None
+            object.__setattr__(self, cache_name, parsed)
+        return parsed
+
+
+@add_slots()
 @dataclass
 class TestResult:
 
     response: ResponseData
     test_data: TestData
+    # Seconds spent in each phase of the test (see `rest_api_tester.timing`)
+    timings: Dict[str, float] = field(default_factory=dict)
     __test__ = False
 
 
@@ -61,13 +134,19 @@ class TestCase(unittest.TestCase):
         self.maxDiff = None
         self.update_scenarios_on_fail = False
         self.update_scenarios_on_fail_options = UpdateScenariosOnFailOptions()
+        # Called with (test data, phase, seconds) after verification (see `rest_api_tester.timing`)
+        self.timing_hook: Union[TimingHook, None] = None
+        # If set, passing tests are checked against (and added to) their performance baselines
+        self.baseline_store: Union[BaselineStore, None] = None
+        # Maximum number of JSON mismatches reported by `default_verifier` (None for all of them)
+        self.max_json_mismatches: Union[int, None] = DEFAULT_MAX_MISMATCHES
         super().__init__(methodName=methodName)
 
     def verify_test_result(
         self,
         result: TestResult,
         verifier: Union[Callable[[TestResult], None], None] = None,
-        excluded_response_paths: Union[List[str], None] = None,
+        excluded_response_paths: Union[Sequence[PathLike], None] = None,
         update_scenarios_on_fail: bool = False,
         update_scenarios_on_fail_options: Union[UpdateScenariosOnFailOptions, None] = None
     ) -> None:
@@ -84,6 +163,7 @@ class TestCase(unittest.TestCase):
             A list of JSON paths that define which elements of the actual response body will be
             excluded during verification.
             See `rest_api_tester.utils.json_remove` for more details.
+            Paths can also be compiled ahead of time via `rest_api_tester.utils.compile_path`.
         :param update_scenarios_on_fail:
             If True, scenario files will automatically be updated when tests fail.
             This can be useful if you want to quickly set up your test scenarios.
@@ -104,35 +184,32 @@ class TestCase(unittest.TestCase):
         expected_status = result.test_data.expected_status
         expected_response = result.test_data.expected_response
         actual_status = result.response.status_code
-        actual_response = result.response.text
+        # The failure message shows the responses before excluded paths are replaced
+        actual_response = result.response.text if excluded_response_paths else None
+
+        start = time.perf_counter()
+        # Measured before excluded paths are replaced
+        measure_size = result.test_data.max_response_bytes is not None or self.baseline_store is not None
+        response_bytes = result.response.size if measure_size else None
 
         if excluded_response_paths:
             placeholder_text = update_scenarios_on_fail_options.placeholder_text
             actual_response_dict = result.response.json
             expected_response_dict = result.test_data.expected_response_json
-            for excluded_response_path in excluded_response_paths:
-                actual_response_dict = utils.json_update(
-                    j=actual_response_dict, path=excluded_response_path, value=placeholder_text)
-                expected_response_dict = utils.json_update(
-                    j=expected_response_dict, path=excluded_response_path, value=placeholder_text)
-            result.response.text = json.dumps(actual_response_dict)
-            result.test_data.expected_response = json.dumps(expected_response_dict)
+            placeholders = dict.fromkeys(excluded_response_paths, placeholder_text)
+            # Others may hold on to the memoized JSON (e.g. timing hooks or recording clients), so it's not modified
+            actual_response_dict = utils.json_update_many(
+                j=actual_response_dict, updates=placeholders, copy=utils.COPY_PATH)
+            expected_response_dict = utils.json_update_many(
+                j=expected_response_dict, updates=placeholders, copy=utils.COPY_PATH)
+            result.response.set_json(value=actual_response_dict)
+            result.test_data.set_expected_response_json(value=expected_response_dict)
 
         try:
             # Check status
-            message = [
-                '',
-                'Expected Response:',
-                self._format_response(response=expected_response),
-                '',
-                'Actual Response:',
-                self._format_response(response=actual_response),
-                ''
-            ]
-            if result.test_data.description:
-                message = ['', f'Test Description: {result.test_data.description}', ''] + message
-            message_str = '\n'.join(message)
-            self.assertEqual(expected_status, actual_status, message_str)
+            response_message = _LazyMessage(lambda: self._get_response_message(
+                result=result, expected_response=expected_response, actual_response=actual_response))
+            self.assertEqual(expected_status, actual_status, response_message)
 
             # Check response body
             verifier = verifier or self.default_verifier
@@ -147,10 +224,44 @@ class TestCase(unittest.TestCase):
                     message = ['', f'Test Description: {result.test_data.description}', ''] + message
                 self.assertDictEqual(expected_headers, dict(actual_headers), '\n'.join(message))
         except Exception:
+            self._record_verify_timing(result=result, start=start)
             if update_scenarios_on_fail:
                 self._update_scenario(result=result, options=update_scenarios_on_fail_options)
             raise
 
+        self._record_verify_timing(result=result, start=start)
+        self._verify_budgets(result=result, response_bytes=response_bytes)
+        self._verify_baseline(result=result, response_bytes=response_bytes)
+
+    def _get_response_message(
+        self,
+        result: TestResult,
+        expected_response: Union[str, None],
+        actual_response: Union[str, None]
+    ) -> str:
+        """
+        Returns the failure message comparing the expected and actual responses
+
+        :param actual_response:
+            The actual response body, if it shouldn't be read from `result`
+        """
+
+        if actual_response is None:
+            actual_response = result.response.text
+
+        message = [
+            '',
+            'Expected Response:',
+            self._format_response(response=expected_response),
+            '',
+            'Actual Response:',
+            self._format_response(response=actual_response),
+            ''
+        ]
+        if result.test_data.description:
+            message = ['', f'Test Description: {result.test_data.description}', ''] + message
+        return '\n'.join(message)
+
     def default_verifier(self, result: TestResult) -> None:
         response_content_type = (
             result.response.headers.get('Content-Type') or
@@ -158,18 +269,96 @@ class TestCase(unittest.TestCase):
             result.response.headers.get('CONTENT-TYPE')
         )
 
+        expected_content = result.test_data.expected_response_content
+        if expected_content is not None:
+            self.assertEqual(expected_content, result.response.content)
+            return
+
         expected_response = result.test_data.expected_response
         if expected_response:
             if 'application/json' in (response_content_type or ''):
                 actual_response = result.response.json
-                if isinstance(actual_response, list):
-                    self.assertListEqual(json.loads(expected_response), actual_response)
-                elif isinstance(actual_response, dict):
-                    self.assertDictEqual(json.loads(expected_response), actual_response)
+                if isinstance(actual_response, (list, dict)):
+                    self.assert_json_equal(result.test_data.expected_response_json, actual_response, result=result)
             else:
                 actual_response = result.response.text
                 self.assertEqual(expected_response, actual_response)
 
+    def assert_json_equal(self, expected: Any, actual: Any, result: Union[TestResult, None] = None) -> None:
+        """
+        Asserts that two JSON values are equal.
+        Unlike `assertDictEqual`, this doesn't diff pretty-printed documents, and only reports the paths that
+        differ (up to `self.max_json_mismatches`), so it stays fast and readable for large responses.
+
+        :param expected:
+            Expected JSON value
+        :param actual:
+            Actual JSON value
+        :param result:
+            The test case result, if any, to include its description in the message
+        """
+
+        max_mismatches = self.max_json_mismatches
+        # One more than is reported, to tell whether the list is truncated
+        mismatches = json_diff(
+            expected=expected, actual=actual, max_mismatches=max_mismatches + 1 if max_mismatches is not None else None)
+        if not mismatches:
+            return
+
+        truncated = max_mismatches is not None and len(mismatches) > max_mismatches
+        message = ['', format_mismatches(mismatches=mismatches[:max_mismatches], truncated=truncated), '']
+        if result is not None and result.test_data.description:
+            message = ['', f'Test Description: {result.test_data.description}', ''] + message
+        self.fail('\n'.join(message))
+
+    def _verify_budgets(self, result: TestResult, response_bytes: Union[int, None]) -> None:
+        """
+        Verifies the test's latency and response size budgets, if any
+        """
+
+        test_data = result.test_data
+        failures = []
+
+        request_seconds = result.timings.get(PHASE_REQUEST)
+        if test_data.max_latency_ms is not None and request_seconds is not None:
+            latency_ms = request_seconds * 1000
+            if latency_ms > test_data.max_latency_ms:
+                failures.append(f'Latency of {latency_ms:.1f} ms exceeds the budget of {test_data.max_latency_ms} ms')
+
+        max_response_bytes = test_data.max_response_bytes
+        if max_response_bytes is not None and response_bytes is not None and response_bytes > max_response_bytes:
+            failures.append(f'Response size of {response_bytes} bytes exceeds the budget of {max_response_bytes} bytes')
+
+        if failures:
+            message = ['', 'Performance budget exceeded:'] + failures + ['']
+            if test_data.description:
+                message = ['', f'Test Description: {test_data.description}', ''] + message
+            self.fail('\n'.join(message))
+
+    def _verify_baseline(self, result: TestResult, response_bytes: Union[int, None]) -> None:
+        """
+        Verifies that the test's latency and response size haven't regressed from its baseline, if any
+        """
+
+        if self.baseline_store is None:
+            return
+
+        regressions = self.baseline_store.check_and_record(result=result, response_bytes=response_bytes)
+        if regressions:
+            message = ['', 'Performance regressed from baseline:'] + [str(r) for r in regressions] + ['']
+            if result.test_data.description:
+                message = ['', f'Test Description: {result.test_data.description}', ''] + message
+            self.fail('\n'.join(message))
+
+    def _record_verify_timing(self, result: TestResult, start: float) -> None:
+        record_timing(
+            timings=result.timings,
+            phase=PHASE_VERIFY,
+            seconds=time.perf_counter() - start,
+            test_data=result.test_data,
+            timing_hook=self.timing_hook
+        )
+
     @staticmethod
     def _update_scenario(result: TestResult, options: UpdateScenariosOnFailOptions) -> None:
         actual_response = result.response.text
@@ -178,41 +367,68 @@ class TestCase(unittest.TestCase):
 
         print(f'\n\nUpdating test scenario {result.test_data.file_path}::{result.test_data.name}')
 
-        with open(result.test_data.file_path, 'r') as f:
-            scenarios = json.loads(f.read())
-            scenario = scenarios[result.test_data.name]
-            scenario['status'] = actual_status
-            if options.update_headers:
-                if result.test_data.response_header_modifiers:
-                    for response_path in result.test_data.response_header_modifiers.keys():
-                        actual_headers = utils.json_update(
-                            j=actual_headers, path=response_path, value=options.placeholder_text)
-
-                scenario['response_headers'] = actual_headers
-
-            if actual_response:
-                # TODO: Use case-insensitive dict instead?
-                content_type = (
-                    actual_headers.get('Content-Type') or
-                    actual_headers.get('content-type') or
-                    actual_headers.get('CONTENT-TYPE')
+        scenarios = TestCase._read_scenarios(file_path=result.test_data.file_path)
+        scenario = scenarios[result.test_data.name]
+        scenario['status'] = actual_status
+        if options.update_headers:
+            if result.test_data.response_header_modifiers:
+                actual_headers = utils.json_update_many(
+                    j=actual_headers,
+                    updates={path: options.placeholder_text for path in result.test_data.response_header_modifiers},
+                    copy=utils.COPY_PATH
                 )
-                if 'application/json' in (content_type or ''):
-                    if result.test_data.response_json_modifiers:
-                        actual_response_dict = json.loads(actual_response)
-                        for response_path in result.test_data.response_json_modifiers.keys():
-                            actual_response_dict = utils.json_update(
-                                j=actual_response_dict, path=response_path, value=options.placeholder_text)
-                        actual_response = json.dumps(actual_response_dict)
-
-                    scenario['response'] = json.loads(actual_response)
-                else:
-                    scenario['response'] = actual_response
+
+            scenario['response_headers'] = actual_headers
+
+        if actual_response:
+            # TODO: Use case-insensitive dict instead?
+            content_type = (
+                actual_headers.get('Content-Type') or
+                actual_headers.get('content-type') or
+                actual_headers.get('CONTENT-TYPE')
+            )
+            if 'application/json' in (content_type or ''):
+                if result.test_data.response_json_modifiers:
+                    # Freshly parsed, so it can be modified in place
+                    actual_response_dict = json.loads(actual_response)
+                    actual_response_dict = utils.json_update_many(
+                        j=actual_response_dict,
+                        updates={path: options.placeholder_text for path in result.test_data.response_json_modifiers},
+                        copy=utils.COPY_NONE
+                    )
+                    actual_response = json.dumps(actual_response_dict)
+
+                scenario['response'] = json.loads(actual_response)
             else:
-                scenario.pop('response', None)
+                scenario['response'] = actual_response
+        else:
+            scenario.pop('response', None)
+
+        TestCase._write_scenarios(file_path=result.test_data.file_path, scenarios=scenarios)
+        SCENARIO_CACHE.invalidate(file_path=result.test_data.file_path)
 
-        with open(result.test_data.file_path, 'w+') as f:
-            f.write(json.dumps(scenarios, indent=4) + '\n')
+    @staticmethod
+    def _read_scenarios(file_path: str) -> Dict[str, Any]:
+        with open(file_path, 'r') as f:
+            if not file_path.endswith(JSONL_EXTENSION):
+                scenarios: Dict[str, Any] = json.loads(f.read())
+                return scenarios
+
+            scenarios = {}
+            for line in f:
+                if line.strip():
+                    scenarios.update(json.loads(line))
+            return scenarios
+
+    @staticmethod
+    def _write_scenarios(file_path: str, scenarios: Dict[str, Any]) -> None:
+        with open(file_path, 'w+') as f:
+            if not file_path.endswith(JSONL_EXTENSION):
+                f.write(json.dumps(scenarios, indent=4) + '\n')
+                return
+
+            for name, scenario in scenarios.items():
+                f.write(json.dumps({name: scenario}) + '\n')
 
     @staticmethod
     def _format_response(response: Union[str, None]) -> Any:
@@ -223,3 +439,20 @@ class TestCase(unittest.TestCase):
             return pprint.pformat(json.loads(response))  # type: ignore
         except Exception:
             return response
+
+
+class _LazyMessage:
+    """
+    An assertion message that is only built if the assertion fails (i.e. when it's formatted)
+    """
+
+    __slots__ = ('_build', '_message')
+
+    def __init__(self, build: Callable[[], str]):
+        self._build = build
+        self._message: Union[str, None] = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._build()
+        return self._message
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING, Callable, Dict, Union
+
+if TYPE_CHECKING:
+    from rest_api_tester.test import TestData
+
+# Timed phases of a test, in the order they run
+PHASE_PARSE = 'parse'
+# JSON and header modifiers (as reported by the parser), URL params, default content type and test data modifiers
+PHASE_MODIFY = 'modify'
+PHASE_REQUEST = 'request'
+PHASE_VERIFY = 'verify'
+
+# Called with (test data, phase, seconds) each time a phase finishes
+TimingHook = Callable[['TestData', str, float], None]
+
+
+def record_timing(
+    timings: Dict[str, float],
+    phase: str,
+    seconds: float,
+    test_data: 'TestData',
+    timing_hook: Union[TimingHook, None]
+) -> None:
+    """
+    Records the seconds spent in a phase and passes them to the hook, if any
+    """
+
+    timings[phase] = seconds
+    if timing_hook is not None:
+        timing_hook(test_data, phase, seconds)
@@ -1,11 +1,194 @@
-from typing import Any
+from typing import Any, Dict, Iterable, List, Tuple, Union
+import functools
 import json
 
+# Copy modes for `json_update` and `json_remove`
+COPY_DEEP = 'deep'
+COPY_PATH = 'path'
+COPY_NONE = 'none'
 
-def json_remove(j: Any, path: str) -> Any:
+# A compiled path token is (is "*" token, key). Index tokens have int keys and key tokens have str keys.
+_Token = Tuple[bool, Union[str, int]]
+
+
+class JSONPath:
+
+    def __init__(self, path: str):
+        """
+        A parsed JSON path that can be applied to many JSON objects without being re-parsed.
+        See `json_update` and `json_remove` for the path format.
+        Prefer `compile_path` over creating these directly, since it caches compiled paths.
+
+        :param path:
+            A string that specifies which JSON elements to select
+        """
+
+        if not path:
+            raise Exception('Path cannot be empty')
+
+        self.path = path
+        self.tokens = self._tokenize(path=path)
+
+    def update(self, j: Any, value: Any, copy: str = COPY_DEEP) -> Any:
+        """
+        See `json_update`
+        """
+
+        return self._apply(j=j, value=value, remove=False, copy=copy)
+
+    def remove(self, j: Any, copy: str = COPY_DEEP) -> Any:
+        """
+        See `json_remove`
+        """
+
+        return self._apply(j=j, value=None, remove=True, copy=copy)
+
+    def _apply(self, j: Any, value: Any, remove: bool, copy: str) -> Any:
+        if copy == COPY_PATH:
+            return self._apply_path_copy(j=j, index=0, value=value, remove=remove)
+
+        if copy == COPY_DEEP:
+            j = json.loads(json.dumps(j))
+        elif copy != COPY_NONE:
+            raise ValueError(f'Invalid copy mode: {copy}')
+
+        self._apply_in_place(j=j, value=value, remove=remove)
+        return j
+
+    def _apply_in_place(self, j: Any, value: Any, remove: bool) -> None:
+        for _, key in self.tokens[:-1]:
+            if not _matches(j=j, key=key, remove=True):
+                return
+            j = j[key]
+
+        is_star, key = self.tokens[-1]
+        if not is_star:
+            if _matches(j=j, key=key, remove=remove):
+                _apply_key(j=j, key=key, value=value, remove=remove)
+        elif isinstance(j, list):
+            for item in j:
+                if _matches(j=item, key=key, remove=remove):
+                    _apply_key(j=item, key=key, value=value, remove=remove)
+
+    def _apply_path_copy(self, j: Any, index: int, value: Any, remove: bool) -> Any:
+        is_star, key = self.tokens[index]
+        if index < len(self.tokens) - 1:
+            if not _matches(j=j, key=key, remove=True):
+                return j
+            child = self._apply_path_copy(j=j[key], index=index + 1, value=value, remove=remove)
+            if child is j[key]:
+                return j
+            j = _shallow_copy(j)
+            j[key] = child
+            return j
+
+        if not is_star:
+            if not _matches(j=j, key=key, remove=remove):
+                return j
+            j = _shallow_copy(j)
+            _apply_key(j=j, key=key, value=value, remove=remove)
+            return j
+
+        if not isinstance(j, list):
+            return j
+        new_j = j
+        for i, item in enumerate(j):
+            if _matches(j=item, key=key, remove=remove):
+                if new_j is j:
+                    new_j = list(j)
+                item = _shallow_copy(item)
+                _apply_key(j=item, key=key, value=value, remove=remove)
+                new_j[i] = item
+        return new_j
+
+    @staticmethod
+    def _tokenize(path: str) -> Tuple[_Token, ...]:
+        tokens: List[_Token] = []
+        raw_tokens = path.split('.')
+        for i, token in enumerate(raw_tokens):
+            is_star = token.startswith('*')
+            if is_star:
+                if i != len(raw_tokens) - 1:
+                    raise Exception('* must only be used as the final token of a path')
+                if len(token) == 1:
+                    raise Exception('* must be followed by a key or index')
+                token = token[1:]
+
+            if token.startswith('['):
+                tokens.append((is_star, int(token[1:-1])))
+            else:
+                tokens.append((is_star, token))
+        return tuple(tokens)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JSONPath) and self.path == other.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f'JSONPath({self.path!r})'
+
+
+def _matches(j: Any, key: Union[str, int], remove: bool) -> bool:
+    """
+    Returns True if `key` can be updated in (or removed from, if `remove` is True) the container `j`
+    """
+
+    if isinstance(key, int):
+        return isinstance(j, list) and -len(j) <= key < len(j)
+    return isinstance(j, dict) and (not remove or key in j)
+
+
+def _apply_key(j: Any, key: Union[str, int], value: Any, remove: bool) -> None:
+    if remove:
+        del j[key]
+    else:
+        j[key] = value
+
+
+def _shallow_copy(j: Any) -> Any:
+    return list(j) if isinstance(j, list) else dict(j)
+
+
+# A JSON path string or an already compiled JSONPath
+PathLike = Union[str, JSONPath]
+
+# (JSON path => value) modifiers, as accepted by `TestCaseRunner.run`.
+# Keys are JSON path strings or compiled JSONPaths (typed as Any since dicts with mixed keys are allowed).
+JSONModifiers = Dict[Any, Any]
+
+
+def compile_path(path: PathLike) -> JSONPath:
+    """
+    Parses a JSON path once so it can be applied many times.
+    Compiled paths can be used anywhere a JSON path string is accepted (e.g. `json_update` and modifier dicts).
+    String paths are also compiled through this function, so recently used paths are cached.
+
+    :param path:
+        A string that specifies which JSON elements to select.
+        See `json_update` and `json_remove` for the format.
+    :return:
+        compiled JSONPath
+    """
+
+    if isinstance(path, JSONPath):
+        return path
+    return _compile_path(path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path: str) -> JSONPath:
+    return JSONPath(path=path)
+
+
+def json_remove(j: Any, path: PathLike, copy: str = COPY_DEEP) -> Any:
     """
     Removes elements of JSON that match a specific path.
-    This returns a brand new JSON object.
+    By default, this returns a brand new JSON object (see `copy`).
 
     If there are no matches, nothing is removed and no exception is raised.
 
@@ -23,71 +206,24 @@ def json_remove(j: Any, path: str) -> Any:
     :param j:
         json (list or dict)
     :param path:
-        A string that specifies what should be removed from the JSON
+        A string (or compiled JSONPath, see `compile_path`) that specifies what should be removed from the JSON
+    :param copy:
+        How the input JSON is copied before it is modified:
+        - COPY_DEEP ("deep") => The entire JSON object is deep-copied first. The input is never modified.
+        - COPY_PATH ("path") => Only the dicts/lists along the modified path(s) are copied. The input is never
+          modified, but unmodified elements are shared between the input and the result.
+        - COPY_NONE ("none") => Nothing is copied and the input is modified in place.
     :return:
-        new JSON object with elements removed
+        JSON object with elements removed
     """
 
-    if not path:
-        raise Exception('Path cannot be empty')
-
-    tokens = path.split('.')
-
-    j = json.loads(json.dumps(j))
-    orig = j
-
-    for token in tokens[:-1]:
-        if token.startswith('['):
-            i = int(token[1:-1])
-            try:
-                j = j[i]
-            except Exception:
-                break
-        elif token.startswith('*'):
-            raise Exception('* must only be used as the final token of a path')
-        else:
-            try:
-                j = j[token]
-            except Exception:
-                break
-    else:
-        token = tokens[-1]
-        if token.startswith('['):
-            i = int(token[1:-1])
-            try:
-                if isinstance(j, list):
-                    del j[i]
-            except Exception:
-                pass
-        elif token.startswith('*'):
-            if isinstance(j, list):
-                if token[1] == '[':
-                    i = int(token[2:-1])
-                    for item in j:
-                        try:
-                            if isinstance(item, list):
-                                del item[i]
-                        except Exception:
-                            pass
-                else:
-                    token = token[1:]
-                    for item in j:
-                        if isinstance(item, dict):
-                            if token in item:
-                                del item[token]
-        else:
-            try:
-                del j[token]
-            except Exception:
-                pass
-
-    return orig
+    return compile_path(path=path).remove(j=j, copy=copy)
 
 
-def json_update(j: Any, path: str, value: Any) -> Any:
+def json_update(j: Any, path: PathLike, value: Any, copy: str = COPY_DEEP) -> Any:
     """
     Updates elements of JSON that match a specific path.
-    This returns a brand new JSON object.
+    By default, this returns a brand new JSON object (see `copy`).
 
     If there are no matches, nothing is updated/added and no exception is raised.
 
@@ -107,63 +243,184 @@ def json_update(j: Any, path: str, value: Any) -> Any:
     :param j:
         json (list or dict)
     :param path:
-        A string that specifies what should be removed from the JSON
+        A string (or compiled JSONPath, see `compile_path`) that specifies what should be updated in the JSON
     :param value:
         The value to set for the element(s) specified by `path`
+    :param copy:
+        How the input JSON is copied before it is modified:
+        - COPY_DEEP ("deep") => The entire JSON object is deep-copied first. The input is never modified.
+        - COPY_PATH ("path") => Only the dicts/lists along the modified path(s) are copied. The input is never
+          modified, but unmodified elements are shared between the input and the result.
+        - COPY_NONE ("none") => Nothing is copied and the input is modified in place.
     :return:
-        new JSON object with elements updated
+        JSON object with elements updated
     """
 
-    if not path:
-        raise Exception('Path cannot be empty')
-
-    tokens = path.split('.')
-
-    j = json.loads(json.dumps(j))
-    orig = j
-
-    for token in tokens[:-1]:
-        if token.startswith('['):
-            i = int(token[1:-1])
-            try:
-                j = j[i]
-            except Exception:
-                break
-        elif token.startswith('*'):
-            raise Exception('* must only be used as the final token of a path')
-        else:
-            try:
-                j = j[token]
-            except Exception:
-                break
-    else:
-        token = tokens[-1]
-        if token.startswith('['):
-            i = int(token[1:-1])
-            try:
+    return compile_path(path=path).update(j=j, value=value, copy=copy)
+
+
+def json_update_many(j: Any, updates: JSONModifiers, copy: str = COPY_DEEP) -> Any:
+    """
+    Updates elements of JSON for many paths at once.
+    This gives the same result as calling `json_update` for each (path => value) pair in order,
+    but the paths are merged into a trie and applied in a single traversal with (at most) a single copy.
+    Only the order of newly added dict keys may differ.
+
+    :param j:
+        json (list or dict)
+    :param updates:
+        A dict of (JSON path => value) pairs. See `json_update` for the path format.
+    :param copy:
+        See `json_update`
+    :return:
+        JSON object with elements updated
+    """
+
+    trie = _PathTrie(remove=False)
+    for path, value in updates.items():
+        trie.add(path=path, value=value)
+    return trie.apply(j=j, copy=copy)
+
+
+def json_remove_many(j: Any, paths: Iterable[PathLike], copy: str = COPY_DEEP) -> Any:
+    """
+    Removes elements of JSON for many paths at once.
+    This gives the same result as calling `json_remove` for each path in order,
+    but the paths are merged into a trie and applied in a single traversal with (at most) a single copy.
+    Only the order of newly added dict keys may differ.
+
+    :param j:
+        json (list or dict)
+    :param paths:
+        JSON paths to remove. See `json_remove` for the path format.
+    :param copy:
+        See `json_remove`
+    :return:
+        JSON object with elements removed
+    """
+
+    trie = _PathTrie(remove=True)
+    for path in paths:
+        trie.add(path=path, value=None)
+    return trie.apply(j=j, copy=copy)
+
+
+class _PathTrieNode:
+
+    __slots__ = ('is_star', 'key', 'has_value', 'value', 'children')
+
+    def __init__(self, is_star: bool, key: Union[str, int]):
+        self.is_star = is_star
+        self.key = key
+        self.has_value = False
+        self.value: Any = None
+        self.children: List[_PathTrieNode] = []
+
+
+class _PathTrie:
+    """
+    Merges JSON paths that share a prefix so they can be applied in one traversal.
+
+    Each node's children are kept in insertion order and applied in that order.
+    A later path only reuses an existing child node if no child that could affect the same elements
+    (a "*" token, a removed list index, which shifts the list, or an index with the opposite sign) was added after it.
+    Otherwise a new child node is added, which keeps the result identical to applying the paths one by one.
+    """
+
+    def __init__(self, remove: bool):
+        self.remove = remove
+        self.root: List[_PathTrieNode] = []
+
+    def add(self, path: PathLike, value: Any) -> None:
+        tokens = compile_path(path=path).tokens
+        children = self.root
+        for i, (is_star, key) in enumerate(tokens):
+            is_last = i == len(tokens) - 1
+            node = None if is_star else self._find_reusable(children=children, key=key)
+            if is_last and self.remove and isinstance(key, int) and node is not None and node is not children[-1]:
+                # Removing a list index shifts the list, so it must happen after everything added before it
+                node = None
+            if node is None:
+                node = _PathTrieNode(is_star=is_star, key=key)
+                children.append(node)
+
+            if is_last:
+                # Setting or removing an element supersedes anything done to it before
+                node.has_value = True
+                node.value = value
+                node.children = []
+            children = node.children
+
+    def apply(self, j: Any, copy: str) -> Any:
+        if copy == COPY_PATH:
+            return self._apply_path_copy(j=j, children=self.root)
+
+        if copy == COPY_DEEP:
+            j = json.loads(json.dumps(j))
+        elif copy != COPY_NONE:
+            raise ValueError(f'Invalid copy mode: {copy}')
+
+        self._apply_in_place(j=j, children=self.root)
+        return j
+
+    def _find_reusable(self, children: List[_PathTrieNode], key: Union[str, int]) -> Union[_PathTrieNode, None]:
+        for node in reversed(children):
+            if node.is_star:
+                return None
+            if isinstance(node.key, int):
+                if self.remove and node.has_value:
+                    return None
+                if isinstance(key, int) and node.key != key and (node.key < 0) != (key < 0):
+                    # e.g. [-1] and [2] may be the same element
+                    return None
+            if node.key == key and type(node.key) is type(key):
+                return node
+        return None
+
+    @staticmethod
+    def _value(node: _PathTrieNode) -> Any:
+        # Later paths may modify a value after it has been set, so the caller's object is copied first
+        if isinstance(node.value, (dict, list)):
+            return json.loads(json.dumps(node.value))
+        return node.value
+
+    def _apply_in_place(self, j: Any, children: List[_PathTrieNode]) -> None:
+        for node in children:
+            if node.is_star:
                 if isinstance(j, list):
-                    j[i] = value
-            except Exception:
-                pass
-        elif token.startswith('*'):
-            if isinstance(j, list):
-                if token[1] == '[':
-                    i = int(token[2:-1])
-                    for item in j:
-                        try:
-                            if isinstance(item, list):
-                                item[i] = value
-                        except Exception:
-                            pass
-                else:
-                    token = token[1:]
                     for item in j:
-                        if isinstance(item, dict):
-                            item[token] = value
-        else:
-            try:
-                j[token] = value
-            except Exception:
-                pass
-
-    return orig
+                        if _matches(j=item, key=node.key, remove=self.remove):
+                            _apply_key(j=item, key=node.key, value=self._value(node=node), remove=self.remove)
+                continue
+
+            if node.has_value and _matches(j=j, key=node.key, remove=self.remove):
+                _apply_key(j=j, key=node.key, value=self._value(node=node), remove=self.remove)
+            if node.children and _matches(j=j, key=node.key, remove=True):
+                self._apply_in_place(j=j[node.key], children=node.children)
+
+    def _apply_path_copy(self, j: Any, children: List[_PathTrieNode]) -> Any:
+        copied = False
+        for node in children:
+            if node.is_star:
+                if isinstance(j, list):
+                    for i, item in enumerate(j):
+                        if _matches(j=item, key=node.key, remove=self.remove):
+                            if not copied:
+                                j, copied = list(j), True
+                            item = _shallow_copy(item)
+                            _apply_key(j=item, key=node.key, value=node.value, remove=self.remove)
+                            j[i] = item
+                continue
+
+            if node.has_value and _matches(j=j, key=node.key, remove=self.remove):
+                if not copied:
+                    j, copied = _shallow_copy(j), True
+                _apply_key(j=j, key=node.key, value=node.value, remove=self.remove)
+            if node.children and _matches(j=j, key=node.key, remove=True):
+                child = j[node.key]
+                new_child = self._apply_path_copy(j=child, children=node.children)
+                if new_child is not child:
+                    if not copied:
+                        j, copied = _shallow_copy(j), True
+                    j[node.key] = new_child
+        return j
@@ -35,5 +35,9 @@ setup(
         'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11'
     ],
+    extras_require={
+        'httpx': ['httpx'],
+        'http2': ['httpx[http2]']
+    },
     python_requires='>=3.7'
 )
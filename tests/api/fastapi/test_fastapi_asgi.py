@@ -0,0 +1,16 @@
+from tests.api.fastapi import test_fastapi
+from rest_api_tester.client.asgi_client import ASGITestClient
+
+
+class TestJSONASGI(test_fastapi.TestJSON):
+    """
+    Runs every FastAPI test with `ASGITestClient` instead of `FastAPITestClient`
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = ASGITestClient(app=self.app)
+        self.runner.client = self.client
+
+    def tearDown(self) -> None:
+        self.client.close()
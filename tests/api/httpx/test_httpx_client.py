@@ -0,0 +1,120 @@
+import json
+import asyncio
+import unittest
+from unittest import mock
+from typing import List, Union
+
+import httpx
+
+from rest_api_tester.client.httpx_client import AsyncHTTPXTestClient, HTTPXTestClient
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == '/redirect':
+        return httpx.Response(status_code=301, headers={'Location': '/echo'})
+
+    return httpx.Response(
+        status_code=200,
+        headers={'Content-Type': 'application/json', 'Set-Cookie': 'session=abc'},
+        json={
+            'method': request.method,
+            'url': str(request.url),
+            'data': request.content.decode(),
+            'token': request.headers.get('token'),
+            'cookie': request.headers.get('cookie')
+        }
+    )
+
+
+class TestHTTPXTestClient(unittest.TestCase):
+
+    def test_request(self) -> None:
+        with HTTPXTestClient(
+            base_url='https://api.example.com',
+            headers={'token': 'default'},
+            transport=httpx.MockTransport(handler)
+        ) as client:
+            response = client.post(
+                url='/echo',
+                data=json.dumps({'name': 'item'}),
+                timeout=10,
+                allow_redirects=False,
+                headers={'token': 't0k3n'},
+                cookies={'a': '1'}
+            )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/json', response.headers['content-type'])
+        self.assertDictEqual({
+            'method': 'POST',
+            'url': 'https://api.example.com/echo',
+            'data': '{"name": "item"}',
+            'token': 't0k3n',
+            'cookie': 'a=1'
+        }, response.json)
+
+    def test_redirects(self) -> None:
+        client = HTTPXTestClient(transport=httpx.MockTransport(handler))
+        response = client.get(url='http://localhost/redirect', timeout=10, allow_redirects=False)
+        self.assertEqual(301, response.status_code)
+        self.assertEqual('/echo', response.headers['location'])
+
+        response = client.get(url='http://localhost/redirect', timeout=10, allow_redirects=True)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('http://localhost/echo', response.json['url'])
+
+    def test_cookies(self) -> None:
+        with HTTPXTestClient(transport=httpx.MockTransport(handler)) as client:
+            client.get(url='http://localhost/echo', timeout=10, allow_redirects=False)
+            response = client.get(url='http://localhost/echo', timeout=10, allow_redirects=False)
+            # Cookies set by earlier responses aren't sent, but the request's own cookies are
+            self.assertIsNone(response.json['cookie'])
+            response = client.get(url='http://localhost/echo', timeout=10, allow_redirects=False, cookies={'a': '1'})
+            self.assertEqual('a=1', response.json['cookie'])
+
+        with HTTPXTestClient(transport=httpx.MockTransport(handler), persist_cookies=True) as client:
+            client.get(url='http://localhost/echo', timeout=10, allow_redirects=False)
+            response = client.get(url='http://localhost/echo', timeout=10, allow_redirects=False)
+            self.assertEqual('session=abc', response.json['cookie'])
+
+    def test_connection_pool_limits(self) -> None:
+        with mock.patch('httpx.Client', wraps=httpx.Client) as client_cls:
+            client = HTTPXTestClient(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.0)
+        client.close()
+
+        self.assertEqual(
+            httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.0),
+            client_cls.call_args[1]['limits']
+        )
+
+
+class TestAsyncHTTPXTestClient(unittest.TestCase):
+
+    def test_request(self) -> None:
+        async def run() -> List[int]:
+            async with AsyncHTTPXTestClient(
+                base_url='https://api.example.com',
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                responses = await asyncio.gather(*(
+                    client.delete(url=f'/items/{i}', timeout=10, allow_redirects=False)
+                    for i in range(3)
+                ))
+            return [response.json['url'] for response in responses]
+
+        self.assertListEqual([
+            'https://api.example.com/items/0',
+            'https://api.example.com/items/1',
+            'https://api.example.com/items/2'
+        ], asyncio.run(run()))
+
+    def test_cookies(self) -> None:
+        async def run() -> List[Union[str, None]]:
+            async with AsyncHTTPXTestClient(transport=httpx.MockTransport(handler)) as client:
+                responses = [
+                    await client.get(url='http://localhost/echo', timeout=10, allow_redirects=False)
+                    for _ in range(2)
+                ]
+            return [response.json['cookie'] for response in responses]
+
+        self.assertListEqual([None, None], asyncio.run(run()))
@@ -0,0 +1,137 @@
+import json
+import asyncio
+import unittest
+from typing import Any, Dict, List, MutableMapping
+
+from rest_api_tester.client.asgi_client import ASGIReceive, ASGISend, ASGITestClient, AsyncASGITestClient
+
+
+async def app(scope: MutableMapping[str, Any], receive: ASGIReceive, send: ASGISend) -> None:
+    assert scope['type'] == 'http'
+
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body', False):
+            break
+
+    if scope['path'] == '/redirect':
+        await send({'type': 'http.response.start', 'status': 303, 'headers': [(b'location', b'/echo?from=redirect')]})
+        await send({'type': 'http.response.body', 'body': b''})
+        return
+    if scope['path'] == '/error':
+        raise ValueError('Server error')
+    if scope['path'] == '/cookies':
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'Set-Cookie', b'a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT'),
+                (b'Set-Cookie', b'b=2'),
+                (b'Vary', b'Accept'),
+                (b'Vary', b'Cookie')
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': b''})
+        return
+    if scope['path'] == '/latin-1':
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [(b'Content-Type', b'text/plain; charset=latin-1')]
+        })
+        await send({'type': 'http.response.body', 'body': 'café'.encode('latin-1')})
+        return
+
+    content = json.dumps({
+        'method': scope['method'],
+        'path': scope['path'],
+        'query_string': scope['query_string'].decode(),
+        'headers': {key.decode(): value.decode() for key, value in scope['headers']},
+        'body': body.decode()
+    }).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [(b'Content-Type', b'application/json'), (b'X-Test', b'test')]
+    })
+    # Send the body in two chunks
+    await send({'type': 'http.response.body', 'body': content[:10], 'more_body': True})
+    await send({'type': 'http.response.body', 'body': content[10:]})
+
+
+class TestASGITestClient(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = ASGITestClient(app=app)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_request(self) -> None:
+        response = self.client.post(
+            url='/echo?a=1',
+            data='{"name": "item"}',
+            timeout=10,
+            allow_redirects=False,
+            headers={'Content-Type': 'application/json'},
+            cookies={'a': '1', 'b': '2'}
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertDictEqual({'content-type': 'application/json', 'x-test': 'test'}, response.headers)
+        self.assertDictEqual({
+            'method': 'POST',
+            'path': '/echo',
+            'query_string': 'a=1',
+            'headers': {
+                'host': 'testserver',
+                'content-type': 'application/json',
+                'cookie': 'a=1; b=2',
+                'content-length': '16'
+            },
+            'body': '{"name": "item"}'
+        }, response.json)
+
+    def test_redirects(self) -> None:
+        response = self.client.post(url='/redirect', data='{}', timeout=10, allow_redirects=False)
+        self.assertEqual(303, response.status_code)
+        self.assertEqual('/echo?from=redirect', response.headers['location'])
+
+        response = self.client.post(url='/redirect', data='{}', timeout=10, allow_redirects=True)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('GET', response.json['method'])
+        self.assertEqual('from=redirect', response.json['query_string'])
+        self.assertEqual('', response.json['body'])
+
+    def test_charset(self) -> None:
+        response = self.client.get(url='/latin-1', timeout=10, allow_redirects=False)
+        self.assertEqual('café', response.text)
+
+    def test_repeated_headers(self) -> None:
+        response = self.client.get(url='/cookies', timeout=10, allow_redirects=False)
+        self.assertListEqual(
+            ['a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT', 'b=2'], response.headers['set-cookie'])
+        self.assertEqual('Accept, Cookie', response.headers['vary'])
+
+    def test_app_exception(self) -> None:
+        with self.assertRaises(ValueError):
+            self.client.get(url='/error', timeout=10, allow_redirects=False)
+
+
+class TestAsyncASGITestClient(unittest.TestCase):
+
+    def test_request(self) -> None:
+        client = AsyncASGITestClient(app=app, base_url='https://api.example.com:8443')
+
+        async def run() -> List[Dict[str, Any]]:
+            responses = await asyncio.gather(*(
+                client.delete(url=f'/items/{i}', timeout=10, allow_redirects=False)
+                for i in range(3)
+            ))
+            return [response.json for response in responses]
+
+        results = asyncio.run(run())
+        self.assertListEqual(['/items/0', '/items/1', '/items/2'], [result['path'] for result in results])
+        self.assertEqual('api.example.com:8443', results[0]['headers']['host'])
@@ -0,0 +1,145 @@
+import os
+import json
+import asyncio
+import unittest
+from typing import Any, Dict, Union
+
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.runner import AsyncTestCaseRunner, RunSpec
+from rest_api_tester.test import TestResult
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+
+class FakeAsyncTestClient(AsyncBaseTestClient):
+    """
+    Echoes requests back as JSON after an optional delay
+    """
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.max_concurrency = 0
+        self._concurrency = 0
+
+    async def get(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._respond(method='GET', url=url, data=None, headers=headers)
+
+    async def post(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._respond(method='POST', url=url, data=data, headers=headers)
+
+    async def put(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._respond(method='PUT', url=url, data=data, headers=headers)
+
+    async def patch(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._respond(method='PATCH', url=url, data=data, headers=headers)
+
+    async def delete(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return await self._respond(method='DELETE', url=url, data=None, headers=headers)
+
+    async def _respond(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, None],
+        headers: Union[Dict[str, Any], None]
+    ) -> ResponseData:
+        self._concurrency += 1
+        self.max_concurrency = max(self.max_concurrency, self._concurrency)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self._concurrency -= 1
+
+        return ResponseData(
+            text=json.dumps({'method': method, 'url': url, 'data': data, 'headers': headers}),
+            headers={'content-type': 'application/json'},
+            status_code=200
+        )
+
+
+class TestAsyncTestCaseRunner(unittest.TestCase):
+
+    def test_run(self) -> None:
+        runner = AsyncTestCaseRunner(
+            client=FakeAsyncTestClient(),
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            default_content_type='application/json'
+        )
+        result = asyncio.run(runner.run(
+            path_to_test_cases='test_fastapi.json',
+            test_name='test_create_item__200',
+            request_json_modifiers={'name': 'async'}
+        ))
+        self.assertEqual('test_create_item__200', result.test_data.name)
+        self.assertEqual('POST', result.response.json['method'])
+        self.assertEqual('async', json.loads(result.response.json['data'])['name'])
+        self.assertDictEqual({'content-type': 'application/json'}, result.response.json['headers'])
+
+    def test_run_many(self) -> None:
+        client = FakeAsyncTestClient(delay=0.01)
+        runner = AsyncTestCaseRunner(client=client, path_to_scenarios_dir=SCENARIOS_DIR)
+        specs = [
+            RunSpec(
+                path_to_test_cases='test_fastapi.json',
+                test_name='test_delete_item__200',
+                url_params={'item_id': i}
+            )
+            for i in range(50)
+        ]
+
+        results = asyncio.run(runner.run_many(specs=specs, max_concurrency=5))
+
+        self.assertEqual(5, client.max_concurrency)
+        for i, result in enumerate(results):
+            assert isinstance(result, TestResult)
+            self.assertEqual(f'/items/{i}', result.response.json['url'])
+
+    def test_run_many__exceptions(self) -> None:
+        runner = AsyncTestCaseRunner(client=FakeAsyncTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+        results = asyncio.run(runner.run_many(specs=[
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='test_get_status__200'),
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='does_not_exist'),
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='test_get_item__404')
+        ]))
+        self.assertIsInstance(results[0], TestResult)
+        self.assertIsInstance(results[1], KeyError)
+        self.assertIsInstance(results[2], TestResult)
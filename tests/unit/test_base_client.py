@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from typing import Any, Dict, List, Union
+
+from rest_api_tester.client.async_base_client import AsyncBaseTestClient
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+
+
+class RequestClient(BaseTestClient):
+    """
+    Implements only `request`
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        data: Union[bytes, None] = None,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        self.requests.append({'method': method, 'url': url, 'data': data})
+        return ResponseData(text='', headers={}, status_code=200)
+
+
+class HookClient(BaseTestClient):
+    """
+    Implements only the `get` and `post` hooks
+    """
+
+    def get(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return ResponseData(text=f'GET {url}', headers={}, status_code=200)
+
+    def post(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return ResponseData(text=f'POST {url} {data}', headers={}, status_code=200)
+
+
+class AsyncHookClient(AsyncBaseTestClient):
+
+    async def options(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return ResponseData(text=f'OPTIONS {url}', headers={}, status_code=204)
+
+
+class TestBaseTestClient(unittest.TestCase):
+
+    def test_request__dispatches_to_hooks(self) -> None:
+        client = HookClient()
+        response = client.request(method='get', url='/items', timeout=10, allow_redirects=False)
+        self.assertEqual('GET /items', response.text)
+
+        response = client.request(method='POST', url='/items', timeout=10, allow_redirects=False, data=b'{"a": 1}')
+        self.assertEqual('POST /items {"a": 1}', response.text)
+
+    def test_request__hook_not_implemented(self) -> None:
+        with self.assertRaisesRegex(NotImplementedError, 'HookClient must implement `request` or `head`'):
+            HookClient().request(method='HEAD', url='/items', timeout=10, allow_redirects=False)
+
+    def test_request__unsupported_method(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unsupported HTTP method'):
+            HookClient().request(method='TRACE', url='/items', timeout=10, allow_redirects=False)
+
+    def test_hooks__dispatch_to_request(self) -> None:
+        client = RequestClient()
+        client.get(url='/a', timeout=10, allow_redirects=False)
+        client.put(url='/b', data='{}', timeout=10, allow_redirects=False)
+        client.head(url='/c', timeout=10, allow_redirects=False)
+        client.options(url='/d', timeout=10, allow_redirects=False)
+        self.assertListEqual([
+            {'method': 'GET', 'url': '/a', 'data': None},
+            {'method': 'PUT', 'url': '/b', 'data': b'{}'},
+            {'method': 'HEAD', 'url': '/c', 'data': None},
+            {'method': 'OPTIONS', 'url': '/d', 'data': None}
+        ], client.requests)
+
+    def test_async_request__dispatches_to_hooks(self) -> None:
+        client = AsyncHookClient()
+        response = asyncio.run(client.request(method='OPTIONS', url='/items', timeout=10, allow_redirects=False))
+        self.assertEqual('OPTIONS /items', response.text)
+
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(client.get(url='/items', timeout=10, allow_redirects=False))
@@ -0,0 +1,138 @@
+import os
+import json
+import tempfile
+import unittest
+
+from rest_api_tester.baseline import METRIC_LATENCY_MS, METRIC_RESPONSE_BYTES, BaselineStore
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.test import TestCase, TestData, TestResult
+from rest_api_tester.timing import PHASE_REQUEST
+
+
+class TestBaselineStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.scenarios_dir = os.path.join(self.temp_dir.name, 'scenarios')
+        self.store = BaselineStore.for_scenarios_dir(path_to_scenarios_dir=self.scenarios_dir, save_on_exit=False)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_check_and_record(self) -> None:
+        for latency in (0.100, 0.105, 0.095, 0.110, 0.100):
+            self.assertListEqual([], self.store.check_and_record(result=self._get_result(latency=latency)))
+
+        self.assertListEqual([], self.store.check_and_record(result=self._get_result(latency=0.140)))
+
+        regressions = self.store.check_and_record(result=self._get_result(latency=0.200, text='{"a": 123456}'))
+        self.assertListEqual([METRIC_RESPONSE_BYTES, METRIC_LATENCY_MS], [r.metric for r in regressions])
+        self.assertEqual('scenarios/test.json::test_create_order', regressions[1].test_key)
+        self.assertAlmostEqual(200, regressions[1].value)
+        self.assertAlmostEqual(102.5, regressions[1].baseline)
+        self.assertIn('(1.95x', str(regressions[1]))
+
+    def test_check_and_record__noisy(self) -> None:
+        for latency in (0.050, 0.150, 0.100, 0.020, 0.180):
+            self.store.check_and_record(result=self._get_result(latency=latency))
+
+        # Within the natural spread of the samples, even though it's over 50% above the median
+        self.assertListEqual([], self.store.check_and_record(result=self._get_result(latency=0.200)))
+
+    def test_check_and_record__min_samples(self) -> None:
+        for _ in range(4):
+            self.store.check_and_record(result=self._get_result(latency=0.100))
+
+        self.assertListEqual([], self.store.check_and_record(result=self._get_result(latency=1)))
+        self.assertEqual(1, len(self.store.check_and_record(result=self._get_result(latency=1))))
+
+    def test_check_and_record__regressions_not_recorded(self) -> None:
+        test_data = self._get_result(latency=0).test_data
+        for latency in (0.1, 0.1, 0.1, 0.1, 0.1):
+            self.store.check_and_record(result=self._get_result(latency=latency))
+
+        # Repeated slow runs keep failing instead of moving the baseline
+        for _ in range(10):
+            self.assertEqual(1, len(self.store.check_and_record(result=self._get_result(latency=0.5))))
+        self.assertListEqual([100] * 5, self.store.get_samples(test_data=test_data, metric=METRIC_LATENCY_MS))
+
+        store = BaselineStore(file_path=self.store.file_path, record_regressions=True, save_on_exit=False)
+        for latency in (0.1, 0.1, 0.1, 0.1, 0.1, 0.5):
+            store.check_and_record(result=self._get_result(latency=latency))
+        self.assertEqual(500, store.get_samples(test_data=test_data, metric=METRIC_LATENCY_MS)[-1])
+
+    def test_max_samples(self) -> None:
+        store = BaselineStore(file_path=self.store.file_path, max_samples=3, save_on_exit=False)
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            store.check_and_record(result=self._get_result(latency=latency))
+
+        samples = store.get_samples(test_data=self._get_result(latency=0).test_data, metric=METRIC_LATENCY_MS)
+        self.assertListEqual([200, 300, 400], [round(sample) for sample in samples])
+
+    def test_save(self) -> None:
+        self.store.check_and_record(result=self._get_result(latency=0.1))
+        # Samples are only written when the store is saved
+        self.assertFalse(os.path.exists(self.store.file_path))
+        self.store.save()
+
+        self.assertEqual(os.path.join(self.temp_dir.name, '.rest_api_tester_baselines.json'), self.store.file_path)
+        with open(self.store.file_path, 'r') as f:
+            self.assertDictEqual({
+                'version': 1,
+                'tests': {
+                    'scenarios/test.json::test_create_order': {
+                        METRIC_LATENCY_MS: [100.0],
+                        METRIC_RESPONSE_BYTES: [8]
+                    }
+                }
+            }, json.loads(f.read()))
+
+        store = BaselineStore(file_path=self.store.file_path, save_on_exit=False)
+        test_data = self._get_result(latency=0).test_data
+        self.assertListEqual([8], store.get_samples(test_data=test_data, metric=METRIC_RESPONSE_BYTES))
+
+        store.reset(test_data=test_data)
+        self.assertListEqual([], store.get_samples(test_data=test_data, metric=METRIC_RESPONSE_BYTES))
+
+    def test_save__context_manager(self) -> None:
+        with BaselineStore(file_path=self.store.file_path, save_on_exit=False) as store:
+            store.check_and_record(result=self._get_result(latency=0.1))
+            self.assertFalse(os.path.exists(self.store.file_path))
+
+        test_data = self._get_result(latency=0).test_data
+        store = BaselineStore(file_path=self.store.file_path, autosave=True, save_on_exit=False)
+        self.assertListEqual([100], store.get_samples(test_data=test_data, metric=METRIC_LATENCY_MS))
+
+        store.check_and_record(result=self._get_result(latency=0.1))
+        with open(self.store.file_path, 'r') as f:
+            samples = json.loads(f.read())['tests']['scenarios/test.json::test_create_order']
+        self.assertListEqual([100.0, 100.0], samples[METRIC_LATENCY_MS])
+
+    def test_verify_test_result(self) -> None:
+        test_case = TestCase()
+        test_case.baseline_store = self.store
+        for _ in range(5):
+            test_case.verify_test_result(result=self._get_result(latency=0.1))
+
+        with self.assertRaises(AssertionError) as e:
+            test_case.verify_test_result(result=self._get_result(latency=0.5))
+        self.assertIn('Performance regressed from baseline:', str(e.exception))
+        self.assertIn('latency_ms of 500.0 regressed from a baseline of 100.0 (5.00x', str(e.exception))
+
+    def _get_result(self, latency: float, text: str = '{"a": 1}') -> TestResult:
+        test_data = TestData(
+            name='test_create_order',
+            url='/orders',
+            method='POST',
+            allow_redirects=True,
+            headers={},
+            cookies={},
+            request_data=None,
+            expected_status=200,
+            expected_response=None,
+            expected_headers=None,
+            description=None,
+            file_path=os.path.join(self.scenarios_dir, 'test.json')
+        )
+        response = ResponseData(text=text, headers={'content-type': 'application/json'}, status_code=200)
+        return TestResult(response=response, test_data=test_data, timings={PHASE_REQUEST: latency})
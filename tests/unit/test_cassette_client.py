@@ -0,0 +1,182 @@
+import os
+import json
+import asyncio
+import tempfile
+import unittest
+from typing import Any, Dict, Iterable
+
+from rest_api_tester.client.cassette_client import (
+    AsyncRecordingTestClient, AsyncReplayTestClient, RecordingTestClient, ReplayTestClient, UnrecordedRequestError
+)
+from rest_api_tester.client.wsgi_client import WSGIStartResponse, WSGITestClient
+from rest_api_tester.runner import TestCaseRunner
+from rest_api_tester.test import TestCase
+from tests.unit.test_async_runner import FakeAsyncTestClient
+
+
+class CountingApp:
+
+    def __init__(self) -> None:
+        self.num_requests = 0
+
+    def __call__(self, environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+        self.num_requests += 1
+        content_length = int(environ.get('CONTENT_LENGTH') or 0)
+        content = json.dumps({
+            'path': environ['PATH_INFO'],
+            'body': environ['wsgi.input'].read(content_length).decode(),
+            'count': self.num_requests
+        })
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return [content.encode()]
+
+
+def echo_app(environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+    content_length = int(environ.get('CONTENT_LENGTH') or 0)
+    start_response('200 OK', [('Content-Type', 'application/octet-stream')])
+    return [environ['wsgi.input'].read(content_length)]
+
+
+class TestCassetteClients(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cassette_path = os.path.join(self.temp_dir.name, 'cassette.jsonl')
+        self.app = CountingApp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_record_and_replay(self) -> None:
+        recorder = RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        for data in (b'{"a": 1}', b'{"a": 2}', b'{"a": 1}'):
+            recorder.request(method='POST', url='/items', timeout=10, allow_redirects=True, data=data,
+                             headers={'Content-Type': 'application/json'})
+        self.assertEqual(3, self.app.num_requests)
+
+        with open(self.cassette_path, 'r') as f:
+            self.assertEqual(3, len(f.read().splitlines()))
+
+        replayer = ReplayTestClient(cassette_path=self.cassette_path)
+        counts = [
+            replayer.request(method='POST', url='/items', timeout=10, allow_redirects=True, data=data,
+                             headers={'content-type': 'application/json'}).json['count']
+            for data in (b'{"a": 1}', b'{"a": 2}', b'{"a": 1}', b'{"a": 1}')
+        ]
+        # Repeated requests are replayed in order, then the last one repeats
+        self.assertListEqual([1, 2, 3, 3], counts)
+        self.assertEqual(3, self.app.num_requests)
+
+    def test_replay__strict(self) -> None:
+        recorder = RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        recorder.get(url='/items', timeout=10, allow_redirects=True, headers={'x-token': '1'})
+
+        replayer = ReplayTestClient(cassette_path=self.cassette_path)
+        self.assertRaises(UnrecordedRequestError, replayer.get, url='/items', timeout=10, allow_redirects=True,
+                          headers={'x-token': '2'})
+        self.assertRaises(UnrecordedRequestError, replayer.get, url='/other', timeout=10, allow_redirects=True)
+
+        replayer = ReplayTestClient(cassette_path=self.cassette_path, strict=False)
+        response = replayer.get(url='/other', timeout=10, allow_redirects=True)
+        self.assertEqual(404, response.status_code)
+        self.assertDictEqual({'unrecorded': True}, response.extra or {})
+
+    def test_replay__match_headers(self) -> None:
+        recorder = RecordingTestClient(
+            client=WSGITestClient(app=self.app), cassette_path=self.cassette_path, match_headers=[])
+        recorder.get(url='/items', timeout=10, allow_redirects=True, headers={'x-token': '1'}, cookies={'a': '1'})
+
+        replayer = ReplayTestClient(cassette_path=self.cassette_path, match_headers=[])
+        response = replayer.get(url='/items', timeout=10, allow_redirects=True, headers={'x-token': '2'})
+        self.assertEqual(1, response.json['count'])
+
+    def test_record__not_kept_in_memory(self) -> None:
+        recorder = RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        recorder.get(url='/items', timeout=10, allow_redirects=True)
+
+        key = recorder.cassette.get_key(method='GET', url='/items', data=None, headers=None, cookies=None)
+        self.assertIsNone(recorder.cassette.replay(key=key))
+        recorder.cassette.load()
+        replayed = recorder.cassette.replay(key=key)
+        assert replayed is not None
+        self.assertEqual(1, replayed.json['count'])
+
+    def test_record__append(self) -> None:
+        recorder = RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        recorder.get(url='/a', timeout=10, allow_redirects=True)
+        recorder = RecordingTestClient(
+            client=WSGITestClient(app=self.app), cassette_path=self.cassette_path, append=True)
+        recorder.get(url='/b', timeout=10, allow_redirects=True)
+
+        replayer = ReplayTestClient(cassette_path=self.cassette_path)
+        self.assertEqual(1, replayer.get(url='/a', timeout=10, allow_redirects=True).json['count'])
+        self.assertEqual(2, replayer.get(url='/b', timeout=10, allow_redirects=True).json['count'])
+
+        RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        self.assertEqual(0, os.path.getsize(self.cassette_path))
+
+    def test_runner(self) -> None:
+        scenarios_dir = os.path.join(self.temp_dir.name, 'scenarios')
+        os.mkdir(scenarios_dir)
+        with open(os.path.join(scenarios_dir, 'test.json'), 'w+') as f:
+            f.write(json.dumps({
+                'test_create_item': {
+                    'url': '/items',
+                    'method': 'POST',
+                    'status': 200,
+                    'request': {'name': 'item'},
+                    'response': {'path': '/items', 'body': '{"name": "item"}', 'count': 1}
+                }
+            }))
+
+        recorder = RecordingTestClient(client=WSGITestClient(app=self.app), cassette_path=self.cassette_path)
+        result = TestCaseRunner(client=recorder, path_to_scenarios_dir=scenarios_dir).run(
+            path_to_test_cases='test.json', test_name='test_create_item')
+        TestCase().verify_test_result(result=result, excluded_response_paths=['count'])
+
+        runner = TestCaseRunner(client=ReplayTestClient(cassette_path=self.cassette_path),
+                                path_to_scenarios_dir=scenarios_dir)
+        for _ in range(2):
+            result = runner.run(path_to_test_cases='test.json', test_name='test_create_item')
+            TestCase().verify_test_result(result=result)
+        self.assertEqual(1, self.app.num_requests)
+
+    def test_runner__binary(self) -> None:
+        scenarios_dir = os.path.join(self.temp_dir.name, 'scenarios')
+        os.mkdir(scenarios_dir)
+        with open(os.path.join(scenarios_dir, 'test.json'), 'w+') as f:
+            f.write(json.dumps({
+                'test_echo': {
+                    'url': '/echo',
+                    'method': 'POST',
+                    'status': 200,
+                    'request': 'file::image.bin',
+                    'response': 'file::image.bin'
+                }
+            }))
+        with open(os.path.join(scenarios_dir, 'image.bin'), 'wb+') as f:
+            f.write(bytes(range(256)))
+
+        recorder = RecordingTestClient(client=WSGITestClient(app=echo_app), cassette_path=self.cassette_path)
+        result = TestCaseRunner(client=recorder, path_to_scenarios_dir=scenarios_dir).run(
+            path_to_test_cases='test.json', test_name='test_echo')
+        TestCase().verify_test_result(result=result)
+
+        result = TestCaseRunner(client=ReplayTestClient(cassette_path=self.cassette_path),
+                                path_to_scenarios_dir=scenarios_dir).run(
+            path_to_test_cases='test.json', test_name='test_echo')
+        TestCase().verify_test_result(result=result)
+        self.assertEqual(bytes(range(256)), result.response.content)
+
+    def test_async(self) -> None:
+        async def run() -> None:
+            recorder = AsyncRecordingTestClient(client=FakeAsyncTestClient(), cassette_path=self.cassette_path)
+            recorded = await recorder.request(method='DELETE', url='/items/1', timeout=10, allow_redirects=True)
+
+            replayer = AsyncReplayTestClient(cassette_path=self.cassette_path)
+            replayed = await replayer.request(method='DELETE', url='/items/1', timeout=10, allow_redirects=True)
+            self.assertEqual(recorded, replayed)
+            with self.assertRaises(UnrecordedRequestError):
+                await replayer.request(method='DELETE', url='/items/2', timeout=10, allow_redirects=True)
+
+        asyncio.run(run())
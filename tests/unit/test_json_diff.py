@@ -0,0 +1,72 @@
+import unittest
+from typing import Any, List
+
+from rest_api_tester.json_diff import (
+    MISMATCH_LENGTH, MISMATCH_MISSING, MISMATCH_TYPE, MISMATCH_UNEXPECTED, MISMATCH_VALUE, JSONMismatch,
+    format_mismatches, json_diff
+)
+from rest_api_tester.test import TestCase
+
+
+class TestJSONDiff(unittest.TestCase):
+
+    def test_json_diff(self) -> None:
+        expected = {'a': 1, 'b': {'c': [1, 2, {'d': 'x'}]}, 'e': [1], 'f': None}
+        actual = {'b': {'c': [1, 3, {'d': 'y'}]}, 'a': 1.0, 'e': {}, 'g': True}
+        self.assertListEqual([
+            JSONMismatch(path='f', kind=MISMATCH_MISSING, expected=None),
+            JSONMismatch(path='g', kind=MISMATCH_UNEXPECTED, actual=True),
+            JSONMismatch(path='b.c.[1]', kind=MISMATCH_VALUE, expected=2, actual=3),
+            JSONMismatch(path='b.c.[2].d', kind=MISMATCH_VALUE, expected='x', actual='y'),
+            JSONMismatch(path='e', kind=MISMATCH_TYPE, expected=[1], actual={})
+        ], json_diff(expected=expected, actual=actual))
+
+        self.assertListEqual([], json_diff(expected=expected, actual=expected))
+        self.assertListEqual([], json_diff(expected=[{'a': [True]}], actual=[{'a': [1]}]))
+
+    def test_json_diff__lists(self) -> None:
+        mismatches = json_diff(expected=[1, 2, 3], actual=[1, 5])
+        self.assertListEqual([MISMATCH_LENGTH, MISMATCH_VALUE], [m.kind for m in mismatches])
+        self.assertEqual('<root>: expected 3 items, got 2', str(mismatches[0]))
+        self.assertEqual('[1]: expected 2, got 5', str(mismatches[1]))
+
+    def test_json_diff__max_mismatches(self) -> None:
+        expected = {'items': [{'price': i} for i in range(1000)]}
+        actual = {'items': [{'price': -i} for i in range(1000)]}
+        mismatches = json_diff(expected=expected, actual=actual, max_mismatches=3)
+        self.assertListEqual(['items.[1].price', 'items.[2].price', 'items.[3].price'], [m.path for m in mismatches])
+        self.assertEqual(999, len(json_diff(expected=expected, actual=actual, max_mismatches=None)))
+
+    def test_json_diff__deep(self) -> None:
+        # Nesting deeper than the recursion limit
+        expected: List[Any] = []
+        actual: List[Any] = []
+        for _ in range(5000):
+            expected, actual = [expected], [actual]
+        self.assertListEqual([], json_diff(expected=expected, actual=actual))
+
+    def test_format_mismatches(self) -> None:
+        mismatches = [
+            JSONMismatch(path='a', kind=MISMATCH_VALUE, expected='x' * 100, actual={'b': 1}),
+            JSONMismatch(path='c', kind=MISMATCH_MISSING, expected=[])
+        ]
+        self.assertEqual('\n'.join([
+            'JSON does not match (first 2 mismatches):',
+            f'  a: expected "{"x" * 76}..., got {{...}} (1 key)',
+            '  c: missing (expected [])'
+        ]), format_mismatches(mismatches=mismatches, truncated=True))
+
+    def test_assert_json_equal(self) -> None:
+        test_case = TestCase()
+        test_case.max_json_mismatches = 2
+        test_case.assert_json_equal(expected={'a': [1]}, actual={'a': [1]})
+
+        with self.assertRaises(AssertionError) as cm:
+            test_case.assert_json_equal(expected={'a': 1, 'b': 2, 'c': 3}, actual={'a': 0, 'b': 0, 'c': 0})
+        self.assertEqual('\n'.join([
+            '',
+            'JSON does not match (first 2 mismatches):',
+            '  a: expected 1, got 0',
+            '  b: expected 2, got 0',
+            ''
+        ]), str(cm.exception))
@@ -0,0 +1,118 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from rest_api_tester.parser.base_parser import BaseParser
+from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.test import TestData
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+
+class TestJSONParser(unittest.TestCase):
+
+    def test_iter_test_data(self) -> None:
+        with open(os.path.join(SCENARIOS_DIR, 'test_fastapi.json'), 'r') as f:
+            test_names = list(json.loads(f.read()).keys())
+
+        actual = list(JSONParser.iter_test_data(
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            path_to_test_cases='test_fastapi.json'
+        ))
+        self.assertListEqual(test_names, [test_data.name for test_data in actual])
+
+        for test_data in actual:
+            expected = JSONParser.parse(
+                path_to_scenarios_dir=SCENARIOS_DIR,
+                path_to_test_cases='test_fastapi.json',
+                test_name=test_data.name,
+                request_json_modifiers=None,
+                response_json_modifiers=None,
+                request_header_modifiers=None,
+                response_header_modifiers=None
+            )
+            self.assertEqual(expected, test_data)
+
+    def test_iter_test_data__external_files_and_modifiers(self) -> None:
+        test_data = next(
+            test_data for test_data in JSONParser.iter_test_data(
+                path_to_scenarios_dir=SCENARIOS_DIR,
+                path_to_test_cases='test_fastapi.json',
+                request_header_modifiers={'blah': 'test'}
+            )
+            if test_data.name == 'test_create_item__200_with_external_files'
+        )
+        self.assertDictEqual({'name': 'item1'}, test_data.request_data_json)
+        self.assertDictEqual({'id': 1, 'name': 'item1'}, test_data.expected_response_json)
+        self.assertDictEqual({'blah': 'test'}, test_data.headers)
+
+    def test_parse__decoded_bodies(self) -> None:
+        test_data = JSONParser.parse(
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            path_to_test_cases='test_fastapi.json',
+            test_name='test_create_item__200',
+            request_json_modifiers={'name': 'item2'},
+            response_json_modifiers=None,
+            request_header_modifiers=None,
+            response_header_modifiers=None
+        )
+        self.assertEqual('{"name": "item2"}', test_data.request_data)
+
+        # Scenario bodies are handed over already decoded, and stay cached until reassigned
+        with mock.patch('json.loads', side_effect=AssertionError):
+            request_json = test_data.request_data_json
+            self.assertDictEqual({'name': 'item2'}, request_json)
+            self.assertIs(request_json, test_data.request_data_json)
+            self.assertIs(test_data.expected_response_json, test_data.expected_response_json)
+
+        test_data.request_data = '{"name": "item3"}'
+        self.assertDictEqual({'name': 'item3'}, test_data.request_data_json)
+        test_data.request_data = None
+        self.assertIsNone(test_data.request_data_json)
+
+    def test_parse__binary_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'test.json'), 'w+') as f:
+                f.write(json.dumps({
+                    'test_upload': {
+                        'url': '/upload',
+                        'method': 'POST',
+                        'status': 200,
+                        'request': 'file::image.png',
+                        'response': 'file::response.txt'
+                    }
+                }))
+            with open(os.path.join(temp_dir, 'image.png'), 'wb+') as f:
+                f.write(b'\x89PNG\r\n\x1a\n\xff')
+            with open(os.path.join(temp_dir, 'response.txt'), 'wb+') as f:
+                f.write(b'Uploaded\r\n')
+
+            test_data = JSONParser.parse(
+                path_to_scenarios_dir=temp_dir,
+                path_to_test_cases='test.json',
+                test_name='test_upload',
+                request_json_modifiers=None,
+                response_json_modifiers=None,
+                request_header_modifiers=None,
+                response_header_modifiers=None
+            )
+
+        self.assertIsNone(test_data.request_data)
+        self.assertEqual(b'\x89PNG\r\n\x1a\n\xff', test_data.request_content)
+        self.assertEqual('Uploaded', test_data.expected_response)
+        self.assertIsNone(test_data.expected_response_content)
+
+    def test_iter_test_data__not_supported(self) -> None:
+        class CustomParser(BaseParser):
+
+            @staticmethod
+            def parse(*args: object, **kwargs: object) -> TestData:
+                raise NotImplementedError
+
+        with self.assertRaises(NotImplementedError):
+            list(CustomParser.iter_test_data(
+                path_to_scenarios_dir=SCENARIOS_DIR,
+                path_to_test_cases='test_fastapi.json'
+            ))
@@ -0,0 +1,116 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import dataclasses
+
+from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.parser.jsonl_parser import JSONLParser, convert_json_to_jsonl
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+
+class TestJSONLParser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path_to_scenarios_dir = self.temp_dir.name
+        for file_name in os.listdir(SCENARIOS_DIR):
+            shutil.copy(os.path.join(SCENARIOS_DIR, file_name), self.path_to_scenarios_dir)
+        self.jsonl_file_path = convert_json_to_jsonl(
+            json_file_path=os.path.join(self.path_to_scenarios_dir, 'test_fastapi.json'))
+
+    def tearDown(self) -> None:
+        JSONLParser.invalidate_index()
+        self.temp_dir.cleanup()
+
+    def test_convert_json_to_jsonl(self) -> None:
+        self.assertEqual(os.path.join(self.path_to_scenarios_dir, 'test_fastapi.jsonl'), self.jsonl_file_path)
+
+        with open(os.path.join(self.path_to_scenarios_dir, 'test_fastapi.json'), 'r') as f:
+            expected = json.loads(f.read())
+
+        actual = {}
+        with open(self.jsonl_file_path, 'r') as f:
+            for line in f:
+                test_case = json.loads(line)
+                self.assertEqual(1, len(test_case))
+                actual.update(test_case)
+
+        self.assertDictEqual(expected, actual)
+        self.assertListEqual(list(expected.keys()), list(actual.keys()))
+
+    def test_parse__matches_json_parser(self) -> None:
+        with open(os.path.join(self.path_to_scenarios_dir, 'test_fastapi.json'), 'r') as f:
+            test_names = list(json.loads(f.read()).keys())
+
+        for test_name in test_names:
+            kwargs = {
+                'path_to_scenarios_dir': self.path_to_scenarios_dir,
+                'test_name': test_name,
+                'request_json_modifiers': None,
+                'response_json_modifiers': None,
+                'request_header_modifiers': None,
+                'response_header_modifiers': None
+            }
+            expected = JSONParser.parse(path_to_test_cases='test_fastapi.json', **kwargs)
+            actual = JSONLParser.parse(path_to_test_cases='test_fastapi.jsonl', **kwargs)
+            self.assertEqual(self.jsonl_file_path, actual.file_path)
+            self.assertEqual(expected, dataclasses.replace(actual, file_path=expected.file_path))
+
+    def test_iter_test_data__matches_json_parser(self) -> None:
+        expected = list(JSONParser.iter_test_data(
+            path_to_scenarios_dir=self.path_to_scenarios_dir,
+            path_to_test_cases='test_fastapi.json'
+        ))
+        actual = list(JSONLParser.iter_test_data(
+            path_to_scenarios_dir=self.path_to_scenarios_dir,
+            path_to_test_cases='test_fastapi.jsonl'
+        ))
+        self.assertListEqual(
+            expected,
+            [dataclasses.replace(test_data, file_path=expected[0].file_path) for test_data in actual]
+        )
+
+    def test_parse__missing_test(self) -> None:
+        with self.assertRaises(KeyError):
+            JSONLParser.parse(
+                path_to_scenarios_dir=self.path_to_scenarios_dir,
+                path_to_test_cases='test_fastapi.jsonl',
+                test_name='does_not_exist',
+                request_json_modifiers=None,
+                response_json_modifiers=None,
+                request_header_modifiers=None,
+                response_header_modifiers=None
+            )
+
+    def test_parse__reindexes_modified_file(self) -> None:
+        with open(self.jsonl_file_path, 'w+') as f:
+            f.write(json.dumps({'test_a': {'url': '/a', 'method': 'GET', 'status': 200}}) + '\n')
+
+        test_data = JSONLParser.parse(
+            path_to_scenarios_dir=self.path_to_scenarios_dir,
+            path_to_test_cases='test_fastapi.jsonl',
+            test_name='test_a',
+            request_json_modifiers=None,
+            response_json_modifiers=None,
+            request_header_modifiers=None,
+            response_header_modifiers=None
+        )
+        self.assertEqual('/a', test_data.url)
+
+        with open(self.jsonl_file_path, 'w+') as f:
+            f.write('\n' + json.dumps({'test_b': {'url': '/b', 'method': 'GET', 'status': 200}}) + '\n')
+            f.write(json.dumps({'test_a': {'url': '/c', 'method': 'GET', 'status': 200}}) + '\n')
+
+        test_data = JSONLParser.parse(
+            path_to_scenarios_dir=self.path_to_scenarios_dir,
+            path_to_test_cases='test_fastapi.jsonl',
+            test_name='test_a',
+            request_json_modifiers=None,
+            response_json_modifiers=None,
+            request_header_modifiers=None,
+            response_header_modifiers=None
+        )
+        self.assertEqual('/c', test_data.url)
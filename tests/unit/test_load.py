@@ -0,0 +1,125 @@
+import os
+import json
+import tempfile
+import unittest
+from typing import Any, Dict, Iterable
+
+from rest_api_tester.client.wsgi_client import WSGIStartResponse, WSGITestClient
+from rest_api_tester.load import LatencyHistogram, LoadScenario, LoadTester
+from rest_api_tester.runner import RunSpec, TestCaseRunner
+
+
+def app(environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+    start_response('200 OK', [('Content-Type', 'application/json')])
+    return [json.dumps({'path': environ['PATH_INFO']}).encode()]
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_percentile(self) -> None:
+        histogram = LatencyHistogram()
+        for i in range(1, 10001):
+            histogram.record(seconds=i / 1000 / 1000)
+
+        self.assertEqual(10000, histogram.count)
+        for percentile, expected in ((50, 0.005), (95, 0.0095), (99, 0.0099), (100, 0.01)):
+            self.assertAlmostEqual(expected, histogram.percentile(percentile=percentile), delta=expected / 100)
+        self.assertAlmostEqual(0.0050005, histogram.mean)
+        self.assertEqual(0.0, LatencyHistogram().percentile(percentile=50))
+
+    def test_merge(self) -> None:
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(seconds=0.001, count=99)
+        b.record(seconds=1)
+
+        a.merge(other=b)
+        self.assertEqual(100, a.count)
+        self.assertAlmostEqual(0.001, a.percentile(percentile=99), delta=0.00001)
+        self.assertEqual(1.0, a.percentile(percentile=100))
+        self.assertEqual(1000, a.min_us)
+        self.assertRaises(ValueError, a.merge, LatencyHistogram(significant_figures=3))
+
+    def test_format_percentile_distribution(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.record(seconds=0.001)
+        histogram.record(seconds=0.002)
+
+        lines = histogram.format_percentile_distribution().splitlines()
+        self.assertListEqual(['Value', 'Percentile', 'TotalCount', '1/(1-Percentile)'], lines[0].split())
+        self.assertListEqual(['1.003', '0.500000000000', '1', '2.00'], lines[2].split())
+        self.assertListEqual(['2.000', '1.000000000000', '2', 'inf'], lines[3].split())
+        self.assertTrue(lines[4].startswith('#[Mean'))
+
+
+class TestLoadTester(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, 'test.json'), 'w+') as f:
+            f.write(json.dumps({
+                'test_get_item__200': {
+                    'url': '/items/1',
+                    'method': 'GET',
+                    'status': 200,
+                    'response': {'path': '/items/1'}
+                },
+                'test_get_item__wrong_response': {
+                    'url': '/items/2',
+                    'method': 'GET',
+                    'status': 200,
+                    'response': {'path': '/items/1'}
+                },
+                'test_get_item__404': {
+                    'url': '/items/3',
+                    'method': 'GET',
+                    'status': 404
+                }
+            }))
+        self.runner = TestCaseRunner(client=WSGITestClient(app=app), path_to_scenarios_dir=self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_run__rps(self) -> None:
+        tester = LoadTester(runner=self.runner, scenarios=[
+            LoadScenario(spec=RunSpec(path_to_test_cases='test.json', test_name='test_get_item__200'))
+        ])
+
+        result = tester.run(duration=0.5, concurrency=2, rps=40)
+        self.assertEqual(20, result.num_requests)
+        self.assertEqual(0, result.num_errors)
+        self.assertEqual(0, result.num_verified)
+        self.assertEqual(20, result.histogram.count)
+        self.assertAlmostEqual(40, result.throughput, delta=10)
+        self.assertListEqual(['p50', 'p95', 'p99'], list(result.percentiles))
+        self.assertGreater(result.percentiles['p99'], 0)
+
+    def test_run__errors(self) -> None:
+        tester = LoadTester(runner=self.runner, scenarios=[
+            LoadScenario(spec=RunSpec(path_to_test_cases='test.json', test_name='test_get_item__404'), weight=1),
+            LoadScenario(spec=RunSpec(path_to_test_cases='test.json', test_name='test_get_item__200'), weight=0)
+        ], seed=1)
+
+        result = tester.run(duration=0.1, concurrency=4)
+        self.assertGreater(result.num_requests, 0)
+        self.assertEqual(result.num_requests, result.num_errors)
+        self.assertEqual(1.0, result.error_rate)
+        self.assertDictEqual(
+            {'AssertionError: test_get_item__404: Expected status 404, got 200': result.num_requests},
+            result.errors
+        )
+        self.assertIn('Errors:     ', result.summary())
+
+    def test_run__verify_sample(self) -> None:
+        tester = LoadTester(runner=self.runner, scenarios=[
+            LoadScenario(spec=RunSpec(path_to_test_cases='test.json', test_name='test_get_item__wrong_response'))
+        ], verify_sample_rate=1)
+
+        result = tester.run(duration=0.1, rps=50)
+        self.assertEqual(5, result.num_requests)
+        self.assertEqual(5, result.num_verified)
+        self.assertEqual(5, result.num_errors)
+        self.assertEqual(1, len(result.errors))
+
+    def test_init__no_scenarios(self) -> None:
+        self.assertRaises(ValueError, LoadTester, runner=self.runner, scenarios=[])
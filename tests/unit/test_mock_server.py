@@ -0,0 +1,163 @@
+import os
+import json
+import asyncio
+import http.client
+import tempfile
+import unittest
+from typing import Any, Dict, List, Tuple, Union
+
+from rest_api_tester.client.utils import add_response_header
+from rest_api_tester.mock_server import MockRouter, MockServer, _parse_head
+from rest_api_tester.parser.json_parser import JSONParser
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+_Response = Tuple[int, Dict[str, Any], str]
+
+
+class TestMockRouter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.router = MockRouter(test_data=JSONParser.iter_test_data(
+            path_to_scenarios_dir=SCENARIOS_DIR, path_to_test_cases='test_fastapi.json'))
+
+    def test_match(self) -> None:
+        response = self.router.match(method='GET', path='/status')
+        self.assertEqual('test_get_status__200', response.test_data.name if response else None)
+        self.assertIsNone(self.router.match(method='GET', path='/does-not-exist'))
+        self.assertIsNone(self.router.match(method='PUT', path='/status'))
+
+    def test_match__template(self) -> None:
+        static = self.router.match(method='GET', path='/items/1')
+        template = self.router.match(method='DELETE', path='/items/2')
+        self.assertEqual('/items/1', static.test_data.url if static else None)
+        self.assertEqual('/items/{item_id}', template.test_data.url if template else None)
+        self.assertIsNone(self.router.match(method='GET', path='/items/2'))
+        self.assertIsNone(self.router.match(method='DELETE', path='/items/2/other'))
+
+        # Scenarios without constraints are used in file order
+        self.assertEqual(200, static.test_data.expected_status if static else None)
+
+    def test_match__constraints(self) -> None:
+        valid = self.router.match(method='GET', path='/protected', headers={'secret': 's3cr3t!'})
+        invalid = self.router.match(method='GET', path='/protected', headers={'secret': 'invalid'})
+        self.assertEqual(200, valid.test_data.expected_status if valid else None)
+        self.assertEqual(401, invalid.test_data.expected_status if invalid else None)
+
+        bodies = {}
+        for body in (b'{"name": "item1"}', b'{"name":"item1"}', b''):
+            response = self.router.match(method='POST', path='/items', body=body)
+            bodies[body] = response.test_data.request_data_json if response else None
+        self.assertEqual({'name': 'item1'}, bodies[b'{"name":"item1"}'])
+
+
+class TestMockServer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, 'test.json'), 'w+') as f:
+            f.write(json.dumps({
+                'test_get_item': {
+                    'url': '/items/{item_id}',
+                    'method': 'GET',
+                    'status': 200,
+                    'response': {'id': 1},
+                    'response_headers': {'x-test': 'test'}
+                },
+                'test_get_item__authorized': {
+                    'url': '/items/{item_id}',
+                    'method': 'GET',
+                    'status': 200,
+                    'cookies': {'session': 'abc'},
+                    'response': {'id': 1, 'secret': True}
+                },
+                'test_login': {
+                    'url': '/login',
+                    'method': 'POST',
+                    'status': 204,
+                    'response_headers': {'set-cookie': ['a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT', 'b=2']}
+                },
+                'test_create_item': {
+                    'url': '/items?dry_run=true',
+                    'method': 'POST',
+                    'status': 201,
+                    'request': {'name': 'item'},
+                    'response': 'Created'
+                }
+            }))
+        with open(os.path.join(self.temp_dir.name, 'request.json'), 'w+') as f:
+            f.write(json.dumps({'name': 'item'}))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_find_scenario_files(self) -> None:
+        self.assertEqual(4, len(MockServer(path_to_scenarios_dir=self.temp_dir.name).router))
+        self.assertEqual(22, len(MockServer(path_to_scenarios_dir=SCENARIOS_DIR).router))
+
+    def test_serve(self) -> None:
+        responses = asyncio.run(self._request_all(requests=[
+            ('GET', '/items/5', None, {}),
+            ('GET', '/items/5', None, {'Cookie': 'a=1; session=abc'}),
+            ('POST', '/items?dry_run=true', '{"name": "item"}', {'Content-Type': 'application/json'}),
+            ('DELETE', '/items/5', None, {})
+        ]))
+
+        status_code, headers, text = responses[0]
+        self.assertEqual(200, status_code)
+        self.assertDictEqual({'id': 1}, json.loads(text))
+        self.assertEqual('test', headers['x-test'])
+        self.assertEqual('application/json', headers['content-type'])
+        self.assertEqual('9', headers['content-length'])
+
+        self.assertDictEqual({'id': 1, 'secret': True}, json.loads(responses[1][2]))
+        self.assertEqual((201, 'text/plain; charset=utf-8', 'Created'),
+                         (responses[2][0], responses[2][1]['content-type'], responses[2][2]))
+        self.assertEqual(404, responses[3][0])
+        self.assertEqual('No scenario matches DELETE /items/5', json.loads(responses[3][2])['detail'])
+
+    def test_serve__head(self) -> None:
+        responses = asyncio.run(self._request_all(requests=[
+            ('HEAD', '/items/5', None, {}),
+            ('HEAD', '/other', None, {}),
+            ('GET', '/items/5', None, {})
+        ]))
+
+        # No body is sent, so the following response on the same connection is intact
+        self.assertEqual((200, '9', ''), (responses[0][0], responses[0][1]['content-length'], responses[0][2]))
+        self.assertEqual((404, ''), (responses[1][0], responses[1][2]))
+        self.assertDictEqual({'id': 1}, json.loads(responses[2][2]))
+
+    def test_serve__repeated_headers(self) -> None:
+        responses = asyncio.run(self._request_all(requests=[('POST', '/login', None, {})]))
+        self.assertEqual(204, responses[0][0])
+        self.assertListEqual(['a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT', 'b=2'], responses[0][1]['set-cookie'])
+
+    def test_parse_head__repeated_headers(self) -> None:
+        head = b'GET / HTTP/1.1\r\nCookie: a=1\r\nAccept: text/plain\r\nCookie: session=abc\r\nAccept: */*'
+        self.assertEqual(
+            ('GET', '/', 'HTTP/1.1', {'cookie': 'a=1; session=abc', 'accept': 'text/plain, */*'}),
+            _parse_head(head=head)
+        )
+
+    async def _request_all(self, requests: List[Tuple[str, str, Union[str, None], Dict[str, Any]]]) -> List[_Response]:
+        async with MockServer(path_to_scenarios_dir=self.temp_dir.name) as server:
+            self.assertEqual('127.0.0.1', server.host)
+            self.assertNotEqual(0, server.port)
+
+            def request_all() -> List[_Response]:
+                # A single keep-alive connection for all requests
+                connection = http.client.HTTPConnection(server.host, server.port, timeout=10)
+                results = []
+                for method, url, body, headers in requests:
+                    connection.request(method, url, body=body, headers=headers)
+                    response = connection.getresponse()
+                    text = response.read().decode()
+                    response_headers: Dict[str, Any] = {}
+                    for key, value in response.getheaders():
+                        add_response_header(headers=response_headers, name=key, value=value)
+                    results.append((response.status, response_headers, text))
+                connection.close()
+                return results
+
+            return await asyncio.get_event_loop().run_in_executor(None, request_all)
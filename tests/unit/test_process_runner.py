@@ -0,0 +1,111 @@
+import os
+import json
+import tempfile
+import unittest
+import functools
+from typing import Any, Dict, Union
+
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.process_runner import ProcessPoolTestCaseRunner, _shard_specs
+from rest_api_tester.runner import RunSpec
+from tests.unit.test_runner import FakeTestClient
+
+
+class PidTestClient(FakeTestClient):
+    """
+    Adds the ID of the worker process to every response
+    """
+
+    def _respond(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, None],
+        headers: Union[Dict[str, Any], None]
+    ) -> ResponseData:
+        response = super()._respond(method=method, url=url, data=data, headers=headers)
+        response.extra = {'pid': os.getpid()}
+        return response
+
+
+class TestProcessPoolTestCaseRunner(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for file_name in ('a.json', 'b.json'):
+            with open(os.path.join(self.temp_dir.name, file_name), 'w+') as f:
+                f.write(json.dumps({
+                    'test_delete_item__200': {
+                        'url': '/items/{item_id}',
+                        'method': 'DELETE',
+                        'status': 200,
+                        'response': {'method': 'DELETE', 'url': '/items/1', 'data': None, 'headers': {}},
+                        'response_headers': {'content-type': 'application/json'}
+                    }
+                }))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_run_many(self) -> None:
+        runner = ProcessPoolTestCaseRunner(
+            client_factory=FakeTestClient,
+            path_to_scenarios_dir=self.temp_dir.name,
+            max_workers=2
+        )
+        results = runner.run_many(specs=[
+            RunSpec(path_to_test_cases='a.json', test_name='test_delete_item__200', url_params={'item_id': 1}),
+            RunSpec(path_to_test_cases='b.json', test_name='test_delete_item__200', url_params={'item_id': 2}),
+            RunSpec(path_to_test_cases='a.json', test_name='does_not_exist'),
+            RunSpec(path_to_test_cases='b.json', test_name='test_delete_item__200', url_params={'item_id': 1})
+        ])
+
+        self.assertListEqual(['a.json', 'b.json', 'a.json', 'b.json'], [r.path_to_test_cases for r in results])
+        self.assertListEqual([True, False, False, True], [r.passed for r in results])
+        self.assertListEqual([200, 200, None, 200], [r.status_code for r in results])
+        self.assertIn('/items/2', results[1].error or '')
+        self.assertEqual("KeyError: 'does_not_exist'", results[2].error)
+        self.assertIsNone(results[0].response)
+        self.assertListEqual(['parse', 'modify', 'request', 'verify'], list(results[0].timings))
+
+    def test_run_many__include_responses(self) -> None:
+        runner = ProcessPoolTestCaseRunner(
+            client_factory=FakeTestClient,
+            path_to_scenarios_dir=self.temp_dir.name,
+            max_workers=1
+        )
+        results = runner.run_many(specs=[
+            RunSpec(path_to_test_cases='a.json', test_name='test_delete_item__200', url_params={'item_id': 3})
+        ], excluded_response_paths=['url'], include_responses=True)
+
+        self.assertTrue(results[0].passed)
+        assert results[0].response is not None
+        self.assertEqual('/items/3', results[0].response.json['url'])
+
+    def test_run_many__single_file(self) -> None:
+        runner = ProcessPoolTestCaseRunner(
+            client_factory=functools.partial(PidTestClient, delay=0.01),
+            path_to_scenarios_dir=self.temp_dir.name,
+            max_workers=2
+        )
+        results = runner.run_many(specs=[
+            RunSpec(path_to_test_cases='a.json', test_name='test_delete_item__200', url_params={'item_id': 1})
+            for _ in range(40)
+        ], include_responses=True)
+
+        self.assertTrue(all(r.passed for r in results))
+        pids = {r.response.extra['pid'] for r in results if r.response is not None and r.response.extra}
+        self.assertEqual(2, len(pids))
+
+    def test_shard_specs(self) -> None:
+        specs = [
+            RunSpec(path_to_test_cases=path_to_test_cases, test_name='test')
+            for path_to_test_cases in ('a', 'b', 'a', 'c', 'a', 'b', 'a', 'a')
+        ]
+        shards = _shard_specs(specs=specs, num_workers=1)
+        self.assertListEqual(
+            [[0, 2], [4, 6], [1, 5], [7], [3]],
+            [[i for i, _ in shard] for shard in shards]
+        )
+        self.assertEqual(8, len(_shard_specs(specs=specs, num_workers=8)))
+        self.assertListEqual([], _shard_specs(specs=[], num_workers=8))
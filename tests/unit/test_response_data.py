@@ -0,0 +1,99 @@
+import json
+import pickle
+import unittest
+import dataclasses
+from unittest import mock
+
+from rest_api_tester.client.response_data import ResponseData
+
+
+class TestResponseData(unittest.TestCase):
+
+    def test_json(self) -> None:
+        response = ResponseData(text='{"a": [1]}', headers={}, status_code=200)
+        with mock.patch('json.loads', wraps=json.loads) as loads:
+            parsed = response.json
+            self.assertIs(parsed, response.json)
+            self.assertEqual(1, loads.call_count)
+
+        response.text = '{"a": [2]}'
+        self.assertDictEqual({'a': [2]}, response.json)
+
+    def test_set_json(self) -> None:
+        response = ResponseData(text='', headers={}, status_code=200)
+        value = {'a': 1}
+        response.set_json(value=value)
+        self.assertEqual('{"a": 1}', response.text)
+        self.assertIs(value, response.json)
+
+        response.set_json(value=value, text='{"a":1}')
+        self.assertEqual('{"a":1}', response.text)
+        self.assertEqual(ResponseData(text='{"a":1}', headers={}, status_code=200), response)
+
+    def test_text(self) -> None:
+        response = ResponseData(text='[1]', headers={}, status_code=200)
+        self.assertListEqual([1], response.json)
+        self.assertEqual(b'[1]', response.content)
+
+        response.text = '[2]'
+        self.assertListEqual([2], response.json)
+        self.assertEqual(b'[2]', response.content)
+        self.assertEqual("ResponseData(text='[2]', headers={}, status_code=200, extra=None)", repr(response))
+        self.assertNotEqual(ResponseData(text='[1]', headers={}, status_code=200), response)
+        with self.assertRaises(AttributeError):
+            response.other = 1  # type: ignore[attr-defined]
+
+    def test_dataclass(self) -> None:
+        response = ResponseData(text='[1]', headers={}, status_code=200)
+        self.assertListEqual(
+            ['text', 'headers', 'status_code', 'extra'], [f.name for f in dataclasses.fields(response)])
+        self.assertDictEqual(
+            {'text': '[1]', 'headers': {}, 'status_code': 200, 'extra': None}, dataclasses.asdict(response))
+
+        replaced = dataclasses.replace(response, status_code=201)
+        self.assertEqual(201, replaced.status_code)
+        self.assertListEqual([1], replaced.json)
+
+    def test_eq__binary(self) -> None:
+        response = ResponseData.from_content(content=b'\xff', headers={}, status_code=200)
+        other = ResponseData.from_content(content=b'\xfe', headers={}, status_code=200)
+        # Both decode to the replacement character, but the raw bodies differ
+        self.assertEqual(response.text, other.text)
+        self.assertNotEqual(response, other)
+        self.assertEqual(ResponseData(text='a', headers={}, status_code=200), ResponseData.from_content(
+            content=b'a', headers={}, status_code=200))
+
+    def test_pickle(self) -> None:
+        response = ResponseData(text='null', headers={}, status_code=200)
+        self.assertIsNone(response.json)
+
+        copied = pickle.loads(pickle.dumps(response))
+        self.assertIsNone(copied.json)
+        copied.text = '[1]'
+        self.assertListEqual([1], copied.json)
+
+    def test_from_content(self) -> None:
+        response = ResponseData.from_content(content=b'{"a": "\xc3\xa9"}', headers={}, status_code=200)
+        # UTF-8 JSON is parsed straight from the bytes, and the text is only decoded if it's used
+        self.assertDictEqual({'a': '\u00e9'}, response.json)
+        self.assertRaises(AttributeError, object.__getattribute__, response, '_text')
+        self.assertEqual(11, response.size)
+        self.assertEqual('{"a": "\u00e9"}', response.text)
+
+        response = ResponseData.from_content(
+            content=b'caf\xe9', headers={'content-type': 'text/plain; charset=latin-1'}, status_code=200)
+        self.assertEqual('caf\u00e9', response.text)
+        self.assertEqual(b'caf\xe9', response.content)
+
+        response.text = 'caf\u00e9'
+        self.assertEqual(b'caf\xc3\xa9', response.content)
+
+    def test_from_content__binary(self) -> None:
+        content = bytes(range(256))
+        response = ResponseData.from_content(content=content, headers={}, status_code=200)
+        self.assertEqual(content, response.content)
+
+        copied = pickle.loads(pickle.dumps(response))
+        self.assertEqual(content, copied.content)
+        self.assertIn('\ufffd', copied.text)
+        self.assertEqual(response, copied)
@@ -0,0 +1,376 @@
+import os
+import json
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from typing import Any, Dict, List, Tuple, Union
+
+from rest_api_tester.client.base_client import BaseTestClient
+from rest_api_tester.client.response_data import ResponseData
+from rest_api_tester.parser.base_parser import BaseParser, apply_modifiers
+from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.runner import RunSpec, TestCaseRunner
+from rest_api_tester.test import TestCase, TestData, TestResult
+from rest_api_tester.timing import PHASE_MODIFY, PHASE_PARSE, PHASE_REQUEST, PHASE_VERIFY
+from rest_api_tester.utils import JSONModifiers
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+
+class FakeTestClient(BaseTestClient):
+    """
+    Echoes requests back as JSON after an optional delay
+    """
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.max_concurrency = 0
+        self.num_requests = 0
+        self._concurrency = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._respond(method='GET', url=url, data=None, headers=headers)
+
+    def post(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._respond(method='POST', url=url, data=data, headers=headers)
+
+    def put(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._respond(method='PUT', url=url, data=data, headers=headers)
+
+    def patch(
+        self,
+        url: str,
+        data: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._respond(method='PATCH', url=url, data=data, headers=headers)
+
+    def delete(
+        self,
+        url: str,
+        timeout: int,
+        allow_redirects: bool,
+        headers: Union[Dict[str, Any], None] = None,
+        cookies: Union[Dict[str, Any], None] = None
+    ) -> ResponseData:
+        return self._respond(method='DELETE', url=url, data=None, headers=headers)
+
+    def _respond(
+        self,
+        method: str,
+        url: str,
+        data: Union[str, None],
+        headers: Union[Dict[str, Any], None]
+    ) -> ResponseData:
+        with self._lock:
+            self.num_requests += 1
+            self._concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self._concurrency)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self._concurrency -= 1
+
+        return ResponseData(
+            text=json.dumps({'method': method, 'url': url, 'data': data, 'headers': headers}),
+            headers={'content-type': 'application/json'},
+            status_code=200
+        )
+
+
+class TestTestCaseRunner(unittest.TestCase):
+
+    def test_run(self) -> None:
+        runner = TestCaseRunner(
+            client=FakeTestClient(),
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            default_content_type='application/json'
+        )
+        result = runner.run(
+            path_to_test_cases='test_fastapi.json',
+            test_name='test_delete_item__200',
+            url_params={'item_id': 1}
+        )
+        self.assertEqual('test_delete_item__200', result.test_data.name)
+        self.assertDictEqual({
+            'method': 'DELETE',
+            'url': '/items/1',
+            'data': None,
+            'headers': {'content-type': 'application/json'}
+        }, result.response.json)
+
+    def test_run_many(self) -> None:
+        client = FakeTestClient(delay=0.05)
+        runner = TestCaseRunner(client=client, path_to_scenarios_dir=SCENARIOS_DIR)
+        specs = [
+            RunSpec(
+                path_to_test_cases='test_fastapi.json',
+                test_name='test_delete_item__200',
+                url_params={'item_id': i}
+            )
+            for i in range(10)
+        ]
+
+        start = time.perf_counter()
+        results = runner.run_many(specs=specs, max_workers=10)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.4)
+        self.assertGreater(client.max_concurrency, 1)
+        for i, result in enumerate(results):
+            assert isinstance(result, TestResult)
+            self.assertEqual(f'/items/{i}', result.response.json['url'])
+
+    def test_run_many__exceptions(self) -> None:
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+        results = runner.run_many(specs=[
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='test_get_status__200'),
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='does_not_exist'),
+            RunSpec(path_to_test_cases='test_fastapi.json', test_name='test_get_item__404')
+        ])
+        self.assertIsInstance(results[0], TestResult)
+        self.assertIsInstance(results[1], KeyError)
+        self.assertIsInstance(results[2], TestResult)
+
+    def test_run_spec(self) -> None:
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+        result = runner.run_spec(spec=RunSpec(
+            path_to_test_cases='test_fastapi.json', test_name='test_delete_item__200', url_params={'item_id': 3}))
+        self.assertEqual('/items/3', result.response.json['url'])
+        with self.assertRaises(KeyError):
+            runner.run_spec(spec=RunSpec(path_to_test_cases='test_fastapi.json', test_name='does_not_exist'))
+
+    def test_run__timings(self) -> None:
+        recorded: List[Tuple[str, str, float]] = []
+
+        def timing_hook(test_data: TestData, phase: str, seconds: float) -> None:
+            recorded.append((test_data.name, phase, seconds))
+
+        runner = TestCaseRunner(
+            client=FakeTestClient(delay=0.01),
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            timing_hook=timing_hook
+        )
+        result = runner.run(path_to_test_cases='test_fastapi.json', test_name='test_get_status__200')
+
+        self.assertListEqual([PHASE_PARSE, PHASE_MODIFY, PHASE_REQUEST], list(result.timings))
+        self.assertGreaterEqual(result.timings[PHASE_REQUEST], 0.01)
+        self.assertListEqual(
+            [('test_get_status__200', phase, seconds) for phase, seconds in result.timings.items()],
+            recorded
+        )
+
+        test_case = TestCase()
+        test_case.timing_hook = timing_hook
+        test_case.verify_test_result(result=result, verifier=lambda result: None)
+        self.assertIn(PHASE_VERIFY, result.timings)
+        self.assertEqual(('test_get_status__200', PHASE_VERIFY, result.timings[PHASE_VERIFY]), recorded[-1])
+
+    def test_run__modifier_timings(self) -> None:
+        modifiers: Dict[str, Any] = {
+            'request_json_modifiers': {'name': 'item2'},
+            'response_json_modifiers': {'name': 'item2'},
+            'request_header_modifiers': {'X-Test': 'test'},
+            'response_header_modifiers': {'x-test': 'test'}
+        }
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+
+        def slow_apply_modifiers(**kwargs: Any) -> None:
+            time.sleep(0.02)
+            apply_modifiers(**kwargs)
+
+        # The parser applies the modifiers, but their cost is timed under "modify"
+        with mock.patch('rest_api_tester.parser.json_parser.apply_modifiers', side_effect=slow_apply_modifiers):
+            result = runner.run(path_to_test_cases='test_fastapi.json', test_name='test_create_item__200', **modifiers)
+        self.assertGreaterEqual(result.timings[PHASE_MODIFY], 0.02)
+        self.assertLess(result.timings[PHASE_PARSE], 0.02)
+
+        expected = JSONParser.parse(
+            path_to_scenarios_dir=SCENARIOS_DIR, path_to_test_cases='test_fastapi.json',
+            test_name='test_create_item__200', **modifiers)
+        self.assertEqual({'name': 'item2'}, result.test_data.request_data_json)
+        self.assertEqual(expected.request_data, result.test_data.request_data)
+        self.assertEqual(expected.expected_response, result.test_data.expected_response)
+        self.assertEqual(expected.expected_headers, result.test_data.expected_headers)
+        self.assertEqual('test', result.test_data.headers['x-test'])
+
+    def test_verify_test_result__excluded_paths_copy(self) -> None:
+        test_data = TestData(
+            name='test', url='/items', method='GET', allow_redirects=True, headers={}, cookies={},
+            request_data=None, expected_status=200, expected_response='{"id": 1, "url": "/a"}',
+            expected_headers=None, description=None, file_path='test.json'
+        )
+        response = ResponseData(
+            text='{"id": 1, "url": "/b"}', headers={'content-type': 'application/json'}, status_code=200)
+        result = TestResult(response=response, test_data=test_data, timings={})
+        actual_json = result.response.json
+        expected_json = result.test_data.expected_response_json
+
+        TestCase().verify_test_result(result=result, excluded_response_paths=['url'])
+
+        # JSON that was already handed out isn't modified
+        self.assertEqual('/b', actual_json['url'])
+        self.assertEqual('/a', expected_json['url'])
+        self.assertEqual(result.test_data.expected_response_json['url'], result.response.json['url'])
+
+    def test_run__custom_parser(self) -> None:
+        received: Dict[str, Any] = {}
+
+        class XMLParser(BaseParser):
+
+            @staticmethod
+            def parse(
+                path_to_scenarios_dir: str,
+                path_to_test_cases: str,
+                test_name: str,
+                request_json_modifiers: Union[JSONModifiers, None],
+                response_json_modifiers: Union[JSONModifiers, None],
+                request_header_modifiers: Union[JSONModifiers, None],
+                response_header_modifiers: Union[JSONModifiers, None]
+            ) -> TestData:
+                received['request_json_modifiers'] = request_json_modifiers
+                name = (request_json_modifiers or {}).get('name', 'item')
+                return TestData(
+                    name=test_name,
+                    url='/items',
+                    method='POST',
+                    allow_redirects=True,
+                    headers={'content-type': 'application/xml'},
+                    cookies={},
+                    request_data=f'<item><name>{name}</name></item>',
+                    expected_status=200,
+                    expected_response='<ok/>',
+                    expected_headers=None,
+                    description=None,
+                    file_path=path_to_test_cases
+                )
+
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+        result = runner.run(
+            path_to_test_cases='items.xml',
+            test_name='test_create_item__200',
+            file_parser=XMLParser,
+            request_json_modifiers={'name': 'item2'},
+            response_json_modifiers={'name': 'item2'}
+        )
+
+        self.assertDictEqual({'name': 'item2'}, received['request_json_modifiers'])
+        self.assertEqual('<item><name>item2</name></item>', result.test_data.request_data)
+        self.assertEqual('<ok/>', result.test_data.expected_response)
+        self.assertEqual('<item><name>item2</name></item>', result.response.json['data'])
+        self.assertIn(PHASE_PARSE, result.timings)
+
+    def test_verify_test_result__message(self) -> None:
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=SCENARIOS_DIR)
+        result = runner.run(path_to_test_cases='test_fastapi.json', test_name='test_get_status__200')
+
+        # The failure message is only built if verification fails
+        with mock.patch.object(TestCase, '_format_response', side_effect=AssertionError) as format_response:
+            TestCase().verify_test_result(result=result, verifier=lambda result: None)
+            self.assertEqual(0, format_response.call_count)
+
+        result.response.status_code = 500
+        with self.assertRaises(AssertionError) as cm:
+            TestCase().verify_test_result(result=result, verifier=lambda result: None)
+        message = str(cm.exception)
+        self.assertIn('200 != 500', message)
+        self.assertIn('Expected Response:', message)
+        self.assertIn("'method': 'GET'", message)
+
+
+class TestBudgets(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        response: Dict[str, Any] = {'method': 'GET', 'url': '/items', 'data': None, 'headers': {}}
+        with open(os.path.join(self.temp_dir.name, 'test.json'), 'w+') as f:
+            f.write(json.dumps({
+                'test_no_budget': {'url': '/items', 'method': 'GET', 'status': 200, 'response': response},
+                'test_budget': {
+                    'url': '/items',
+                    'method': 'GET',
+                    'status': 200,
+                    'response': response,
+                    'max_latency_ms': 50,
+                    'max_response_bytes': 100
+                },
+                'test_tight_budget': {
+                    'url': '/items',
+                    'method': 'GET',
+                    'status': 200,
+                    'response': response,
+                    'description': 'Tight budget',
+                    'max_latency_ms': 0.001,
+                    'max_response_bytes': 10
+                }
+            }))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_run__latency_samples(self) -> None:
+        client = FakeTestClient()
+        runner = TestCaseRunner(
+            client=client,
+            path_to_scenarios_dir=self.temp_dir.name,
+            latency_warmups=2,
+            latency_samples=3
+        )
+
+        result = runner.run(path_to_test_cases='test.json', test_name='test_budget')
+        self.assertEqual(50, result.test_data.max_latency_ms)
+        self.assertEqual(100, result.test_data.max_response_bytes)
+        self.assertEqual(5, client.num_requests)
+
+        # Requests are not repeated without a latency budget
+        runner.run(path_to_test_cases='test.json', test_name='test_no_budget')
+        self.assertEqual(6, client.num_requests)
+
+    def test_verify_test_result__within_budget(self) -> None:
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=self.temp_dir.name)
+        result = runner.run(path_to_test_cases='test.json', test_name='test_budget')
+        TestCase().verify_test_result(result=result)
+
+    def test_verify_test_result__budget_exceeded(self) -> None:
+        runner = TestCaseRunner(client=FakeTestClient(), path_to_scenarios_dir=self.temp_dir.name)
+        result = runner.run(path_to_test_cases='test.json', test_name='test_tight_budget')
+        result.timings['request'] = 0.0123
+        response_bytes = result.response.size
+
+        with self.assertRaises(AssertionError) as cm:
+            TestCase().verify_test_result(result=result, excluded_response_paths=['headers'])
+
+        message = str(cm.exception)
+        self.assertIn('Test Description: Tight budget', message)
+        self.assertIn('Latency of 12.3 ms exceeds the budget of 0.001 ms', message)
+        self.assertIn(f'Response size of {response_bytes} bytes exceeds the budget of 10 bytes', message)
@@ -0,0 +1,102 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+from typing import Any
+
+from rest_api_tester.parser.scenario_cache import ScenarioFileCache
+
+
+class TestScenarioFileCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'test.json')
+        self._write(self.file_path, {
+            'test_a': {'url': '/a', 'method': 'GET', 'status': 200, 'response': {'items': [1, 2]}},
+            'test_b': {'url': '/b', 'method': 'GET', 'status': 404}
+        })
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_get_test_case(self) -> None:
+        cache = ScenarioFileCache()
+        test_case = cache.get_test_case(file_path=self.file_path, test_name='test_b')
+        self.assertDictEqual({'url': '/b', 'method': 'GET', 'status': 404}, test_case)
+        self.assertIn(self.file_path, cache)
+
+    def test_get_test_case__missing(self) -> None:
+        cache = ScenarioFileCache()
+        with self.assertRaises(KeyError):
+            cache.get_test_case(file_path=self.file_path, test_name='test_c')
+
+    def test_get_test_case__returns_copies(self) -> None:
+        cache = ScenarioFileCache()
+        test_case = cache.get_test_case(file_path=self.file_path, test_name='test_a')
+        test_case['response']['items'].append(3)
+        test_case['url'] = '/changed'
+
+        test_case = cache.get_test_case(file_path=self.file_path, test_name='test_a')
+        self.assertEqual('/a', test_case['url'])
+        self.assertListEqual([1, 2], test_case['response']['items'])
+
+    def test_get_test_case__reloads_modified_file(self) -> None:
+        cache = ScenarioFileCache()
+        cache.get_test_case(file_path=self.file_path, test_name='test_a')
+
+        self._write(self.file_path, {
+            'test_a': {'url': '/a/changed', 'method': 'GET', 'status': 200}
+        })
+        test_case = cache.get_test_case(file_path=self.file_path, test_name='test_a')
+        self.assertEqual('/a/changed', test_case['url'])
+        self.assertEqual(1, len(cache))
+
+    def test_iter_test_cases(self) -> None:
+        cache = ScenarioFileCache()
+        with mock.patch.object(ScenarioFileCache, '_copy', wraps=ScenarioFileCache._copy) as copy:
+            test_name, test_case = next(cache.iter_test_cases(file_path=self.file_path))
+            # Only the test cases that are reached are copied
+            self.assertEqual(1, copy.call_count)
+        self.assertEqual('test_a', test_name)
+        test_case['response']['items'].append(3)
+        test_cases = dict(cache.iter_test_cases(file_path=self.file_path))
+        self.assertListEqual(['test_a', 'test_b'], list(test_cases))
+        self.assertListEqual([1, 2], test_cases['test_a']['response']['items'])
+
+        list_file_path = os.path.join(self.temp_dir.name, 'list.json')
+        self._write(list_file_path, [1, 2])
+        with self.assertRaises(ValueError):
+            list(cache.iter_test_cases(file_path=list_file_path))
+
+    def test_invalidate(self) -> None:
+        cache = ScenarioFileCache()
+        list(cache.iter_test_cases(file_path=self.file_path))
+        cache.invalidate(file_path=self.file_path)
+        self.assertNotIn(self.file_path, cache)
+
+        list(cache.iter_test_cases(file_path=self.file_path))
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+
+    def test_lru_eviction__max_entries(self) -> None:
+        other_file_path = os.path.join(self.temp_dir.name, 'other.json')
+        self._write(other_file_path, {'test_c': {'url': '/c', 'method': 'GET', 'status': 200}})
+
+        cache = ScenarioFileCache(max_entries=1)
+        list(cache.iter_test_cases(file_path=self.file_path))
+        list(cache.iter_test_cases(file_path=other_file_path))
+        self.assertNotIn(self.file_path, cache)
+        self.assertIn(other_file_path, cache)
+
+    def test_lru_eviction__max_bytes(self) -> None:
+        cache = ScenarioFileCache(max_bytes=os.path.getsize(self.file_path) - 1)
+        test_case = cache.get_test_case(file_path=self.file_path, test_name='test_b')
+        self.assertEqual('/b', test_case['url'])
+        self.assertEqual(0, len(cache))
+
+    @staticmethod
+    def _write(file_path: str, scenarios: Any) -> None:
+        with open(file_path, 'w+') as f:
+            f.write(json.dumps(scenarios, indent=4) + '\n')
@@ -0,0 +1,52 @@
+import unittest
+import dataclasses
+from typing import List, Union
+
+from rest_api_tester.slots import add_slots
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_add_slots(self) -> None:
+        @add_slots('_cache')
+        @dataclasses.dataclass
+        class Data:
+
+            a: int
+            b: List[int] = dataclasses.field(default_factory=list)
+            c: Union[str, None] = None
+
+        data = Data(a=1)
+        self.assertEqual(Data(a=1, b=[], c=None), data)
+        self.assertFalse(hasattr(data, '__dict__'))
+        self.assertTupleEqual(('a', 'b', 'c', '_cache'), Data.__slots__)  # type: ignore[attr-defined]
+        self.assertEqual('TestSlots.test_add_slots.<locals>.Data', Data.__qualname__)
+
+        data._cache = 1  # type: ignore[attr-defined]
+        with self.assertRaises(AttributeError):
+            data.d = 1  # type: ignore[attr-defined]
+
+    def test_add_slots__property(self) -> None:
+        class Base:
+
+            __slots__ = ('_a',)
+
+            @property
+            def a(self) -> int:
+                return self._a * 2
+
+            @a.setter
+            def a(self, value: int) -> None:
+                self._a = value
+
+        @add_slots()
+        @dataclasses.dataclass
+        class Data(Base):
+
+            a: int = dataclasses.field()
+            b: int
+
+        data = Data(a=1, b=2)
+        self.assertTupleEqual(('b',), Data.__slots__)
+        self.assertEqual(2, data.a)
+        self.assertEqual(Data(a=1, b=2), data)
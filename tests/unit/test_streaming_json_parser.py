@@ -0,0 +1,96 @@
+import io
+import os
+import json
+import unittest
+
+from rest_api_tester.parser.json_parser import JSONParser
+from rest_api_tester.parser.streaming_json_parser import StreamingJSONParser, _JSONObjectScanner
+
+SCENARIOS_DIR = os.path.join(os.path.dirname(__file__), '..', 'api', 'fastapi', '__scenarios__')
+
+
+class SmallChunkStreamingJSONParser(StreamingJSONParser):
+
+    chunk_size = 7
+
+
+class TestStreamingJSONParser(unittest.TestCase):
+
+    def test_parse__matches_json_parser(self) -> None:
+        with open(os.path.join(SCENARIOS_DIR, 'test_fastapi.json'), 'r') as f:
+            test_names = list(json.loads(f.read()).keys())
+
+        for parser in (StreamingJSONParser, SmallChunkStreamingJSONParser):
+            for test_name in test_names:
+                expected = JSONParser.parse(
+                    path_to_scenarios_dir=SCENARIOS_DIR,
+                    path_to_test_cases='test_fastapi.json',
+                    test_name=test_name,
+                    request_json_modifiers=None,
+                    response_json_modifiers=None,
+                    request_header_modifiers=None,
+                    response_header_modifiers=None
+                )
+                actual = parser.parse(
+                    path_to_scenarios_dir=SCENARIOS_DIR,
+                    path_to_test_cases='test_fastapi.json',
+                    test_name=test_name,
+                    request_json_modifiers=None,
+                    response_json_modifiers=None,
+                    request_header_modifiers=None,
+                    response_header_modifiers=None
+                )
+                self.assertEqual(expected, actual)
+
+    def test_iter_test_data__matches_json_parser(self) -> None:
+        expected = list(JSONParser.iter_test_data(
+            path_to_scenarios_dir=SCENARIOS_DIR,
+            path_to_test_cases='test_fastapi.json'
+        ))
+        for parser in (StreamingJSONParser, SmallChunkStreamingJSONParser):
+            actual = list(parser.iter_test_data(
+                path_to_scenarios_dir=SCENARIOS_DIR,
+                path_to_test_cases='test_fastapi.json'
+            ))
+            self.assertListEqual(expected, actual)
+
+    def test_parse__missing_test(self) -> None:
+        with self.assertRaises(KeyError):
+            StreamingJSONParser.parse(
+                path_to_scenarios_dir=SCENARIOS_DIR,
+                path_to_test_cases='test_fastapi.json',
+                test_name='does_not_exist',
+                request_json_modifiers=None,
+                response_json_modifiers=None,
+                request_header_modifiers=None,
+                response_header_modifiers=None
+            )
+
+    def test_scanner__skips_unwanted_values(self) -> None:
+        scenarios = {
+            'a': {'response': {'items': [{'name': 'x}]"\\' * 100}] * 10}},
+            'b': 'a "quoted" \\ string',
+            'c': [1, 2.5, True, None, {'d': [[], {}]}],
+            'd': -1.5e3
+        }
+        text = json.dumps(scenarios, indent=4)
+        for chunk_size in (1, 3, 64, 1024 * 1024):
+            scanner = _JSONObjectScanner(f=io.StringIO(text), chunk_size=chunk_size)
+            actual = {
+                key: json.loads(value)
+                for key, value in scanner.iter_items(is_wanted=lambda key: key != 'a')
+            }
+            self.assertDictEqual({key: scenarios[key] for key in ('b', 'c', 'd')}, actual)
+
+    def test_scanner__buffer_stays_small_when_skipping(self) -> None:
+        text = json.dumps({'a': {'response': ['x' * 1000] * 1000}, 'b': {'url': '/b'}})
+        scanner = _JSONObjectScanner(f=io.StringIO(text), chunk_size=1024)
+        actual = list(scanner.iter_items(is_wanted=lambda key: key == 'b'))
+        self.assertListEqual([('b', '{"url": "/b"}')], actual)
+        self.assertLess(len(scanner.buffer), 2 * 1024)
+
+    def test_scanner__invalid_json(self) -> None:
+        for text in ('[]', '{"a": 1', '{"a": {"b": 1}', '{"a" 1}'):
+            scanner = _JSONObjectScanner(f=io.StringIO(text), chunk_size=2)
+            with self.assertRaises(ValueError):
+                list(scanner.iter_items(is_wanted=lambda key: True))
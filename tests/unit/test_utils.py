@@ -446,3 +446,111 @@ class TestUtils(unittest.TestCase):
     def test_json_update__index_with_dict(self) -> None:
         actual = utils.json_update(j={'a': 1}, path='[0]', value=2)
         self.assertDictEqual({'a': 1}, actual)
+
+    def test_compile_path(self) -> None:
+        path = utils.compile_path('a.*b')
+        self.assertIs(path, utils.compile_path(path))
+        self.assertIs(path, utils.compile_path('a.*b'))
+        self.assertEqual(utils.JSONPath('a.*b'), path)
+        self.assertEqual('a.*b', str(path))
+
+    def test_compile_path__invalid(self) -> None:
+        for path in ('', 'a.*b.c', 'a.*', 'a.[b]'):
+            with self.assertRaises(Exception):
+                utils.compile_path(path)
+
+    def test_compiled_path__update(self) -> None:
+        path = utils.compile_path('a.*b')
+        j = {'a': [{'b': 1}, {'c': 2}, 3]}
+        self.assertDictEqual({'a': [{'b': 4}, {'b': 4, 'c': 2}, 3]}, utils.json_update(j=j, path=path, value=4))
+        self.assertDictEqual({'a': [{'b': 5}, {'b': 5, 'c': 2}, 3]}, path.update(j=j, value=5))
+        self.assertDictEqual({'a': [{'b': 1}, {'c': 2}, 3]}, j)
+
+    def test_compiled_path__remove(self) -> None:
+        path = utils.compile_path('a.*[0]')
+        j = {'a': [[1, 2], [], {'b': 1}]}
+        self.assertDictEqual({'a': [[2], [], {'b': 1}]}, utils.json_remove(j=j, path=path))
+        self.assertDictEqual({'a': [[2], [], {'b': 1}]}, path.remove(j=j))
+        self.assertDictEqual({'a': [[1, 2], [], {'b': 1}]}, j)
+
+    def test_json_update__copy_path(self) -> None:
+        j = {'a': {'b': [{'c': 1}, {'d': 2}]}, 'e': {'f': 3}}
+        actual = utils.json_update(j=j, path='a.b.*c', value=4, copy=utils.COPY_PATH)
+        self.assertDictEqual({'a': {'b': [{'c': 4}, {'c': 4, 'd': 2}]}, 'e': {'f': 3}}, actual)
+        self.assertDictEqual({'a': {'b': [{'c': 1}, {'d': 2}]}, 'e': {'f': 3}}, j)
+        self.assertIs(j['e'], actual['e'])
+
+    def test_json_update__copy_path_no_match(self) -> None:
+        j = {'a': {'b': 1}}
+        actual = utils.json_update(j=j, path='c.d', value=2, copy=utils.COPY_PATH)
+        self.assertIs(j, actual)
+
+    def test_json_update__copy_none(self) -> None:
+        j = {'a': {'b': 1}}
+        actual = utils.json_update(j=j, path='a.b', value=2, copy=utils.COPY_NONE)
+        self.assertIs(j, actual)
+        self.assertDictEqual({'a': {'b': 2}}, j)
+
+    def test_json_remove__copy_path(self) -> None:
+        j = [[1, 2], {'a': 1}, [3]]
+        actual = utils.json_remove(j=j, path='*[0]', copy=utils.COPY_PATH)
+        self.assertListEqual([[2], {'a': 1}, []], actual)
+        self.assertListEqual([[1, 2], {'a': 1}, [3]], j)
+        self.assertIs(j[1], actual[1])
+
+    def test_json_remove__copy_none(self) -> None:
+        j = {'a': [1, 2]}
+        actual = utils.json_remove(j=j, path='a.[0]', copy=utils.COPY_NONE)
+        self.assertIs(j, actual)
+        self.assertDictEqual({'a': [2]}, j)
+
+    def test_json_update__invalid_copy(self) -> None:
+        with self.assertRaises(ValueError):
+            utils.json_update(j={}, path='a', value=1, copy='shallow')
+
+    def test_json_update_many(self) -> None:
+        j = {'a': [{'b': 1}, {'b': 2}], 'c': {'d': 1}}
+        actual = utils.json_update_many(j=j, updates={
+            'a.*b': 3,
+            'a.[0].e': 4,
+            'c.d': 5,
+            utils.compile_path('c.f'): 6,
+            'x.y': 7
+        })
+        self.assertDictEqual({'a': [{'b': 3, 'e': 4}, {'b': 3}], 'c': {'d': 5, 'f': 6}}, actual)
+        self.assertDictEqual({'a': [{'b': 1}, {'b': 2}], 'c': {'d': 1}}, j)
+
+    def test_json_update_many__overlapping_paths(self) -> None:
+        value = {'b': 1}
+        actual = utils.json_update_many(j={'a': {'b': 0, 'c': 0}}, updates={
+            'a.c': 1,
+            'a': value,
+            'a.d': 2
+        })
+        self.assertDictEqual({'a': {'b': 1, 'd': 2}}, actual)
+        self.assertDictEqual({'b': 1}, value)
+
+    def test_json_update_many__star_then_index(self) -> None:
+        actual = utils.json_update_many(j=[{'a': 1}, {'a': 2}], updates={
+            '[0].a': 3,
+            '*a': 4,
+            '[1].a': 5
+        })
+        self.assertListEqual([{'a': 4}, {'a': 5}], actual)
+
+    def test_json_update_many__copy_path(self) -> None:
+        j = {'a': {'b': 1}, 'c': {'d': 1}}
+        actual = utils.json_update_many(j=j, updates={'a.b': 2}, copy=utils.COPY_PATH)
+        self.assertDictEqual({'a': {'b': 2}, 'c': {'d': 1}}, actual)
+        self.assertDictEqual({'a': {'b': 1}, 'c': {'d': 1}}, j)
+        self.assertIs(j['c'], actual['c'])
+
+    def test_json_remove_many(self) -> None:
+        j = {'a': [1, 2, 3], 'b': {'c': 1, 'd': 2}}
+        actual = utils.json_remove_many(j=j, paths=['a.[0]', 'a.[0]', 'b.c', 'b.x'])
+        self.assertDictEqual({'a': [3], 'b': {'d': 2}}, actual)
+        self.assertDictEqual({'a': [1, 2, 3], 'b': {'c': 1, 'd': 2}}, j)
+
+    def test_json_remove_many__index_shift(self) -> None:
+        actual = utils.json_remove_many(j=[[1, 2], [3, 4], [5]], paths=['[0].[0]', '[2]', '[0]'])
+        self.assertListEqual([[3, 4]], actual)
@@ -0,0 +1,120 @@
+import json
+import unittest
+from typing import Any, Dict, Iterable, Iterator
+from wsgiref.validate import validator
+
+from rest_api_tester.client.wsgi_client import WSGIStartResponse, WSGITestClient
+
+
+def app(environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+    path = environ['PATH_INFO']
+    if path == '/redirect':
+        start_response('302 Found', [('Content-Type', 'text/plain'), ('Location', '/echo?from=redirect')])
+        return []
+    if path == '/error':
+        raise ValueError('Server error')
+    if path == '/cookies':
+        start_response('200 OK', [
+            ('Content-Type', 'text/plain'),
+            ('Set-Cookie', 'a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT'),
+            ('Set-Cookie', 'b=2'),
+            ('Vary', 'Accept'),
+            ('Vary', 'Cookie')
+        ])
+        return []
+    if path == '/stream':
+        start_response('200 OK', [('Content-Type', 'text/plain; charset=latin-1')])
+        return iter([b'caf', 'é'.encode('latin-1')])
+
+    content_length = int(environ.get('CONTENT_LENGTH') or 0)
+    content = json.dumps({
+        'method': environ['REQUEST_METHOD'],
+        'path': path,
+        'query_string': environ['QUERY_STRING'],
+        'host': environ['HTTP_HOST'],
+        'content_type': environ.get('CONTENT_TYPE'),
+        'token': environ.get('HTTP_X_TOKEN'),
+        'cookie': environ.get('HTTP_COOKIE'),
+        'body': environ['wsgi.input'].read(content_length).decode()
+    }).encode()
+    start_response('200 OK', [('Content-Type', 'application/json'), ('X-Test', 'test')])
+    return [content]
+
+
+class ClosingIterable:
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'OK'
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestWSGITestClient(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = WSGITestClient(app=validator(app))
+
+    def test_request(self) -> None:
+        response = self.client.post(
+            url='/echo?a=1',
+            data='{"name": "item"}',
+            timeout=10,
+            allow_redirects=False,
+            headers={'Content-Type': 'application/json', 'X-Token': 't0k3n'},
+            cookies={'a': '1', 'b': '2'}
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertDictEqual({'content-type': 'application/json', 'x-test': 'test'}, response.headers)
+        self.assertDictEqual({
+            'method': 'POST',
+            'path': '/echo',
+            'query_string': 'a=1',
+            'host': 'testserver',
+            'content_type': 'application/json',
+            'token': 't0k3n',
+            'cookie': 'a=1; b=2',
+            'body': '{"name": "item"}'
+        }, response.json)
+
+    def test_redirects(self) -> None:
+        response = self.client.post(url='/redirect', data='{}', timeout=10, allow_redirects=False)
+        self.assertEqual(302, response.status_code)
+        self.assertEqual('/echo?from=redirect', response.headers['location'])
+
+        response = self.client.post(
+            url='/redirect', data='{}', timeout=10, allow_redirects=True, headers={'Content-Type': 'application/json'})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('GET', response.json['method'])
+        self.assertEqual('from=redirect', response.json['query_string'])
+        self.assertIsNone(response.json['content_type'])
+        self.assertEqual('', response.json['body'])
+
+    def test_streamed_response(self) -> None:
+        response = self.client.get(url='/stream', timeout=10, allow_redirects=False)
+        self.assertEqual('café', response.text)
+
+    def test_repeated_headers(self) -> None:
+        response = self.client.get(url='/cookies', timeout=10, allow_redirects=False)
+        self.assertListEqual(
+            ['a=1; Expires=Wed, 21 Oct 2026 07:28:00 GMT', 'b=2'], response.headers['set-cookie'])
+        self.assertEqual('Accept, Cookie', response.headers['vary'])
+
+    def test_app_exception(self) -> None:
+        with self.assertRaises(ValueError):
+            self.client.get(url='/error', timeout=10, allow_redirects=False)
+
+    def test_closes_iterable(self) -> None:
+        iterable = ClosingIterable()
+
+        def closing_app(environ: Dict[str, Any], start_response: WSGIStartResponse) -> Iterable[bytes]:
+            start_response('200 OK', [('Content-Type', 'text/plain')])
+            return iterable
+
+        response = WSGITestClient(app=closing_app).get(url='/', timeout=10, allow_redirects=False)
+        self.assertEqual('OK', response.text)
+        self.assertTrue(iterable.closed)